@@ -1,10 +1,13 @@
-from typing import Optional
+from typing import Iterable, Optional
 
 from vedicastro.VedicAstro import VedicHoroscopeData
 
 from ascendant.chart import Chart
 from ascendant.dasha import Dasha
-from ascendant.types import ALLOWED_DIVISIONS
+from ascendant.executor import run
+from ascendant.ingress import nakshatra_ingresses
+from ascendant.const import PLANETS_LIST
+from ascendant.types import ALLOWED_DIVISIONS, PLANETS, DateLike
 from ascendant.utils import getHouseSystem
 from ascendant.yoga.base import Yoga
 
@@ -45,6 +48,11 @@ class Ascendant:
         self.yoga_module = Yoga(self.horoscope_data)
         self.dasha_module = Dasha(self.horoscope_data)
 
+    @classmethod
+    async def acreate(cls, *args, **kwargs) -> "Ascendant":
+        """Create an Ascendant in the executor pool, without blocking the event loop."""
+        return await run(cls, *args, **kwargs)
+
     def get_chart(self, division: ALLOWED_DIVISIONS):
         """Get the divisional chart."""
         return self.chart_module.get_varga_chakra_chart(division)
@@ -53,11 +61,33 @@ class Ascendant:
         """Compute all yogas."""
         return self.yoga_module.compute_all()
 
+    async def aget_yogas(self):
+        """Compute all yogas in the executor pool."""
+        return await run(self.get_yogas)
+
     def get_dasha_timeline(self):
         """Get Dasha timeline."""
         return self.dasha_module.get_dasha_timeline()
 
-    def get_current_dasha(self, date: Optional[str] = None):
+    async def aget_dasha_timeline(self):
+        """Get Dasha timeline, computed in the executor pool."""
+        return await run(self.get_dasha_timeline)
+
+    def get_dasha_system(self, system: str, horizon: float = 120):
+        """Get the timeline of any registered dasha system (e.g. "yogini")."""
+        return self.dasha_module.get_system_timeline(system, horizon)
+
+    def get_dasha_at(self, dates: Iterable[DateLike], depth: int = 2):
+        """Get the dasha lords active at each of the given dates."""
+        return self.dasha_module.at(dates, depth)
+
+    def get_nakshatra_ingresses(
+        self, start: DateLike, end: DateLike, planets: Iterable[PLANETS] = PLANETS_LIST
+    ):
+        """Get the nakshatra/pada ingresses of the grahas between two dates."""
+        return nakshatra_ingresses(start, end, planets, self.horoscope_data.ayanamsa)
+
+    def get_current_dasha(self, date: Optional[DateLike] = None):
         """Get current Mahadasha and Antardasha."""
         # This is a helper accessing the internal dasha logic if needed
         # Since logic is in get_antardasha_by_index(0), we can expose similar functionality
@@ -44,6 +44,35 @@ PLANETS_LIST: List[PLANETS] = [
 
 NODE_MAP: dict[str, PLANETS] = {"North Node": "Rahu", "South Node": "Ketu"}
 
+# Vimshottari dasha order and period lengths (in years), summing to 120
+VIMSHOTTARI_LORDS: Final[tuple[PLANETS, ...]] = (
+    "Ketu",
+    "Venus",
+    "Sun",
+    "Moon",
+    "Mars",
+    "Rahu",
+    "Jupiter",
+    "Saturn",
+    "Mercury",
+)
+
+VIMSHOTTARI_YEARS: Final[tuple[int, ...]] = (7, 20, 6, 10, 7, 18, 16, 19, 17)
+
+# Arc of one nakshatra in degrees
+NAKSHATRA_SPAN: Final[float] = 360 / 27
+
+# Days per dasha year used by the arithmetic dasha engines (Julian year)
+DASHA_YEAR_DAYS: Final[float] = 365.25
+
+DASHA_LEVELS: Final[tuple[str, ...]] = (
+    "mahadasha",
+    "antardasha",
+    "pratyantardasha",
+    "sookshmadasha",
+    "pranadasha",
+)
+
 BENEFIC_PLANETS: Final[tuple[PLANETS, ...]] = ("Mercury", "Jupiter", "Venus")
 
 MALEFIC_PLANETS: Final[tuple[PLANETS, ...]] = ("Mars", "Saturn", "Rahu", "Ketu")
@@ -111,3 +140,6 @@ BENEFIC_SIGNS = [
     "Sagittarius",
     "Pisces",
 ]
+
+# Default worker count and cap on in-flight computations of the async API
+ASYNC_MAX_WORKERS: Final[int] = 4
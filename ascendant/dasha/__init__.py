@@ -1,10 +1,45 @@
-from datetime import datetime, timezone
-from typing import List, Union
+import heapq
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from vedicastro.VedicAstro import VedicHoroscopeData
 
-from ascendant.types import AntarDashaType, DashasType, MahaDashaType
-from ascendant.utils import parseDate
+from ascendant.const import DASHA_LEVELS, VIMSHOTTARI_LORDS, VIMSHOTTARI_YEARS
+from ascendant.types import (
+    PLANETS,
+    AntarDashaType,
+    DashasType,
+    DateLike,
+    DashaTransitionType,
+    MahaDashaType,
+)
+from ascendant.dasha import systems  # noqa: F401
+from ascendant.dasha.engine import (
+    DASHA_SYSTEMS,
+    DashaPeriod,
+    DashaSystem,
+    DashaTimeline,
+    register_dasha_system,
+)
+from ascendant.dasha.storage import DashaArray
+from ascendant.dasha.vectorized import vimshottari_lords
+from ascendant.utils import jdToDate, toJD
+
+__all__ = [
+    "Dasha",
+    "DashaArray",
+    "DASHA_SYSTEMS",
+    "DashaPeriod",
+    "DashaSystem",
+    "DashaTimeline",
+    "register_dasha_system",
+    "vimshottari_lords",
+]
+
+DashaLords = Tuple[PLANETS, ...]
+
+BoundaryIndex = Tuple[List[float], List[float], List[DashaLords]]
 
 
 class Dasha:
@@ -21,6 +56,7 @@ class Dasha:
         self.__chart__ = horoscope.generate_chart()
 
         self.dasha = self.get_dasha_timeline()
+        self._boundaries: Dict[int, BoundaryIndex] = {}
 
     def get_dasha_timeline(self) -> DashasType:
         """
@@ -69,50 +105,246 @@ class Dasha:
                 )
         return dashas
 
+    def to_array(self) -> DashaArray:
+        """
+        Returns the timeline in the compact numeric storage format.
+
+        Returns:
+            A DashaArray with one row per Antardasha, serializable with `tobytes` or `save`.
+        """
+        return DashaArray.from_dashas(self.dasha)
+
+    def get_system_timeline(
+        self, system: str = "vimshottari", horizon: float = 120
+    ) -> DashaTimeline:
+        """
+        Computes the timeline of any registered dasha system for this horoscope.
+
+        Args:
+            system: Name of a system in `DASHA_SYSTEMS` ("vimshottari", "yogini",
+                    "ashtottari" or "chara"). Defaults to "vimshottari".
+            horizon: Number of years after birth to cover. Defaults to 120.
+
+        Returns:
+            A DashaTimeline whose sub-periods are generated on demand.
+        """
+        return DashaTimeline(system, self.__chart__, horizon)
+
     @staticmethod
-    def _find_current_index_by_date(
-        items, date: datetime, start_key="start", end_key="end"
+    def _subperiods(
+        lord: PLANETS, start: float, end: float
+    ) -> Iterator[Tuple[PLANETS, float, float]]:
+        """Split a period into its nine Vimshottari sub-periods, starting from its own lord."""
+        span = end - start
+        first = VIMSHOTTARI_LORDS.index(lord)
+        for i in range(len(VIMSHOTTARI_LORDS)):
+            idx = (first + i) % len(VIMSHOTTARI_LORDS)
+            sub_end = start + span * (VIMSHOTTARI_YEARS[idx] / 120)
+            yield VIMSHOTTARI_LORDS[idx], start, sub_end
+            start = sub_end
+
+    def _boundary_index(self, depth: int) -> BoundaryIndex:
+        """
+        Returns the flattened timeline at a given depth as (starts, ends, lords) columns.
+
+        Depth 1 holds the Mahadashas and depth 2 the Antardashas as computed by vedicastro.
+        Deeper levels (Pratyantardasha onwards) are derived by proportionally splitting
+        the Antardashas. Boundaries are Julian days, sorted by start and built only
+        once per depth.
+        """
+        if depth in self._boundaries:
+            return self._boundaries[depth]
+
+        starts: List[float] = []
+        ends: List[float] = []
+        lords: List[DashaLords] = []
+
+        def add(
+            parents: DashaLords,
+            lord: PLANETS,
+            start: float,
+            end: float,
+            level: int,
+        ):
+            if level == depth:
+                starts.append(start)
+                ends.append(end)
+                lords.append(parents + (lord,))
+                return
+            for sub_lord, sub_start, sub_end in self._subperiods(lord, start, end):
+                add(parents + (lord,), sub_lord, sub_start, sub_end, level + 1)
+
+        for maha in self.dasha:
+            if depth == 1:
+                add(
+                    (),
+                    maha["mahadasha"],
+                    toJD(maha["start"]),
+                    toJD(maha["end"]),
+                    1,
+                )
+                continue
+            for antar in maha["antardashas"]:
+                add(
+                    (maha["mahadasha"],),
+                    antar["antardasha"],
+                    toJD(antar["start"]),
+                    toJD(antar["end"]),
+                    2,
+                )
+
+        self._boundaries[depth] = (starts, ends, lords)
+        return self._boundaries[depth]
+
+    def at(self, dates: Iterable[DateLike], depth: int = 2) -> List[DashaLords | None]:
+        """
+        Returns the dasha lords active at each of the given dates.
+
+        The dates are converted to Julian days and sorted once, then merged against the
+        flattened timeline in a single pass, so looking up thousands of dates costs
+        about as much as one scan.
+
+        Args:
+            dates: Datetimes, "DD-MM-YYYY"/ISO strings, epoch seconds or `JulianDay`
+                   values, in any order.
+            depth: Number of levels to resolve (1 for Mahadasha, 2 for Antardasha,
+                   3 for Pratyantardasha, up to 5). Defaults to 2.
+
+        Returns:
+            A list aligned with `dates` holding a (mahadasha, antardasha, ...) tuple of lords,
+            or None for dates that fall outside the timeline.
+        """
+        if not 1 <= depth <= len(DASHA_LEVELS):
+            raise ValueError(f"depth must be between 1 and {len(DASHA_LEVELS)}")
+
+        targets = [_targetJD(date) for date in dates]
+        results: List[DashaLords | None] = [None] * len(targets)
+        starts, ends, lords = self._boundary_index(depth)
+
+        order = sorted(
+            (i for i, target in enumerate(targets) if target is not None),
+            key=lambda i: targets[i],
+        )
+        pos = 0
+        for i in order:
+            target = targets[i]
+            # Periods are contiguous, so the first one ending on or after the
+            # target is the only candidate (same rule as the index lookups)
+            while pos < len(ends) and ends[pos] < target:
+                pos += 1
+            if pos == len(ends):
+                break
+            if starts[pos] <= target:
+                results[i] = lords[pos]
+        return results
+
+    def _transition(self, level: int, idx: int) -> DashaTransitionType:
+        starts, _, lords = self._boundary_index(level)
+        return {
+            "date": jdToDate(starts[idx]),
+            "jd": starts[idx],
+            "level": level,
+            "lords": lords[idx],
+            "previous": lords[idx - 1] if idx > 0 else None,
+        }
+
+    def transitions(
+        self,
+        start: DateLike,
+        end: DateLike,
+        depth: int = 3,
+    ) -> Iterator[DashaTransitionType]:
+        """
+        Yields the period changes at every level between two dates, in date order.
+
+        A change of Mahadasha also starts a new Antardasha (and so on), so one event
+        is yielded per level that changes, ordered from the outermost level.
+
+        Args:
+            start: Events strictly after this date are yielded.
+            end: Events on or before this date are yielded.
+            depth: Deepest level to report (1 for Mahadasha, 2 for Antardasha,
+                   3 for Pratyantardasha, up to 5). Defaults to 3.
+
+        Yields:
+            DashaTransitionType events with the new lords and the previous ones.
+        """
+        if not 1 <= depth <= len(DASHA_LEVELS):
+            raise ValueError(f"depth must be between 1 and {len(DASHA_LEVELS)}")
+        if (start_jd := _targetJD(start)) is None or (end_jd := _targetJD(end)) is None:
+            return
+
+        def level_events(level: int):
+            starts = self._boundary_index(level)[0]
+            first = bisect_right(starts, start_jd)
+            last = bisect_right(starts, end_jd)
+            for idx in range(first, last):
+                yield starts[idx], level, idx
+
+        merged = heapq.merge(*(level_events(lvl) for lvl in range(1, depth + 1)))
+        for _, level, idx in merged:
+            yield self._transition(level, idx)
+
+    def next_transition(
+        self, after: DateLike | None = None, level: int = 2
+    ) -> DashaTransitionType | None:
+        """
+        Returns the next period change at a level, found by bisecting the boundary index.
+
+        Args:
+            after: Optional. The change must start strictly after this date.
+                   If None, the current UTC time is used.
+            level: 1 for Mahadasha, 2 for Antardasha, 3 for Pratyantardasha, up to 5.
+                   Defaults to 2.
+
+        Returns:
+            A DashaTransitionType event, or None if the timeline ends before any change.
+        """
+        if not 1 <= level <= len(DASHA_LEVELS):
+            raise ValueError(f"level must be between 1 and {len(DASHA_LEVELS)}")
+
+        starts = self._boundary_index(level)[0]
+        idx = bisect_right(starts, _targetJD(after, default_now=True))
+        if idx == len(starts):
+            return None
+        return self._transition(level, idx)
+
+    def _find_index(
+        self, level: int, target: float, lo: int = 0, hi: int | None = None
     ):
-        """Return index where date lies between start and end."""
-        for idx, item in enumerate(items):
-            start = parseDate(item.get(start_key))
-            end = parseDate(item.get(end_key))
-            if start and end and start <= date <= end:
-                return idx
+        """Return the index in the level's boundary index of the period containing `target`."""
+        starts, ends, _ = self._boundary_index(level)
+        idx = bisect_left(ends, target, lo, len(ends) if hi is None else hi)
+        if idx < (len(ends) if hi is None else hi) and starts[idx] <= target:
+            return idx
         return None
 
     def get_antardasha_by_index(
-        self, n: int, date: Union[str, datetime] | None = None
+        self, n: int, date: DateLike | None = None
     ) -> AntarDashaType | None:
         """
         Returns an Antardasha period relative to the current Antardasha for a given date.
 
         Args:
             n: The relative index from the current Antardasha (0 for current, -1 for previous, 1 for next).
-            date: Optional. A string "DD-MM-YYYY" or a datetime object to determine the current Antardasha.
-                  If None, the current UTC time is used.
+            date: Optional. A datetime, "DD-MM-YYYY"/ISO string, epoch seconds or `JulianDay`
+                  to determine the current Antardasha. If None, the current UTC time is used.
 
         Returns:
             An AntarDashaType object if found, otherwise None.
         """
-        if (maha := self.get_mahadasha_by_index(0, date)) is None:
-            return None
-
-        if (antardashas := maha.get("antardashas", [])) is None:
+        target = _targetJD(date, default_now=True)
+        if (maha_index := self._find_index(1, target)) is None:
             return None
 
-        if date:
-            target_date = parseDate(date)
-        else:
-            target_date = datetime.now(timezone.utc)
-        if target_date is None:
+        antardashas = self.dasha[maha_index].get("antardashas") or []
+        # Rows of the Antardasha index are laid out maha by maha
+        offset = sum(len(maha["antardashas"]) for maha in self.dasha[:maha_index])
+        current = self._find_index(2, target, offset, offset + len(antardashas))
+        if current is None:
             return None
 
-        current_index = self._find_current_index_by_date(antardashas, target_date)
-        if current_index is None:
-            return None
-
-        target_index = current_index + n
+        target_index = current - offset + n
 
         if 0 <= target_index < len(antardashas):
             return antardashas[target_index]
@@ -120,15 +352,15 @@ class Dasha:
         return None
 
     def get_mahadasha_by_index(
-        self, n: int, date: Union[str, datetime] | None = None
+        self, n: int, date: DateLike | None = None
     ) -> MahaDashaType | None:
         """
         Returns a Mahadasha period relative to the current Mahadasha for a given date.
 
         Args:
             n: The relative index from the current Mahadasha (0 for current, -1 for previous, 1 for next).
-            date: Optional. A string "DD-MM-YYYY" or a datetime object to determine the current Mahadasha.
-                  If None, the current UTC time is used.
+            date: Optional. A datetime, "DD-MM-YYYY"/ISO string, epoch seconds or `JulianDay`
+                  to determine the current Mahadasha. If None, the current UTC time is used.
 
         Returns:
             A MahaDashaType object if found, otherwise None.
@@ -136,15 +368,8 @@ class Dasha:
         if not self.dasha:
             return None
 
-        if date:
-            target_date = parseDate(date)
-        else:
-            target_date = datetime.now(timezone.utc)
-        if target_date is None:
-            return None
-
         if (
-            current_index := self._find_current_index_by_date(self.dasha, target_date)
+            current_index := self._find_index(1, _targetJD(date, default_now=True))
         ) is None:
             return None
 
@@ -154,3 +379,10 @@ class Dasha:
             return self.dasha[target]
 
         return None
+
+
+def _targetJD(date: DateLike | None, default_now: bool = False) -> float | None:
+    """Julian day of a lookup date. Missing dates are None, or now if `default_now`."""
+    if date is None or date == "":
+        return toJD(time.time()) if default_now else None
+    return toJD(date)
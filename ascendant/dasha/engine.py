@@ -0,0 +1,217 @@
+import abc
+from bisect import bisect_right
+from typing import Callable, Dict, Iterator, List, Tuple, Type
+
+from flatlib.chart import Chart as FlatlibChart
+
+from ascendant.const import DASHA_YEAR_DAYS
+from ascendant.types import DashaPeriodType
+from ascendant.utils import jdToDate
+
+
+class DashaSystem(abc.ABC):
+    """
+    Definition of a dasha system.
+
+    A system is described by its lord sequence, the period years of each lord and
+    a starting rule. Subclasses implement `start` (and optionally override `years`,
+    `sequence` or `subperiods`) for systems that depend on the birth chart.
+    """
+
+    name: str = ""
+    lords: Tuple[str, ...] = ()
+    period_years: Tuple[float, ...] = ()
+
+    def __init__(self, chart: FlatlibChart):
+        self.chart = chart
+
+    @property
+    def total_years(self) -> float:
+        """Length of one full cycle of the Mahadashas."""
+        return sum(self.years(i) for i in range(len(self.lords)))
+
+    @abc.abstractmethod
+    def start(self) -> Tuple[int, float]:
+        """Returns the index of the first lord and the fraction of its period elapsed at birth."""
+
+    def years(self, lord: int, cycle: int = 0) -> float:
+        """Returns the Mahadasha length of a lord in a given cycle."""
+        return self.period_years[lord]
+
+    def sequence(self, lord: int) -> List[int]:
+        """Returns the order of lords starting from `lord`."""
+        n = len(self.lords)
+        return [(lord + i) % n for i in range(n)]
+
+    def subperiods(self, lord: int) -> List[Tuple[int, float]]:
+        """Returns (lord, fraction) pairs splitting a period of `lord` into sub-periods."""
+        total = self.total_years
+        return [(sub, self.years(sub) / total) for sub in self.sequence(lord)]
+
+
+DASHA_SYSTEMS: Dict[str, Type[DashaSystem]] = {}
+
+
+def register_dasha_system(
+    name: str,
+) -> Callable[[Type[DashaSystem]], Type[DashaSystem]]:
+    def decorator(cls: Type[DashaSystem]) -> Type[DashaSystem]:
+        cls.name = name
+        DASHA_SYSTEMS[name] = cls
+        return cls
+
+    return decorator
+
+
+class DashaPeriod:
+    """A period at any level of a dasha timeline. Sub-periods are generated on first access."""
+
+    __slots__ = ("system", "lords", "start", "end", "_lord", "_subperiods")
+
+    def __init__(
+        self,
+        system: DashaSystem,
+        lords: Tuple[str, ...],
+        lord: int,
+        start: float,
+        end: float,
+    ):
+        self.system = system
+        self.lords = lords
+        self.start = start
+        self.end = end
+        self._lord = lord
+        self._subperiods: List["DashaPeriod"] | None = None
+
+    @property
+    def lord(self) -> str:
+        return self.lords[-1]
+
+    @property
+    def level(self) -> int:
+        return len(self.lords)
+
+    @property
+    def subperiods(self) -> List["DashaPeriod"]:
+        if self._subperiods is None:
+            span = self.end - self.start
+            start = self.start
+            periods = []
+            for lord, fraction in self.system.subperiods(self._lord):
+                end = start + span * fraction
+                periods.append(
+                    DashaPeriod(
+                        self.system,
+                        self.lords + (self.system.lords[lord],),
+                        lord,
+                        start,
+                        end,
+                    )
+                )
+                start = end
+            self._subperiods = periods
+        return self._subperiods
+
+    def to_dict(self, depth: int = 2) -> DashaPeriodType:
+        """Serializes this period, including sub-periods down to `depth` levels."""
+        return {
+            "lord": self.lord,
+            "start": jdToDate(self.start).strftime("%d-%m-%Y"),
+            "end": jdToDate(self.end).strftime("%d-%m-%Y"),
+            "start_jd": self.start,
+            "end_jd": self.end,
+            "subperiods": [period.to_dict(depth) for period in self.subperiods]
+            if self.level < depth
+            else [],
+        }
+
+    def __repr__(self) -> str:
+        return f"<DashaPeriod {'/'.join(self.lords)} {self.start:.2f}-{self.end:.2f}>"
+
+
+class DashaTimeline:
+    """
+    Timeline of a dasha system for a birth chart.
+
+    Mahadashas are computed up front, deeper levels lazily. Lookups bisect the
+    period boundaries level by level.
+
+    Args:
+        system: A registered system name (e.g. "yogini") or a `DashaSystem` subclass.
+        chart: The sidereal flatlib chart of the birth.
+        horizon: Number of years after birth to cover. Defaults to 120.
+    """
+
+    def __init__(
+        self,
+        system: str | Type[DashaSystem],
+        chart: FlatlibChart,
+        horizon: float = 120,
+    ):
+        if isinstance(system, str):
+            if system not in DASHA_SYSTEMS:
+                raise ValueError(f"Unknown dasha system: {system}")
+            system = DASHA_SYSTEMS[system]
+
+        self.system = system(chart)
+        self.birth_jd: float = chart.date.jd
+        self.periods = self._mahadashas(horizon)
+        self._starts = [period.start for period in self.periods]
+
+    def _mahadashas(self, horizon: float) -> List[DashaPeriod]:
+        system = self.system
+        first, elapsed = system.start()
+        order = system.sequence(first)
+        end_jd = self.birth_jd + horizon * DASHA_YEAR_DAYS
+
+        start = self.birth_jd - elapsed * system.years(first) * DASHA_YEAR_DAYS
+        periods: List[DashaPeriod] = []
+        cycle = 0
+        while start < end_jd:
+            count = len(periods)
+            for lord in order:
+                years = system.years(lord, cycle)
+                if years <= 0:
+                    continue
+                end = start + years * DASHA_YEAR_DAYS
+                periods.append(
+                    DashaPeriod(system, (system.lords[lord],), lord, start, end)
+                )
+                start = end
+                if start >= end_jd:
+                    break
+            if len(periods) == count:
+                break
+            cycle += 1
+        return periods
+
+    def iter_periods(self, depth: int = 1) -> Iterator[DashaPeriod]:
+        """Yields every period at a given depth in chronological order."""
+
+        def walk(periods: List[DashaPeriod]) -> Iterator[DashaPeriod]:
+            for period in periods:
+                if period.level == depth:
+                    yield period
+                else:
+                    yield from walk(period.subperiods)
+
+        return walk(self.periods)
+
+    def at(self, jd: float, depth: int = 2) -> DashaPeriod | None:
+        """Returns the period active at a Julian day, resolved down to `depth` levels."""
+        periods = self.periods
+        starts = self._starts
+        period = None
+        for _ in range(depth):
+            if period is not None:
+                periods = period.subperiods
+                starts = [sub.start for sub in periods]
+            idx = bisect_right(starts, jd) - 1
+            if idx < 0 or jd >= periods[idx].end:
+                return None
+            period = periods[idx]
+        return period
+
+    def to_list(self, depth: int = 2) -> List[DashaPeriodType]:
+        """Serializes the timeline down to `depth` levels."""
+        return [period.to_dict(depth) for period in self.periods]
@@ -0,0 +1,182 @@
+import struct
+from os import PathLike
+from typing import List, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ascendant.dasha.engine import DASHA_SYSTEMS, DashaTimeline
+from ascendant.types import AntarDashaType, DashasType, MahaDashaType
+from ascendant.utils import jdToDate, toJD
+
+# Magic and version, count of periods, depth, length of the system name
+_HEADER = struct.Struct("<8sIBB")
+_MAGIC = b"ASCDASH1"
+
+Buffer = Union[bytes, bytearray, memoryview, np.ndarray]
+
+
+class DashaArray:
+    """
+    Compact struct-of-arrays storage for a dasha timeline.
+
+    Each row is a period at the deepest stored level, holding the lord index of
+    every level (uint8) and the start and end boundaries as Julian days (float64).
+    Serialized timelines load without copying: the arrays are views over the buffer.
+
+    Args:
+        lords: uint8 array of shape (n, depth) with indices into the system's lords.
+        start: float64 array of shape (n,) with the start Julian days.
+        end: float64 array of shape (n,) with the end Julian days.
+        system: Name of the dasha system the lord indices refer to.
+    """
+
+    def __init__(
+        self,
+        lords: NDArray[np.uint8],
+        start: NDArray[np.float64],
+        end: NDArray[np.float64],
+        system: str = "vimshottari",
+    ):
+        if system not in DASHA_SYSTEMS:
+            raise ValueError(f"Unknown dasha system: {system}")
+        self.lords = lords
+        self.start = start
+        self.end = end
+        self.system = system
+
+    @property
+    def names(self):
+        """Lord names of the system, indexed by the values in `lords`."""
+        return DASHA_SYSTEMS[self.system].lords
+
+    @property
+    def depth(self) -> int:
+        return self.lords.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    # === Conversions === #
+
+    @classmethod
+    def from_dashas(cls, dashas: DashasType) -> "DashaArray":
+        """Builds the array from a Vimshottari timeline as returned by `Dasha.get_dasha_timeline`."""
+        names = DASHA_SYSTEMS["vimshottari"].lords
+        antardashas = [antar for maha in dashas for antar in maha["antardashas"]]
+
+        lords = np.empty((len(antardashas), 2), dtype=np.uint8)
+        start = np.empty(len(antardashas), dtype=np.float64)
+        end = np.empty(len(antardashas), dtype=np.float64)
+        for i, antar in enumerate(antardashas):
+            lords[i] = (
+                names.index(antar["mahadasha"]),
+                names.index(antar["antardasha"]),
+            )
+            start[i] = toJD(antar["start"])
+            end[i] = toJD(antar["end"])
+        return cls(lords, start, end, "vimshottari")
+
+    @classmethod
+    def from_timeline(cls, timeline: DashaTimeline, depth: int = 2) -> "DashaArray":
+        """Builds the array from an engine timeline, flattened at `depth`."""
+        periods = list(timeline.iter_periods(depth))
+        names = timeline.system.lords
+
+        lords = np.array(
+            [[names.index(lord) for lord in period.lords] for period in periods],
+            dtype=np.uint8,
+        ).reshape(len(periods), depth)
+        start = np.fromiter((p.start for p in periods), np.float64, len(periods))
+        end = np.fromiter((p.end for p in periods), np.float64, len(periods))
+        return cls(lords, start, end, timeline.system.name)
+
+    def to_dashas(self) -> DashasType:
+        """Rebuilds the Mahadasha/Antardasha timeline (`DashasType`) from the arrays."""
+        if self.depth < 2:
+            raise ValueError("At least two levels are needed to rebuild a timeline")
+
+        names = self.names
+        dashas: DashasType = []
+        antardashas: List[AntarDashaType] = []
+        previous = None
+        for row, start, end in zip(self.lords.tolist(), self.start, self.end):
+            if self.depth > 2 and row[:2] == previous:
+                # Deeper rows of the same Antardasha only extend its end
+                antardashas[-1]["end"] = dashas[-1]["end"] = _formatJD(end)
+                continue
+            if previous is None or row[0] != previous[0]:
+                antardashas = []
+                maha: MahaDashaType = {
+                    "mahadasha": names[row[0]],
+                    "start": _formatJD(start),
+                    "end": _formatJD(end),
+                    "antardashas": antardashas,
+                }
+                dashas.append(maha)
+            antardashas.append(
+                {
+                    "mahadasha": names[row[0]],
+                    "antardasha": names[row[1]],
+                    "start": _formatJD(start),
+                    "end": _formatJD(end),
+                }
+            )
+            dashas[-1]["end"] = _formatJD(end)
+            previous = row[:2]
+        return dashas
+
+    # === Serialization === #
+
+    def tobytes(self) -> bytes:
+        """
+        Serializes to bytes: a fixed header, the system name padded to 8 bytes,
+        then the start and end float64 columns followed by the uint8 lords.
+        """
+        name = self.system.encode()
+        header = _HEADER.pack(_MAGIC, len(self), self.depth, len(name)) + name
+        header += b"\0" * (-len(header) % 8)
+        return b"".join(
+            (
+                header,
+                np.ascontiguousarray(self.start, dtype="<f8").tobytes(),
+                np.ascontiguousarray(self.end, dtype="<f8").tobytes(),
+                np.ascontiguousarray(self.lords, dtype=np.uint8).tobytes(),
+            )
+        )
+
+    @classmethod
+    def frombytes(cls, buffer: Buffer) -> "DashaArray":
+        """Loads an array serialized with `tobytes`. The columns are views over `buffer`."""
+        view = memoryview(buffer).cast("B")
+        magic, count, depth, name_len = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized dasha timeline")
+
+        offset = _HEADER.size
+        system = bytes(view[offset : offset + name_len]).decode()
+        offset += name_len
+        offset += -offset % 8
+
+        start = np.frombuffer(view, dtype="<f8", count=count, offset=offset)
+        offset += 8 * count
+        end = np.frombuffer(view, dtype="<f8", count=count, offset=offset)
+        offset += 8 * count
+        lords = np.frombuffer(
+            view, dtype=np.uint8, count=count * depth, offset=offset
+        ).reshape(count, depth)
+        return cls(lords, start, end, system)
+
+    def save(self, path: Union[str, PathLike]):
+        """Saves the serialized bytes as a one-dimensional uint8 `.npy` file."""
+        np.save(path, np.frombuffer(self.tobytes(), dtype=np.uint8))
+
+    @classmethod
+    def load(cls, path: Union[str, PathLike], mmap: bool = True) -> "DashaArray":
+        """Loads a `.npy` file written by `save`, memory-mapped by default."""
+        data = np.load(path, mmap_mode="r" if mmap else None)
+        return cls.frombytes(data)
+
+
+def _formatJD(jd: float) -> str:
+    return jdToDate(jd).strftime("%d-%m-%Y")
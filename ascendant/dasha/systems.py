@@ -0,0 +1,134 @@
+from typing import List, Tuple
+
+from ascendant.const import (
+    NAKSHATRA_SPAN,
+    RASHI_LORD_MAP,
+    RASHIS,
+    VIMSHOTTARI_LORDS,
+    VIMSHOTTARI_YEARS,
+)
+from ascendant.dasha.engine import DashaSystem, register_dasha_system
+
+
+def _moon_nakshatra(system: DashaSystem) -> Tuple[int, float]:
+    """Returns the Moon's nakshatra index and the fraction of it already traversed."""
+    lon = system.chart.getObject("Moon").lon % 360
+    nakshatra = min(int(lon // NAKSHATRA_SPAN), 26)
+    return nakshatra, (lon - nakshatra * NAKSHATRA_SPAN) / NAKSHATRA_SPAN
+
+
+@register_dasha_system("vimshottari")
+class Vimshottari(DashaSystem):
+    """120-year cycle starting from the lord of the Moon's nakshatra."""
+
+    lords = VIMSHOTTARI_LORDS
+    period_years = VIMSHOTTARI_YEARS
+
+    def start(self) -> Tuple[int, float]:
+        nakshatra, elapsed = _moon_nakshatra(self)
+        return nakshatra % len(self.lords), elapsed
+
+
+@register_dasha_system("yogini")
+class Yogini(DashaSystem):
+    """
+    36-year cycle of the eight Yoginis.
+
+    The first Yogini is given by (nakshatra number + 3) mod 8, counted from Mangala.
+    """
+
+    lords = (
+        "Mangala",
+        "Pingala",
+        "Dhanya",
+        "Bhramari",
+        "Bhadrika",
+        "Ulka",
+        "Siddha",
+        "Sankata",
+    )
+    period_years = (1, 2, 3, 4, 5, 6, 7, 8)
+
+    # Planet ruling each Yogini
+    planets = ("Moon", "Sun", "Jupiter", "Mars", "Mercury", "Saturn", "Venus", "Rahu")
+
+    def start(self) -> Tuple[int, float]:
+        nakshatra, elapsed = _moon_nakshatra(self)
+        return (nakshatra + 3) % len(self.lords), elapsed
+
+
+@register_dasha_system("ashtottari")
+class Ashtottari(DashaSystem):
+    """
+    108-year cycle of eight planets (Ketu excluded).
+
+    Each lord rules a group of consecutive nakshatras counted from Ardra. Abhijit is
+    not used, so Saturn rules three nakshatras. The balance at birth is the part of
+    the whole group already traversed by the Moon.
+    """
+
+    lords = ("Sun", "Moon", "Mars", "Mercury", "Saturn", "Jupiter", "Rahu", "Venus")
+    period_years = (6, 15, 8, 17, 10, 19, 12, 21)
+
+    # Number of nakshatras ruled by each lord, starting from Ardra
+    group_sizes = (4, 3, 4, 3, 3, 3, 4, 3)
+
+    ARDRA = 5
+
+    def start(self) -> Tuple[int, float]:
+        lon = self.chart.getObject("Moon").lon
+        arc = (lon - self.ARDRA * NAKSHATRA_SPAN) % 360
+        group_start = 0.0
+        for lord, size in enumerate(self.group_sizes):
+            group_end = group_start + size * NAKSHATRA_SPAN
+            if arc < group_end:
+                return lord, (arc - group_start) / (group_end - group_start)
+            group_start = group_end
+        return len(self.lords) - 1, 1.0
+
+
+@register_dasha_system("chara")
+class Chara(DashaSystem):
+    """
+    Jaimini Chara dasha, a sign-based system starting from the Lagna.
+
+    The dasha runs forward when the 9th sign from the Lagna is a savya sign, and
+    backward otherwise. A sign's period is the count from the sign to its lord
+    (forward for savya signs, backward otherwise) less one, or 12 years when the
+    lord is in the sign. The second cycle runs for 12 minus the first-cycle years.
+    Scorpio and Aquarius use Mars and Saturn only. Each period has 12 equal
+    sub-periods, starting from the next sign and ending with the sign itself.
+    """
+
+    lords = tuple(RASHIS)
+
+    # Aries, Taurus, Gemini, Libra, Scorpio, Sagittarius
+    SAVYA = (0, 1, 2, 6, 7, 8)
+
+    @property
+    def lagna(self) -> int:
+        return int(self.chart.getAngle("Asc").lon // 30) % 12
+
+    @property
+    def direction(self) -> int:
+        return 1 if (self.lagna + 8) % 12 in self.SAVYA else -1
+
+    def start(self) -> Tuple[int, float]:
+        return self.lagna, 0.0
+
+    def years(self, lord: int, cycle: int = 0) -> float:
+        ruler = RASHI_LORD_MAP[RASHIS[lord]]
+        ruler_sign = int(self.chart.getObject(ruler).lon // 30) % 12
+        if lord in self.SAVYA:
+            count = (ruler_sign - lord) % 12
+        else:
+            count = (lord - ruler_sign) % 12
+        years = count or 12
+        return years if cycle == 0 else 12 - years
+
+    def sequence(self, lord: int) -> List[int]:
+        return [(lord + self.direction * i) % 12 for i in range(12)]
+
+    def subperiods(self, lord: int) -> List[Tuple[int, float]]:
+        order = self.sequence(lord)
+        return [(sub, 1 / 12) for sub in order[1:] + order[:1]]
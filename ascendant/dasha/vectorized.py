@@ -0,0 +1,98 @@
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ascendant.const import (
+    DASHA_YEAR_DAYS,
+    NAKSHATRA_SPAN,
+    VIMSHOTTARI_LORDS,
+    VIMSHOTTARI_YEARS,
+)
+
+_YEARS = np.asarray(VIMSHOTTARI_YEARS, dtype=np.float64)
+_CYCLE = float(_YEARS.sum())
+_N = len(VIMSHOTTARI_LORDS)
+
+# Rotated period lengths: row i lists the periods of the sequence starting at lord i
+_ROTATED = _YEARS[(np.arange(_N)[:, None] + np.arange(_N)[None, :]) % _N]
+
+# Cumulative start offsets (in years) of each period within a 120-year cycle
+_OFFSETS = np.concatenate(
+    [np.zeros((_N, 1)), np.cumsum(_ROTATED, axis=1)[:, :-1]], axis=1
+)
+
+
+def _position(offsets: NDArray[np.float64], elapsed: NDArray[np.float64]):
+    """Index of the period containing `elapsed`, given per-row cumulative start offsets."""
+    return (offsets[:, 1:] <= elapsed[:, None]).sum(axis=1)
+
+
+def vimshottari_lords(
+    moon_lon: ArrayLike,
+    birth_jd: ArrayLike,
+    target_jd: ArrayLike | None = None,
+    age: ArrayLike | None = None,
+) -> Tuple[NDArray[np.uint8], NDArray[np.uint8]]:
+    """
+    Computes the Vimshottari Mahadasha and Antardasha lords for many natives at once.
+
+    The balance of the first dasha and the cumulative period offsets are computed
+    arithmetically, so no `Dasha` object or timeline is built per native. Periods use
+    years of 365.25 days, so results may differ from `Dasha` by a day or two
+    around period boundaries. Dates past the 120-year cycle wrap into the next cycle.
+    Dates before birth resolve within the Mahadasha running at birth, as in `Dasha`,
+    but there is no cycle before that Mahadasha started, so earlier dates are rejected.
+
+    Args:
+        moon_lon: Sidereal longitudes of the Moon at birth, in degrees.
+        birth_jd: Julian days of birth (UT).
+        target_jd: Julian days at which to resolve the lords. Either this or `age` is required.
+        age: Ages in years at which to resolve the lords, used when `target_jd` is None.
+
+    Returns:
+        A (mahadasha, antardasha) tuple of uint8 arrays holding indices into
+        `VIMSHOTTARI_LORDS`, broadcast to the shape of the inputs.
+
+    Raises:
+        ValueError: If neither `target_jd` nor `age` is given, or if any target
+            is before the start of the Mahadasha running at birth.
+    """
+    if target_jd is None and age is None:
+        raise ValueError("Either target_jd or age must be given")
+
+    lon = np.mod(np.asarray(moon_lon, dtype=np.float64), 360)
+    birth = np.asarray(birth_jd, dtype=np.float64)
+    if target_jd is not None:
+        elapsed = (np.asarray(target_jd, dtype=np.float64) - birth) / DASHA_YEAR_DAYS
+    else:
+        elapsed = np.asarray(age, dtype=np.float64)
+
+    lon, elapsed = np.broadcast_arrays(lon, elapsed)
+    shape = lon.shape
+    lon = lon.ravel()
+    elapsed = elapsed.ravel()
+
+    # Starting lord and the part of its period already spent at birth
+    nakshatra = np.minimum((lon // NAKSHATRA_SPAN).astype(np.intp), 26)
+    first = nakshatra % _N
+    spent = (lon - nakshatra * NAKSHATRA_SPAN) / NAKSHATRA_SPAN * _YEARS[first]
+
+    # Years since the start of the first Mahadasha, folded into one cycle
+    since_start = elapsed + spent
+    if np.any(since_start < 0):
+        raise ValueError("Targets must not be before the first Mahadasha")
+    since_start = np.mod(since_start, _CYCLE)
+
+    maha_pos = _position(_OFFSETS[first], since_start)
+    maha = (first + maha_pos) % _N
+    in_maha = since_start - _OFFSETS[first, maha_pos]
+
+    # Antardashas split the Mahadasha proportionally, starting from its own lord
+    antar_offsets = _OFFSETS[maha] * (_YEARS[maha] / _CYCLE)[:, None]
+    antar = (maha + _position(antar_offsets, in_maha)) % _N
+
+    return (
+        maha.astype(np.uint8).reshape(shape),
+        antar.astype(np.uint8).reshape(shape),
+    )
@@ -0,0 +1,78 @@
+import asyncio
+import functools
+import weakref
+from typing import Any, Callable, Literal, Optional, TypeVar
+
+from flatlib.ephem import session
+
+from ascendant.const import ASYNC_MAX_WORKERS
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["thread", "process"]
+
+_config = {"kind": "thread", "max_workers": ASYNC_MAX_WORKERS, "max_concurrency": None}
+
+# One semaphore per event loop, since asyncio primitives are bound to a loop
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def configure(
+    kind: ExecutorKind = "thread",
+    max_workers: int = ASYNC_MAX_WORKERS,
+    max_concurrency: Optional[int] = None,
+) -> None:
+    """
+    Configures the pool used by the async API.
+
+    Thread workers apply the Swiss Ephemeris settings per thread and are serialized
+    by the flatlib ephemeris session while computing positions. Process workers have
+    their own ephemeris state and compute in parallel, but arguments and results are
+    pickled. The pools are the shared `flatlib.ephem.session` executors, which are
+    shut down and created again with the new settings.
+
+    Args:
+        kind: "thread" or "process". Defaults to "thread".
+        max_workers: Size of the pool. Defaults to `ASYNC_MAX_WORKERS`.
+        max_concurrency: Maximum number of computations submitted at once, per event
+                         loop. Further calls wait without queueing work in the pool.
+                         Defaults to `max_workers`.
+    """
+    if kind not in ("thread", "process"):
+        raise ValueError(f"Unknown executor kind: {kind}")
+    session.shutdown_executors(wait=False)
+    _semaphores.clear()
+    _config.update(kind=kind, max_workers=max_workers, max_concurrency=max_concurrency)
+
+
+def _semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        limit = _config["max_concurrency"] or _config["max_workers"]
+        semaphore = _semaphores[loop] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def run(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs a blocking computation in the configured pool without blocking the event loop.
+
+    Cancelling the awaiting task releases its slot at once. A computation which has not
+    started yet is dropped; one already running finishes in the pool and its result is
+    discarded.
+
+    Args:
+        func: The function to call. It must be picklable for the process pool.
+        *args: Positional arguments for `func`.
+        **kwargs: Keyword arguments for `func`.
+
+    Returns:
+        The return value of `func`.
+    """
+    async with _semaphore():
+        executor = session.get_executor(_config["kind"], _config["max_workers"])
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
@@ -0,0 +1,141 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+from flatlib.ephem import search
+from numpy.typing import NDArray
+from vedicastro.VedicAstro import AYANAMSA_MAPPING
+
+from ascendant.const import NAKSHATRAS, NODE_MAP, PLANETS_LIST
+from ascendant.types import PLANETS, DateLike, NakshatraIngressType
+from ascendant.utils import jdToDate, toJD
+
+# flatlib object ids of the grahas
+GRAHA_IDS: Dict[PLANETS, str] = {
+    **{planet: planet for planet in PLANETS_LIST},
+    **{node: name for name, node in NODE_MAP.items()},
+}
+
+INGRESS_DTYPE = np.dtype(
+    [("jd", "f8"), ("planet", "u1"), ("nakshatra", "u1"), ("pada", "u1")]
+)
+
+
+class IngressTable:
+    """
+    Compact struct-of-arrays table of nakshatra/pada ingresses, sorted by date.
+
+    Args:
+        jd: float64 array with the Julian days (UT) of the ingresses.
+        planet: uint8 array with indices into `PLANETS_LIST`.
+        nakshatra: uint8 array with the index (0-26) of the nakshatra entered.
+        pada: uint8 array with the pada (1-4) entered.
+    """
+
+    def __init__(
+        self,
+        jd: NDArray[np.float64],
+        planet: NDArray[np.uint8],
+        nakshatra: NDArray[np.uint8],
+        pada: NDArray[np.uint8],
+    ):
+        self.jd = jd
+        self.planet = planet
+        self.nakshatra = nakshatra
+        self.pada = pada
+
+    def __len__(self) -> int:
+        return len(self.jd)
+
+    def to_numpy(self) -> np.ndarray:
+        """Returns the table as a structured array with `INGRESS_DTYPE` records."""
+        table = np.empty(len(self), dtype=INGRESS_DTYPE)
+        table["jd"] = self.jd
+        table["planet"] = self.planet
+        table["nakshatra"] = self.nakshatra
+        table["pada"] = self.pada
+        return table
+
+    def to_columns(self, names: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Returns the table as named columns, ready for `pyarrow.table` or `pandas.DataFrame`.
+
+        Args:
+            names: If True, planets and nakshatras are string columns, otherwise
+                   the numeric indices are kept. Defaults to True.
+        """
+        if not names:
+            return {
+                "jd": self.jd,
+                "planet": self.planet,
+                "nakshatra": self.nakshatra,
+                "pada": self.pada,
+            }
+        return {
+            "jd": self.jd,
+            "planet": np.asarray(PLANETS_LIST)[self.planet],
+            "nakshatra": np.asarray(NAKSHATRAS)[self.nakshatra],
+            "pada": self.pada,
+        }
+
+    def to_list(self) -> List[NakshatraIngressType]:
+        """Returns the ingresses as a list of dicts."""
+        return [
+            {
+                "jd": jd,
+                "date": jdToDate(jd),
+                "planet": PLANETS_LIST[planet],
+                "nakshatra": NAKSHATRAS[nakshatra],
+                "pada": pada,
+            }
+            for jd, planet, nakshatra, pada in zip(
+                self.jd.tolist(),
+                self.planet.tolist(),
+                self.nakshatra.tolist(),
+                self.pada.tolist(),
+            )
+        ]
+
+
+def nakshatra_ingresses(
+    start: DateLike,
+    end: DateLike,
+    planets: Iterable[PLANETS] = PLANETS_LIST,
+    ayanamsa: str = "Lahiri",
+) -> IngressTable:
+    """
+    Computes the nakshatra and pada ingresses of the grahas between two dates.
+
+    Each ingress is located by root-finding on the sidereal longitude, so the
+    result is exact to about a second without sampling the positions every minute.
+    A retrograde graha (and the nodes, which always move backwards) enters the
+    preceding pada.
+
+    Args:
+        start: First date of the range (datetime, string, epoch seconds or `JulianDay`).
+        end: Last date of the range.
+        planets: Grahas to include. Defaults to all nine.
+        ayanamsa: Ayanamsa name as accepted by vedicastro. Defaults to "Lahiri".
+
+    Returns:
+        An IngressTable sorted by date.
+    """
+    jd0, jd1 = toJD(start), toJD(end)
+    mode = AYANAMSA_MAPPING[ayanamsa]
+
+    jds: List[float] = []
+    codes: List[int] = []
+    padas: List[int] = []
+    for planet in planets:
+        for event in search.ingresses(GRAHA_IDS[planet], jd0, jd1, search.PADA, mode):
+            jds.append(event["jd"])
+            codes.append(PLANETS_LIST.index(planet))
+            padas.append(event["index"])
+
+    order = np.argsort(jds, kind="stable")
+    index = np.asarray(padas, dtype=np.uint8)[order]
+    return IngressTable(
+        np.asarray(jds, dtype=np.float64)[order],
+        np.asarray(codes, dtype=np.uint8)[order],
+        index // 4,
+        index % 4 + 1,
+    )
@@ -1,4 +1,5 @@
-from typing import Dict, List, Literal, Optional, TypedDict, Union
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Tuple, TypedDict, Union
 
 PLANETS = Literal[
     "Sun",
@@ -67,6 +68,9 @@ NAKSHATRAS = Literal[
 
 PADA = Literal[1, 2, 3, 4]
 
+# Datetimes, "DD-MM-YYYY"/ISO strings, epoch seconds or `JulianDay` values
+DateLike = Union[str, datetime, int, float]
+
 ALLOWED_DIVISIONS = Literal[1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60]
 
 PLANET_SIGN_RELATION = Literal[
@@ -136,6 +140,31 @@ class MahaDashaType(TypedDict):
 DashasType = List[MahaDashaType]
 
 
+class NakshatraIngressType(TypedDict):
+    jd: float
+    date: datetime
+    planet: PLANETS
+    nakshatra: NAKSHATRAS
+    pada: PADA
+
+
+class DashaTransitionType(TypedDict):
+    date: datetime
+    jd: float
+    level: int
+    lords: Tuple[PLANETS, ...]
+    previous: Optional[Tuple[PLANETS, ...]]
+
+
+class DashaPeriodType(TypedDict):
+    lord: str
+    start: str
+    end: str
+    start_jd: float
+    end_jd: float
+    subperiods: List["DashaPeriodType"]
+
+
 class AspectType(TypedDict):
     planet: PLANETS
     from_house: HOUSES
@@ -1,9 +1,10 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import re
-from typing import List, Union, cast
+from typing import List, cast
 
 from vedicastro.VedicAstro import HOUSE_SYSTEM_MAPPING
-from ascendant.types import HOUSES, PLANET_SIGN_RELATION, PLANETS, RASHIS
+from ascendant.types import HOUSES, PLANET_SIGN_RELATION, PLANETS, RASHIS, DateLike
 from ascendant.const import RASHIS as RASHI_MAP
 
 
@@ -29,15 +30,82 @@ def getHouseSystem(house_system: str):
     return HOUSE_SYSTEM_MAPPING["Whole Sign"]
 
 
-def parseDate(s: Union[str, datetime]) -> datetime | None:
-    if not s:
+# Julian day of the Unix epoch (1970-01-01 00:00 UTC)
+JD_UNIX_EPOCH = 2440587.5
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def dateToJD(date: datetime) -> float:
+    """Convert a datetime (naive values are taken as UTC) to a Julian day."""
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return JD_UNIX_EPOCH + (date - _UNIX_EPOCH).total_seconds() / 86400
+
+
+def jdToDate(jd: float) -> datetime:
+    """Convert a Julian day to an aware UTC datetime."""
+    return _UNIX_EPOCH + timedelta(days=jd - JD_UNIX_EPOCH)
+
+
+class JulianDay(float):
+    """Marks a number as a Julian day (UT) for the date parsers, instead of epoch seconds."""
+
+    __slots__ = ()
+
+
+@lru_cache(maxsize=4096)
+def _parseDateString(s: str) -> datetime:
+    """Parse a "DD-MM-YYYY" or ISO 8601 string to an aware UTC datetime (memoized)."""
+    try:
+        dt = datetime.strptime(s, "%d-%m-%Y")
+    except ValueError:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _stringToJD(s: str) -> float:
+    return dateToJD(_parseDateString(s))
+
+
+def parseDate(s: DateLike | None) -> datetime | None:
+    """
+    Parse a date to an aware UTC datetime.
+
+    Accepts datetimes (naive values are taken as UTC), "DD-MM-YYYY" or ISO 8601
+    strings, epoch seconds and `JulianDay` values. Strings are parsed once and
+    memoized.
+    """
+    if s is None or s == "":
         return None
     if isinstance(s, datetime):
         if s.tzinfo is None:
             return s.replace(tzinfo=timezone.utc)
         return s.astimezone(timezone.utc)
-    dt = datetime.strptime(s, "%d-%m-%Y")
-    return dt.replace(tzinfo=timezone.utc)
+    if isinstance(s, str):
+        return _parseDateString(s)
+    if isinstance(s, JulianDay):
+        return jdToDate(s)
+    return _UNIX_EPOCH + timedelta(seconds=s)
+
+
+def toJD(s: DateLike) -> float:
+    """
+    Convert any date accepted by `parseDate` to a Julian day (UT).
+
+    This is the form used for comparisons in hot loops: strings hit a memoized
+    cache and numbers need no datetime at all.
+    """
+    if isinstance(s, JulianDay):
+        return float(s)
+    if isinstance(s, str):
+        return _stringToJD(s)
+    if isinstance(s, datetime):
+        return dateToJD(s)
+    return JD_UNIX_EPOCH + s / 86400
 
 
 def planetSignRelation(
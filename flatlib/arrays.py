@@ -0,0 +1,363 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+
+
+    This module implements struct-of-arrays storage for
+    objects and houses. The values of all items are kept
+    in NumPy float64 columns, so that a list can be copied
+    or processed with array operations instead of going
+    through each object.
+
+    Items are accessed through views: instances of the
+    Object and House classes whose attributes read and
+    write one row of the arrays. The sign is not stored,
+    since it follows from the longitude.
+
+    The HouseIndex finds the houses of longitudes by a
+    binary search of the sorted house cusps.
+
+"""
+
+import bisect
+
+import numpy as np
+
+from . import angle
+from . import const
+from .object import GenericObject, Object, House
+
+
+# ------------------ #
+#     Item Array     #
+# ------------------ #
+
+class ItemArray:
+    """ This class represents the columns of a list of
+    items. Subclasses define the stored FIELDS and the
+    VIEW class.
+
+    The data is a float64 array of shape (items, fields),
+    and ids and types are kept in lists. The version counts
+    the writes made through the array and its views, so
+    that caches of derived values know when to rebuild.
+
+    """
+
+    FIELDS = ()
+    VIEW = None
+
+    def __init__(self, ids, types, data, index=None):
+        self.ids = list(ids)
+        self.types = list(types)
+        self.data = data
+        if index is None:
+            index = {ID: i for i, ID in enumerate(self.ids)}
+        self.index = index
+        self.version = 0
+
+    @classmethod
+    def fromDicts(cls, dicts, default_type):
+        """ Builds an array from dictionaries of properties,
+        such as the ones returned by the ephemeris.
+
+        """
+        dicts = list(dicts)
+        data = np.array(
+            [[d.get(name, 0.0) for name in cls.FIELDS] for d in dicts],
+            dtype=np.float64
+        ).reshape(len(dicts), len(cls.FIELDS))
+        ids = [d['id'] for d in dicts]
+        types = [d.get('type', default_type) for d in dicts]
+        return cls(ids, types, data)
+
+    @classmethod
+    def fromObjects(cls, objs):
+        """ Builds an array from a list of objects. """
+        objs = list(objs)
+        data = np.array(
+            [[getattr(obj, name, 0.0) for name in cls.FIELDS] for obj in objs],
+            dtype=np.float64
+        ).reshape(len(objs), len(cls.FIELDS))
+        ids = [obj.id for obj in objs]
+        types = [obj.type for obj in objs]
+        return cls(ids, types, data)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def column(self, name):
+        """ Returns a column of this array as a view. """
+        return self.data[:, self.FIELDS.index(name)]
+
+    @property
+    def lon(self):
+        """ Returns the longitudes column. """
+        return self.data[:, 0]
+
+    def copy(self):
+        """ Returns a deep copy of this array. """
+        return type(self)(
+            self.ids, self.types, self.data.copy(), dict(self.index)
+        )
+
+    def relocate(self, lons):
+        """ Relocates all items to new longitudes. """
+        lons = angle.norm(np.asarray(lons, dtype=np.float64))
+        self.data[:, 0] = lons
+        self.data[:, self.FIELDS.index('signlon')] = lons % 30
+        self.version += 1
+
+    def move(self, offset):
+        """ Moves all items by an offset. """
+        self.relocate(self.data[:, 0] + offset)
+
+    def add(self, obj):
+        """ Adds an object to this array, replacing an item
+        with the same id.
+
+        """
+        row = [getattr(obj, name, 0.0) for name in self.FIELDS]
+        self.version += 1
+        i = self.index.get(obj.id)
+        if i is None:
+            i = self.index[obj.id] = len(self.ids)
+            self.ids.append(obj.id)
+            self.types.append(obj.type)
+            self.data = np.vstack([self.data, [row]])
+        else:
+            self.types[i] = obj.type
+            self.data[i] = row
+        return i
+
+    # === Views === #
+
+    def view(self, i):
+        """ Returns a view of the item at row i. """
+        view = self.VIEW.__new__(self.VIEW)
+        view._array = self
+        view._row = i
+        return view
+
+    def views(self):
+        """ Returns views of all items. """
+        return [self.view(i) for i in range(len(self.ids))]
+
+
+# ------------------ #
+#     Item Views     #
+# ------------------ #
+
+def _field(i):
+    """ Returns a property for column i. """
+    def fget(self):
+        return self._array.data.item(self._row, i)
+
+    def fset(self, value):
+        array = self._array
+        array.data[self._row, i] = value
+        array.version += 1
+
+    return property(fget, fset)
+
+
+class _ItemView:
+    """ Common members of the views. The id and sign are
+    read-only, and relocate writes the arrays.
+
+    """
+
+    __slots__ = ()
+
+    # The class of detached copies
+    _BASE = None
+
+    @property
+    def id(self):
+        return self._array.ids[self._row]
+
+    @property
+    def type(self):
+        return self._array.types[self._row]
+
+    @type.setter
+    def type(self, value):
+        self._array.types[self._row] = value
+
+    @property
+    def sign(self):
+        return const.LIST_SIGNS[int(self.lon / 30.0)]
+
+    def relocate(self, lon):
+        """ Relocates this object to a new longitude. """
+        self.lon = angle.norm(lon)
+        self.signlon = self.lon % 30
+
+    def copy(self):
+        """ Returns a deep copy of this object, which is
+        not a view.
+
+        """
+        return self._BASE.fromDict(self.toDict())
+
+    def __getstate__(self):
+        return (None, {'_array': self._array, '_row': self._row})
+
+
+class GenericView(_ItemView, GenericObject):
+    """ A view of an item of a GenericArray. """
+
+    __slots__ = ('_array', '_row')
+    _BASE = GenericObject
+
+
+class ObjectView(_ItemView, Object):
+    """ A view of an object of an ObjectArray. """
+
+    __slots__ = ('_array', '_row')
+    _BASE = Object
+
+
+class HouseView(_ItemView, House):
+    """ A view of a house of a HouseArray. """
+
+    __slots__ = ('_array', '_row')
+    _BASE = House
+
+
+# ------------------ #
+#   Object Arrays    #
+# ------------------ #
+
+class GenericArray(ItemArray):
+    """ Columns of a list of generic objects, such as
+    the angles.
+
+    """
+
+    FIELDS = ('lon', 'lat', 'signlon')
+    VIEW = GenericView
+
+
+class ObjectArray(ItemArray):
+    """ Columns of a list of astrology objects. """
+
+    FIELDS = ('lon', 'lat', 'lonspeed', 'latspeed', 'signlon')
+    VIEW = ObjectView
+
+
+class HouseArray(ItemArray):
+    """ Columns of a list of houses. """
+
+    FIELDS = ('lon', 'lat', 'signlon', 'size')
+    VIEW = HouseView
+
+
+for _array in (GenericArray, ObjectArray, HouseArray):
+    for _i, _name in enumerate(_array.FIELDS):
+        setattr(_array.VIEW, _name, _field(_i))
+
+del _array, _i, _name
+
+
+# ------------------ #
+#    House Index     #
+# ------------------ #
+
+class HouseIndex:
+    """ This class represents the houses sorted by their
+    start, which is the cusp with the traditional offset,
+    to find the houses of many longitudes at once.
+
+    The cusps and sizes may have leading dimensions, such
+    as (charts, houses), to find the houses of longitudes
+    of shape (charts, n) in the same pass.
+
+    """
+
+    def __init__(self, lon, size):
+        lon = np.asarray(lon, dtype=np.float64)
+        nhouses = lon.shape[-1]
+        lon = lon.reshape(-1, nhouses)
+        size = np.asarray(size, dtype=np.float64).reshape(lon.shape)
+
+        start = lon + House._OFFSET
+        order = np.argsort(angle.norm(start), axis=1, kind='stable')
+        self.nhouses = nhouses
+        self.order = order
+        self.start = np.take_along_axis(start, order, axis=1)
+        self.size = np.take_along_axis(size, order, axis=1)
+
+        # The starts of chart k are shifted by 360 * k, so
+        # all charts are searched in one sorted array
+        k = np.arange(len(lon))[:, np.newaxis]
+        self._sorted = (angle.norm(self.start) + 360.0 * k).ravel()
+        self._shift = 360.0 * k
+        self._first = nhouses * k
+
+        # Lists for the lookup of single longitudes
+        self._lists = list(zip(
+            angle.norm(self.start).tolist(), self.start.tolist(),
+            self.size.tolist(), self.order.tolist()
+        ))
+
+    @classmethod
+    def fromArrays(cls, arrays):
+        """ Builds the index of a list of house arrays with
+        the same houses.
+
+        """
+        return cls(
+            np.stack([array.lon for array in arrays]),
+            np.stack([array.column('size') for array in arrays])
+        )
+
+    def _rows(self, lons, pos):
+        """ Returns the rows of the houses at flat positions
+        pos, or -1 if the longitudes are outside them.
+
+        """
+        start = self.start.ravel()[pos]
+        inHouse = angle.norm(lons - start) < self.size.ravel()[pos]
+        return np.where(inHouse, self.order.ravel()[pos], -1)
+
+    def locate(self, lons):
+        """
+        Returns the rows of the houses of longitudes. The
+        longitudes must have the leading dimensions of the
+        index, such as (charts, n).
+
+        :param lons: the longitudes
+        :return: int array of rows, which are -1 for a
+                 longitude outside all houses
+        """
+        lons = np.asarray(lons, dtype=np.float64)
+        shape = lons.shape
+        lons = lons.reshape(len(self._first), -1)
+
+        # The last start before each longitude, which wraps
+        # around to the last house
+        pos = np.searchsorted(
+            self._sorted, angle.norm(lons) + self._shift, side='right'
+        ) - 1
+        first = self._first
+        pos = np.where(pos < first, pos + self.nhouses, pos)
+        rows = self._rows(lons, pos)
+
+        # Rounding at the starts is settled by the previous house
+        outside = rows < 0
+        if outside.any():
+            prev = np.where(pos == first, pos + self.nhouses, pos) - 1
+            rows = np.where(outside, self._rows(lons, prev), rows)
+        return rows.reshape(shape)
+
+    def find(self, lon, k=0):
+        """ Returns the row of the house of a single longitude
+        of chart k, or -1, with a binary search of the lists.
+
+        """
+        starts, start, size, order = self._lists[k]
+        pos = bisect.bisect_right(starts, lon % 360) - 1
+        for p in pos, pos - 1:
+            if (lon - start[p]) % 360 < size[p]:
+                return order[p]
+        return -1
@@ -29,8 +29,11 @@
 
 """
 
+import numpy as np
+
 from . import angle
 from . import const
+from . import vectorized
 
 
 # Orb for minor and exact aspects
@@ -242,6 +245,184 @@ def getAspect(obj1, obj2, aspList):
     return Aspect(aspProp)
 
 
+# ---------------- #
+#  Aspect Matrix   #
+# ---------------- #
+
+# Objects which only start conjunctions
+_CONJUNCTION_ONLY = [const.PARS_FORTUNA, const.NORTH_NODE, const.SOUTH_NODE]
+
+
+def aspect_matrix(objects, aspList):
+    """
+    Computes the aspects between all pairs of objects at
+    once, with the same rules as the per-pair functions.
+
+    :param objects: the objects
+    :param aspList: the list of possible aspect types
+    :return: AspectMatrix
+    """
+    return AspectMatrix(objects, aspList)
+
+
+class AspectMatrix:
+    """ This class represents the aspects between all pairs
+    of a list of objects, as (n, n) arrays.
+
+    Directed arrays describe the aspect started by object i
+    to object j (as in isAspecting):
+    - separation: the closest distance from i to j
+    - startIndex: the index in aspList of the aspect, or -1
+    - startOrb: the orb of the aspect
+
+    Pair arrays describe the aspect between i and j, where
+    the active object is the fastest (as in getAspect):
+    - active: if i is the active object
+    - index, orb: the aspect index in aspList (or -1) and orb
+    - activeInOrb, passiveInOrb: if within orb of each object
+    - activeMovement, passiveMovement, direction, condition:
+      object arrays with the aspect properties
+
+    """
+
+    def __init__(self, objects, aspList):
+        self.objects = list(objects)
+        self.aspList = list(aspList)
+        self.index = {obj.id: i for i, obj in enumerate(self.objects)}
+        n = len(self.objects)
+        objs = self.objects
+
+        lon = np.array([obj.lon for obj in objs], dtype=np.float64)
+        signlon = np.array([obj.signlon for obj in objs], dtype=np.float64)
+        orbs = np.array([obj.orb() for obj in objs], dtype=np.float64)
+        speed = np.array(
+            [getattr(obj, 'lonspeed', 0.0) for obj in objs], dtype=np.float64
+        )
+        planet = np.array([obj.isPlanet() for obj in objs], dtype=bool)
+        self.orbs = orbs
+
+        # Directed aspects, as in _aspectDict
+        sep = vectorized.closestdistance(lon[:, None], lon[None, :])
+        absSep = np.abs(sep)
+        asps = np.array(self.aspList, dtype=np.float64).reshape(-1, 1, 1)
+        orb = np.abs(absSep[None] - asps)
+
+        major = np.isin(self.aspList, const.MAJOR_ASPECTS).reshape(-1, 1, 1)
+        inOrb = ~((orbs[None, :, None] < orb) & (orbs[None, None, :] < orb))
+        valid = np.where(major, inOrb, orb <= MAX_MINOR_ASP_ORB)
+        conjOnly = np.isin([obj.id for obj in objs], _CONJUNCTION_ONLY)
+        valid &= ~(conjOnly[None, :, None] & (asps != const.CONJUNCTION))
+        starts = np.array([obj.id != const.SYZYGY for obj in objs], dtype=bool)
+        valid &= starts[None, :, None]
+        valid &= ~np.eye(n, dtype=bool)[None]
+
+        # The first valid aspect of the list
+        rows, cols = np.indices((n, n))
+        exists = valid.any(axis=0)
+        k = valid.argmax(axis=0) if len(valid) else np.zeros((n, n), np.intp)
+        self.separation = sep
+        self.startIndex = np.where(exists, k, -1)
+        self.startOrb = np.where(exists, orb[k, rows, cols], 0.0) \
+            if len(valid) else np.zeros((n, n))
+
+        # Active and passive objects, as in _getActivePassive
+        activeSpeed = np.where(planet, np.abs(speed), -1.0)
+        self.active = activeSpeed[:, None] > activeSpeed[None, :]
+        a = np.where(self.active, rows, cols)
+        p = np.where(self.active, cols, rows)
+
+        # Pair aspects, as in _aspectProperties
+        pairIndex = self.startIndex[a, p]
+        pairOrb = self.startOrb[a, p]
+        pairSep = sep[a, p]
+        has = pairIndex >= 0
+        pairAsp = np.array(self.aspList + [0], dtype=np.float64)[pairIndex]
+        self.pairIndex = pairIndex
+        self.orb = pairOrb
+        self.activeInOrb = has & (pairOrb <= orbs[a])
+        self.passiveInOrb = has & (pairOrb <= orbs[p])
+
+        self.direction = np.full((n, n), -1, dtype=object)
+        self.direction[has & (pairSep <= 0)] = const.DEXTER
+        self.direction[has & (pairSep > 0)] = const.SINISTER
+
+        orbDir = np.where(pairSep >= 0, pairSep - pairAsp, pairSep + pairAsp)
+        offset = signlon[a] + orbDir
+        associate = (0 <= offset) & (offset < 30)
+        self.condition = np.full((n, n), -1, dtype=object)
+        self.condition[has & associate] = const.ASSOCIATE
+        self.condition[has & ~associate] = const.DISSOCIATE
+
+        # Movements of the active and passive objects
+        speedA = speed[a]
+        stationary = np.abs(speedA) < 0.0003
+        direct = ~stationary & (speedA > 0)
+        retrograde = ~stationary & (speedA <= 0)
+        exact = has & (np.abs(orbDir) < MAX_EXACT_ORB)
+        moving = has & ~exact
+        applies = ((orbDir > 0) & direct) | ((orbDir < 0) & retrograde)
+
+        movement = np.full((n, n), const.NO_MOVEMENT, dtype=object)
+        movement[moving] = const.SEPARATIVE
+        movement[moving & ~applies & stationary] = const.STATIONARY
+        movement[moving & applies] = const.APPLICATIVE
+        movement[exact] = const.EXACT
+        self.activeMovement = movement
+
+        speedP = np.where(planet, speed, 0.0)[p]
+        sameDir = speedA * speedP >= 0
+        passive = np.full((n, n), const.NO_MOVEMENT, dtype=object)
+        passive[exact] = const.EXACT
+        passive[moving & ~sameDir] = movement[moving & ~sameDir]
+        self.passiveMovement = passive
+
+    # === Queries === #
+
+    def _aspect(self, i):
+        return self.aspList[i] if i >= 0 else const.NO_ASPECT
+
+    def aspectType(self, ID1, ID2):
+        """ Returns the aspect type between two objects. """
+        i, j = self.index[ID1], self.index[ID2]
+        return self._aspect(self.pairIndex[i, j])
+
+    def hasAspect(self, ID1, ID2):
+        """ Returns if there is an aspect between two objects. """
+        i, j = self.index[ID1], self.index[ID2]
+        return bool(self.pairIndex[i, j] >= 0)
+
+    def isAspecting(self, ID1, ID2):
+        """ Returns if ID1 aspects ID2 within its orb. """
+        i, j = self.index[ID1], self.index[ID2]
+        if self.startIndex[i, j] < 0:
+            return False
+        return bool(self.startOrb[i, j] < self.orbs[i])
+
+    def getAspect(self, ID1, ID2):
+        """ Returns an Aspect object for the aspect between
+        two objects.
+
+        """
+        i, j = self.index[ID1], self.index[ID2]
+        a, p = (i, j) if self.active[i, j] else (j, i)
+        return Aspect({
+            'type': self._aspect(self.pairIndex[i, j]),
+            'orb': float(self.orb[i, j]),
+            'direction': self.direction[i, j],
+            'condition': self.condition[i, j],
+            'active': {
+                'id': self.objects[a].id,
+                'inOrb': bool(self.activeInOrb[i, j]),
+                'movement': self.activeMovement[i, j],
+            },
+            'passive': {
+                'id': self.objects[p].id,
+                'inOrb': bool(self.passiveInOrb[i, j]),
+                'movement': self.passiveMovement[i, j],
+            },
+        })
+
+
 # ---------------- #
 #   Aspect Class   #
 # ---------------- #
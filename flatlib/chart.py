@@ -20,7 +20,10 @@
     
 """
 
+import numpy as np
+
 from . import angle
+from . import aspects
 from . import const
 from . import utils
 from .ephem import ephem, swe
@@ -53,9 +56,13 @@ class Chart:
         self.hsys = hsys
         self.objects = ephem.get_objects(IDs, date, pos, mode=mode)
         self.houses, self.angles = ephem.get_houses(date, pos, hsys, mode=mode)
+        self._aspects = {}
         
     def copy(self):
-        """ Returns a deep copy of this chart. """
+        """ Returns a deep copy of this chart. The lists are
+        array copies and their items are built on access.
+        
+        """
         chart = Chart.__new__(Chart)
         chart.date = self.date
         chart.pos = self.pos
@@ -63,16 +70,14 @@ class Chart:
         chart.objects = self.objects.copy()
         chart.houses = self.houses.copy()
         chart.angles = self.angles.copy()
+        chart._aspects = {}
         return chart
 
     def move(self, offset):
         """Moves all items of the chart by an offset."""
-        for obj in self.objects:
-            obj.relocate(obj.lon + offset)
-        for obj in self.houses:
-            obj.relocate(obj.lon + offset)
-        for obj in self.angles:
-            obj.relocate(obj.lon + offset)
+        self.objects.move(offset)
+        self.houses.move(offset)
+        self.angles.move(offset)
 
     def to_sidereal_zodiac(self, mode):
         """Returns a copy of this chart on the sidereal zodiac."""
@@ -108,6 +113,39 @@ class Chart:
             return self.getObject(ID)
 
 
+    # === Aspects === #
+    
+    def _state(self, copy=False):
+        """ Returns the values which determine the aspects. """
+        state = []
+        for lst in (self.objects, self.angles, self.houses):
+            array = getattr(lst, 'array', None)
+            if array is None:
+                state.append([obj.toDict() for obj in lst])
+            elif copy:
+                state.append((list(array.ids), array.data.copy()))
+            else:
+                state.append((array.ids, array.data))
+        return state
+    
+    def aspect_matrix(self, aspList):
+        """
+        Returns the aspects between all objects, angles and
+        houses of the chart. The matrix is cached for each
+        list of aspects until the chart positions change.
+        
+        :param aspList: the list of possible aspect types
+        :return: aspects.AspectMatrix
+        """
+        key = tuple(aspList)
+        cached = self._aspects.get(key)
+        if cached is None or not _sameState(cached[0], self._state()):
+            items = list(self.objects) + list(self.angles) + list(self.houses)
+            matrix = aspects.aspect_matrix(items, aspList)
+            cached = self._aspects[key] = (self._state(copy=True), matrix)
+        return cached[1]
+    
+    
     # === Fixed stars === #
     
     # The computation of fixed stars is inefficient,
@@ -123,6 +161,18 @@ class Chart:
         IDs = const.LIST_FIXED_STARS
         return ephem.getFixedStarList(IDs, self.date)
 
+    def getFixedStarConjunctions(self, IDs=None, orb=None):
+        """ Returns the fixed stars conjunct to the objects
+        and angles of this chart, as (star, object, distance)
+        tuples sorted by distance. By default all stars of
+        the catalog are considered with orbs by magnitude.
+
+        """
+        objects = list(self.objects) + list(self.angles)
+        return ephem.get_fixed_star_conjunctions(
+            objects, self.date, IDs, orb
+        )
+
 
     # === Houses and angles === #
     
@@ -183,3 +233,15 @@ class Chart:
                         self.date.utcoffset)
         srDate = ephem.nextSolarReturn(date, sun.lon)
         return Chart(srDate, self.pos, hsys=self.hsys)
+
+
+def _sameState(state1, state2):
+    """ Returns if two chart states are equal. """
+    for value1, value2 in zip(state1, state2):
+        if isinstance(value1, tuple) and isinstance(value2, tuple):
+            if value1[0] != value2[0] or \
+                    not np.array_equal(value1[1], value2[1]):
+                return False
+        elif value1 != value2:
+            return False
+    return True
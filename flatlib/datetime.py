@@ -10,9 +10,17 @@
     and <Datetime>. Since time is similar to angles (same 
     string separators and base 60), the <Time> class uses 
     angular functions for internal conversions.
+    
+    The jd_from_components and components_from_jd functions
+    convert plain numbers or NumPy arrays of them, without
+    building any object.
 
 """
 
+import math
+
+import numpy as np
+
 from . import angle
 
 
@@ -20,6 +28,9 @@ from . import angle
 GREGORIAN = 0
 JULIAN = 1
 
+# Julian day of the Unix epoch (1970-01-01 00:00 UTC)
+JD_UNIX_EPOCH = 2440587.5
+
 
 # === Julian Day Number conversions === #
 
@@ -47,6 +58,52 @@ def jdnDate(jdn):
     return [year, month, day]
 
 
+# === Vectorized Julian Day conversions === #
+
+def jd_from_components(year, month, day, hour=0, minute=0, second=0,
+                       utcoffset=0, calendar=GREGORIAN):
+    """
+    Returns the julian day of a date and time. All
+    components can be numbers or arrays, which are
+    broadcast together.
+
+    :param year, month, day: the date components
+    :param hour, minute, second: the time components
+    :param utcoffset: the UTC offset in hours
+    :param calendar: GREGORIAN or JULIAN
+    :return: the julian day, as a float or array
+    """
+    jdn = dateJDN(np.asarray(year, dtype=np.int64),
+                  np.asarray(month, dtype=np.int64),
+                  np.asarray(day, dtype=np.int64), calendar)
+    hours = np.add(hour, np.divide(minute, 60) + np.divide(second, 3600))
+    jd = jdn + (hours - np.asarray(utcoffset, dtype=np.float64)) / 24 - 0.5
+    return jd if jd.ndim else float(jd)
+
+
+def components_from_jd(jd, utcoffset=0):
+    """
+    Returns the Gregorian date and time of julian days,
+    localized for an UTC offset.
+
+    :param jd: the julian day, as a float or array
+    :param utcoffset: the UTC offset in hours
+    :return: (year, month, day, hour, minute, second) with
+             integer arrays and float seconds, or numbers
+             for a float jd
+    """
+    localJD = np.asarray(jd, dtype=np.float64) + np.divide(utcoffset, 24)
+    jdn = np.floor(localJD + 0.5).astype(np.int64)
+    seconds = (localJD + 0.5 - jdn) * 86400
+    hour, seconds = np.divmod(seconds, 3600)
+    minute, second = np.divmod(seconds, 60)
+    res = jdnDate(jdn) + [hour.astype(np.int64), minute.astype(np.int64),
+                          second]
+    if not jdn.ndim:
+        res = [int(v) for v in res[:5]] + [float(second)]
+    return tuple(res)
+
+
 # ------------------ #
 #     Date Class     #
 # ------------------ #
@@ -196,14 +253,36 @@ class Datetime:
         if not isinstance(utcoffset, Time):
             utcoffset = Time(utcoffset)
         localJD = jd + utcoffset.value / 24.0
-        date = Date(round(localJD))
+        date = Date(math.floor(localJD + 0.5))
         time = Time((localJD + 0.5 - date.jdn) * 24)
         return Datetime(date, time, utcoffset)
 
+    @staticmethod
+    def fromDatetime(value):
+        """ Builds a Datetime object given a python datetime, 
+        without parsing strings. Naive datetimes are taken
+        as UTC.
+        
+        """
+        offset = value.utcoffset()
+        offset = offset.total_seconds() / 3600 if offset else 0.0
+        jdn = dateJDN(value.year, value.month, value.day, GREGORIAN)
+        seconds = value.second + value.microsecond / 1e6
+        time = value.hour + value.minute / 60 + seconds / 3600
+        return Datetime(Date(jdn), Time(time), Time(offset))
+
+    @staticmethod
+    def fromTimestamp(seconds, utcoffset=0):
+        """ Builds a Datetime object given the seconds since
+        the Unix epoch and an utc offset.
+        
+        """
+        return Datetime.fromJD(JD_UNIX_EPOCH + seconds / 86400, utcoffset)
+
     def getUTC(self):
         """ Returns this Datetime localized for UTC. """
         timeUTC = self.time.getUTC(self.utcoffset)
-        dateUTC = Date(round(self.jd))
+        dateUTC = Date(math.floor(self.jd + 0.5))
         return Datetime(dateUTC, timeUTC)
     
     def __str__(self):
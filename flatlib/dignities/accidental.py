@@ -14,7 +14,6 @@ from copy import copy
 from flatlib import angle, dignities
 from flatlib import const
 from flatlib import props
-from flatlib import aspects
 from flatlib.dignities import essential
 from flatlib.tools.chartdynamics import ChartDynamics
 
@@ -262,6 +261,7 @@ class AccidentalDignity:
         
         """
         res = []
+        matrix = self.chart.aspect_matrix(aspList)
         
         for otherID in IDs:
             # Ignore same 
@@ -269,8 +269,7 @@ class AccidentalDignity:
                 continue
             
             # Get aspects to the other object
-            otherObj = self.chart.getObject(otherID)
-            asp = aspects.getAspect(self.obj, otherObj, aspList)
+            asp = matrix.getAspect(self.obj.id, otherID)
             
             if asp.type == const.NO_ASPECT:
                 continue
@@ -342,13 +341,13 @@ class AccidentalDignity:
     
     def isConjNorthNode(self):
         """ Returns if object is conjunct north node. """
-        node = self.chart.getObject(const.NORTH_NODE)
-        return aspects.hasAspect(self.obj, node, aspList=[0])
+        matrix = self.chart.aspect_matrix([0])
+        return matrix.hasAspect(self.obj.id, const.NORTH_NODE)
     
     def isConjSouthNode(self):
         """ Returns if object is conjunct south node. """
-        node = self.chart.getObject(const.SOUTH_NODE)
-        return aspects.hasAspect(self.obj, node, aspList=[0])
+        matrix = self.chart.aspect_matrix([0])
+        return matrix.hasAspect(self.obj.id, const.SOUTH_NODE)
     
     
     # === Void of Course, Feral and Haiz === #
@@ -364,9 +363,9 @@ class AccidentalDignity:
         """
         planets = copy(const.LIST_SEVEN_PLANETS)
         planets.remove(self.obj.id)
+        matrix = self.chart.aspect_matrix(const.MAJOR_ASPECTS)
         for otherID in planets:
-            otherObj = self.chart.getObject(otherID)
-            if aspects.hasAspect(self.obj, otherObj, const.MAJOR_ASPECTS):
+            if matrix.hasAspect(self.obj.id, otherID):
                 return False
         return True
     
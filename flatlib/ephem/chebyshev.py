@@ -0,0 +1,342 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+
+
+    This module implements an optional ephemeris backend
+    which answers position queries by evaluating Chebyshev
+    polynomials fitted to the Swiss Ephemeris.
+
+    Coefficients are computed once per body over fixed
+    intervals, which are shorter near conjunctions with the
+    Sun, and can be saved to a file which is loaded
+    memory-mapped. With the default settings, positions
+    stay within ACCURACY_BOUND of pyswisseph and speeds
+    within SPEED_ACCURACY_BOUND, except very close to the
+    Sun (see below). The actual error measured while
+    fitting is kept for each body.
+
+    Topocentric positions are not supported.
+
+"""
+
+import json
+import struct
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from flatlib import const
+from flatlib import vectorized
+from . import swe
+
+
+# Default polynomial degree and interval length (days)
+DEFAULT_DEGREE = 12
+DEFAULT_INTERVAL = 8.0
+DEFAULT_INTERVALS = {
+    const.MOON: 2.0,
+}
+
+# Near a conjunction with the Sun, its light deflection
+# changes the positions sharply, so the intervals where an
+# object comes within CONJUNCTION_ORB degrees of the Sun
+# are split into intervals of CONJUNCTION_INTERVAL days.
+CONJUNCTION_ORB = 2.0
+CONJUNCTION_INTERVAL = 0.5
+
+# Objects without light deflection
+_UNDEFLECTED = [const.SUN, const.MOON, const.NORTH_NODE]
+
+# Error bounds of the default settings, in arc-seconds for
+# longitude and latitude and arc-seconds/day for speeds.
+# Within CLOSE_CONJUNCTION_ORB degrees of the Sun, where
+# the deflection changes abruptly near the solar disk, the
+# conjunction bounds apply to positions and speeds.
+ACCURACY_BOUND = 0.5
+SPEED_ACCURACY_BOUND = 10.0
+CLOSE_CONJUNCTION_ORB = 0.5
+CONJUNCTION_ACCURACY_BOUND = 1.0
+CONJUNCTION_SPEED_ACCURACY_BOUND = 250.0
+
+# Fractions of each interval where the fit is checked
+_CHECKPOINTS = np.array([0.13, 0.5, 0.87])
+
+# Magic and version, length of the metadata
+_HEADER = struct.Struct('<8sI')
+_MAGIC = b'FLCHEB02'
+
+
+class ChebyshevEphemeris:
+    """ This class represents a set of bodies fitted with
+    Chebyshev polynomials over a range of julian dates.
+
+    The coefficients of each body are a float64 array of
+    shape (intervals, degree + 1, 2) for longitude and
+    latitude, and the intervals are given by the array of
+    their bounds. Speeds are given by the polynomial
+    derivatives.
+
+    """
+
+    def __init__(self, jd0, jd1, segments, mode=None):
+        self.jd0 = jd0
+        self.jd1 = jd1
+        self.mode = mode
+        self.segments = segments
+
+    @property
+    def objects(self):
+        """ Returns the ids of the fitted objects. """
+        return list(self.segments)
+
+    @property
+    def accuracy(self):
+        """ Returns the maximum error (arc-seconds) measured
+        for each object while fitting.
+
+        """
+        return {ID: seg['error'] for ID, seg in self.segments.items()}
+
+    # === Fitting === #
+
+    @classmethod
+    def build(cls, objs, jd0, jd1, mode=None, degree=DEFAULT_DEGREE,
+              intervals=None):
+        """
+        Fits Chebyshev polynomials to the objects between
+        two julian dates.
+        - If mode is set, fits sidereal positions for the given mode
+
+        :param objs: the objects (South Node is derived from the North Node)
+        :param jd0: the first julian date
+        :param jd1: the last julian date
+        :param mode: the ayanamsa
+        :param degree: the polynomial degree
+        :param intervals: dict of interval lengths (days) by object
+        :return: ChebyshevEphemeris
+        """
+        intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        n = degree + 1
+
+        # Chebyshev nodes and the transform from values to coefficients
+        k = np.arange(n) + 0.5
+        nodes = (np.cos(np.pi * k / n)[::-1] + 1) / 2
+        transform = np.cos(np.pi * np.outer(np.arange(n), k[::-1]) / n) * 2 / n
+        transform[0] /= 2
+
+        ephemeris = cls(jd0, jd1, {}, mode)
+        for obj in objs:
+            if obj == const.SOUTH_NODE:
+                obj = const.NORTH_NODE
+            if obj in ephemeris.segments:
+                continue
+
+            interval = float(intervals.get(obj, DEFAULT_INTERVAL))
+            count = max(int(np.ceil((jd1 - jd0) / interval)), 1)
+            bounds = jd0 + interval * np.arange(count + 1)
+            if obj not in _UNDEFLECTED:
+                bounds = _split_conjunctions(obj, bounds)
+            starts = bounds[:-1]
+            lengths = np.diff(bounds)
+            count = len(starts)
+
+            jds = starts[:, None] + lengths[:, None] * nodes[None, :]
+            samples = swe.positions([obj], jds.ravel(), mode=mode)
+            samples = samples[:, 0, :2].reshape(count, n, 2)
+            samples[..., 0] = np.unwrap(samples[..., 0], period=360, axis=1)
+
+            segment = {
+                'bounds': bounds,
+                'coeffs': np.einsum('ckv,jk->cjv', samples, transform),
+                'error': 0.0,
+            }
+            ephemeris.segments[obj] = segment
+
+            # Measure the error between the nodes
+            check = (starts[:, None] + lengths[:, None] * _CHECKPOINTS).ravel()
+            expected = swe.positions([obj], check, mode=mode)[:, 0, :2]
+            values = ephemeris.positions([obj], check)[:, 0, :2]
+            diff = values - expected
+            diff[:, 0] = vectorized.znorm(diff[:, 0])
+            segment['error'] = float(np.abs(diff).max() * 3600)
+
+        return ephemeris
+
+    # === Queries === #
+
+    def _segment(self, obj, jds):
+        """ Returns the coefficients, the positions within
+        their intervals (-1 to 1) and the interval lengths for
+        an array of dates.
+
+        """
+        segment = self.segments[obj]
+        bounds = segment['bounds']
+        coeffs = segment['coeffs']
+
+        idx = np.searchsorted(bounds, jds, side='right') - 1
+        # The end of the last interval belongs to it
+        idx[jds == bounds[-1]] = len(coeffs) - 1
+        if len(idx) and (idx.min() < 0 or idx.max() >= len(coeffs)):
+            raise ValueError('Julian date outside the fitted range')
+        start = bounds[idx]
+        length = bounds[idx + 1] - start
+        return coeffs[idx], 2 * (jds - start) / length - 1, length
+
+    def positions(self, objs, jds):
+        """
+        Returns the positions of objects for many julian dates.
+        Equivalent to swe.positions with the fitted mode.
+
+        :param objs: the objects
+        :param jds: the julian dates
+        :return: array of shape (len(jds), len(objs), 4) with
+                 lon, lat, lonspeed and latspeed
+        """
+        jds = np.asarray(jds, dtype=np.float64).ravel()
+        result = np.empty((len(jds), len(objs), 4), dtype=np.float64)
+
+        for j, obj in enumerate(objs):
+            ID = const.NORTH_NODE if obj == const.SOUTH_NODE else obj
+            if ID not in self.segments:
+                raise KeyError('Object not fitted: %s' % obj)
+            coeffs, x, length = self._segment(ID, jds)
+            coeffs = np.moveaxis(coeffs, 1, 0)
+            values = chebyshev.chebval(x[:, None], coeffs, tensor=False)
+            speeds = chebyshev.chebval(
+                x[:, None], chebyshev.chebder(coeffs), tensor=False
+            ) * (2 / length)[:, None]
+
+            lon = values[:, 0] + 180 if obj == const.SOUTH_NODE else values[:, 0]
+            result[:, j, 0] = lon % 360
+            result[:, j, 1] = values[:, 1]
+            result[:, j, 2:] = speeds
+
+        return result
+
+    def swe_object(self, obj, jd):
+        """
+        Returns an object for a julian date.
+        Equivalent to swe.swe_object with the fitted mode.
+
+        :param obj: the object
+        :param jd: the julian date
+        :return: swiss ephem object dict
+        """
+        lon, lat, lonspeed, latspeed = self.positions([obj], [jd])[0, 0]
+        return {
+            'id': obj,
+            'lon': float(lon),
+            'lat': float(lat),
+            'lonspeed': float(lonspeed),
+            'latspeed': float(latspeed)
+        }
+
+    # === Serialization === #
+
+    def tobytes(self):
+        """ Serializes to bytes: a fixed header, the metadata
+        as JSON padded to 8 bytes and the float64 coefficients
+        and interval bounds of each body.
+
+        """
+        bodies = []
+        offset = 0
+        for obj, seg in self.segments.items():
+            coeffs = seg['coeffs']
+            bodies.append({
+                'id': obj,
+                'error': seg['error'],
+                'shape': list(coeffs.shape),
+                'offset': offset,
+            })
+            offset += coeffs.size + len(seg['bounds'])
+        meta = json.dumps({
+            'jd0': self.jd0,
+            'jd1': self.jd1,
+            'mode': self.mode,
+            'bodies': bodies,
+        }).encode()
+        meta += b' ' * (-(_HEADER.size + len(meta)) % 8)
+
+        return b''.join(
+            [_HEADER.pack(_MAGIC, len(meta)), meta] + [
+                np.ascontiguousarray(seg[key], dtype='<f8').tobytes()
+                for seg in self.segments.values()
+                for key in ('coeffs', 'bounds')
+            ]
+        )
+
+    @classmethod
+    def frombytes(cls, buffer):
+        """ Loads an ephemeris serialized with tobytes. The
+        coefficients are views over the buffer.
+
+        """
+        view = memoryview(buffer).cast('B')
+        magic, size = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError('Not a serialized Chebyshev ephemeris')
+        meta = json.loads(bytes(view[_HEADER.size:_HEADER.size + size]))
+
+        start = _HEADER.size + size
+        segments = {}
+        for body in meta['bodies']:
+            shape = tuple(body['shape'])
+            size = int(np.prod(shape))
+            offset = start + 8 * body['offset']
+            coeffs = np.frombuffer(
+                view, dtype='<f8', count=size, offset=offset
+            ).reshape(shape)
+            bounds = np.frombuffer(
+                view, dtype='<f8', count=shape[0] + 1, offset=offset + 8 * size
+            )
+            segments[body['id']] = {
+                'bounds': bounds,
+                'coeffs': coeffs,
+                'error': body['error'],
+            }
+        return cls(meta['jd0'], meta['jd1'], segments, meta['mode'])
+
+    def save(self, path):
+        """ Saves the serialized bytes as a uint8 .npy file. """
+        np.save(path, np.frombuffer(self.tobytes(), dtype=np.uint8))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """ Loads a .npy file written by save, memory-mapped
+        by default.
+
+        """
+        data = np.load(path, mmap_mode='r' if mmap else None)
+        return cls.frombytes(data)
+
+
+# === Helpers === #
+
+def _split_conjunctions(obj, bounds):
+    """ Splits the intervals where an object comes within
+    CONJUNCTION_ORB of the Sun into intervals of about
+    CONJUNCTION_INTERVAL days. The elongation is sampled
+    daily, with a margin for the motion between samples.
+
+    """
+    jds = np.arange(bounds[0], bounds[-1] + 1.0)
+    values = swe.positions([const.SUN, obj], jds)
+    lons, speeds = values[..., 0], values[..., 2]
+    elongation = np.abs(vectorized.closestdistance(lons[:, 0], lons[:, 1]))
+    margin = np.abs(speeds[:, 1] - speeds[:, 0]) + 0.1
+    near = jds[elongation - margin < CONJUNCTION_ORB]
+
+    idx = np.searchsorted(bounds, near, side='right') - 1
+    split = np.zeros(len(bounds) - 1, dtype=bool)
+    split[np.clip(idx, 0, len(split) - 1)] = True
+    if not split.any():
+        return bounds
+
+    res = []
+    for start, end, sub in zip(bounds[:-1], bounds[1:], split.tolist()):
+        count = int(np.ceil((end - start) / CONJUNCTION_INTERVAL)) if sub else 1
+        res.append(np.linspace(start, end, count + 1)[:-1])
+    res.append(bounds[-1:])
+    return np.concatenate(res)
@@ -14,6 +14,7 @@
 
 from . import swe
 from . import tools
+from .fixedstars import get_catalog
 from flatlib import angle
 from flatlib import const
 
@@ -67,9 +68,38 @@ def getHouses(jd, lat, lon, hsys):
 
 def getFixedStar(ID, jd):
     """ Returns a fixed star. """
-    star = swe.sweFixedStar(ID, jd)
-    _signInfo(star)
-    return star
+    return getFixedStarList([ID], jd)[0]
+
+
+def getFixedStarList(IDs, jd):
+    """ Returns a list of fixed stars from the catalog,
+    which computes all positions at once.
+
+    """
+    stars = get_catalog().get_stars(IDs, jd)
+    for star in stars:
+        _signInfo(star)
+    return stars
+
+
+def get_fixed_star_conjunctions(lons, jd, IDs=None, orb=None):
+    """
+    Returns the fixed stars within orb of a list of
+    longitudes.
+
+    :param lons: the longitudes
+    :param jd: the julian day (UT)
+    :param IDs: the stars to consider (default: all stars
+                of the catalog)
+    :param orb: a fixed orb, or None to use the orbs by
+                magnitude of FixedStar.orb
+    :return: list of (star, index of lon, distance) tuples,
+             sorted by the absolute distance
+    """
+    res = get_catalog().conjunctions(lons, jd, IDs, orb)
+    for star, _, _ in res:
+        _signInfo(star)
+    return res
 
 
 # === Solar returns === #
@@ -105,7 +135,7 @@ def lastSunset(jd, lat, lon):
 # === Stations === #
 
 def nextStation(ID, jd):
-    """ Returns the aproximate jd of the next station. """
+    """ Returns the jd of the next station. """
     return tools.nextStationJD(ID, jd)
 
 
@@ -167,6 +197,49 @@ def get_object(obj, jd, lat=None, lon=None, alt=None, mode=None):
     return eph_obj
 
 
+def get_objects_batch(objs, jd, lat=None, lon=None, alt=None, mode=None):
+    """
+    Returns a list of objects for a specific date and location.
+    The ephemeris settings are applied once and all swiss
+    ephemeris bodies are computed together. The South Node
+    is derived from the North Node.
+    - If lat/lon/alt values are set, it returns the topocentric position
+    - If mode is set, returns sidereal positions for the given mode
+
+    :param objs: the objects
+    :param jd: the julian date
+    :param lat: the latitude in degrees
+    :param lon: the longitude in degrees
+    :param alt: the altitude above msl in meters
+    :param mode: the ayanamsa
+    :return: list of dictionaries
+    """
+    swe_ids = [obj for obj in objs if obj in swe.SWE_OBJECTS]
+    if const.SOUTH_NODE in objs and const.NORTH_NODE not in swe_ids:
+        swe_ids.append(const.NORTH_NODE)
+    computed = {
+        eph_obj['id']: eph_obj
+        for eph_obj in swe.swe_objects(swe_ids, jd, lat, lon, alt, mode)
+    }
+
+    result = []
+    for obj in objs:
+        if obj in computed:
+            eph_obj = computed[obj]
+        elif obj == const.SOUTH_NODE:
+            eph_obj = dict(computed[const.NORTH_NODE])
+            eph_obj.update({
+                'id': const.SOUTH_NODE,
+                'lon': angle.norm(eph_obj['lon'] + 180)
+            })
+        else:
+            result.append(get_object(obj, jd, lat, lon, alt, mode))
+            continue
+        _signInfo(eph_obj)
+        result.append(eph_obj)
+    return result
+
+
 def get_houses(jd, lat, lon, hsys, mode=None):
     """
     Returns a list of house and angle cusps.
@@ -16,11 +16,13 @@
 from . import eph
 from . import swe
 
+from flatlib import const
 from flatlib.datetime import Datetime
 from flatlib.object import (GenericObject, Object, 
                             House, FixedStar)
-from flatlib.lists import (GenericList, ObjectList, 
+from flatlib.lists import (GenericList, ArrayList, ObjectList, 
                            HouseList, FixedStarList)
+from flatlib.arrays import GenericArray, ObjectArray, HouseArray
 
 
 # === Objects === #
@@ -68,8 +70,9 @@ def get_objects(objs, date, pos, alt=None, mode=None):
     :return: ObjectList
     """
 
-    objects = [get_object(obj, date, pos, alt, mode) for obj in objs]
-    return ObjectList(objects)
+    obj_values = eph.get_objects_batch(objs, date.jd, pos.lat, pos.lon, alt, mode)
+    array = ObjectArray.fromDicts(obj_values, const.OBJ_PLANET)
+    return ObjectList.fromArray(array)
 
 
 # === Houses and angles === #
@@ -110,9 +113,9 @@ def get_houses(date, pos, hsys, mode=None):
     """
 
     houses, angles = eph.get_houses(date.jd, pos.lat, pos.lon, hsys, mode)
-    house_list = [House.fromDict(house) for house in houses]
-    angle_list = [GenericObject.fromDict(angle) for angle in angles]
-    return HouseList(house_list), GenericList(angle_list)
+    house_array = HouseArray.fromDicts(houses, const.OBJ_HOUSE)
+    angle_array = GenericArray.fromDicts(angles, const.OBJ_GENERIC)
+    return HouseList.fromArray(house_array), ArrayList.fromArray(angle_array)
 
 
 # === Fixed stars === #
@@ -124,8 +127,31 @@ def getFixedStar(ID, date):
 
 def getFixedStarList(IDs, date):
     """ Returns a list of fixed stars. """
-    starList = [getFixedStar(ID, date) for ID in IDs]
-    return FixedStarList(starList)
+    starList = eph.getFixedStarList(IDs, date.jd)
+    return FixedStarList([FixedStar.fromDict(star) for star in starList])
+
+
+def get_fixed_star_conjunctions(objects, date, IDs=None, orb=None):
+    """
+    Returns the fixed stars conjunct to a list of objects.
+
+    :param objects: the objects, such as the chart objects
+    :param date: flatlib.datetime.Datetime
+    :param IDs: the stars to consider (default: all stars
+                of the catalog)
+    :param orb: a fixed orb, or None to use the orbs by
+                magnitude of FixedStar.orb
+    :return: list of (FixedStar, object, distance) tuples,
+             sorted by the absolute distance
+    """
+    objects = list(objects)
+    res = eph.get_fixed_star_conjunctions(
+        [obj.lon for obj in objects], date.jd, IDs, orb
+    )
+    return [
+        (FixedStar.fromDict(star), objects[i], dist)
+        for star, i, dist in res
+    ]
 
 
 # === Solar returns === #
@@ -167,7 +193,7 @@ def lastSunset(date, pos):
 # === Station === #
 
 def nextStation(ID, date):
-    """ Returns the aproximate date of the next station. """
+    """ Returns the date of the next station. """
     jd = eph.nextStation(ID, date.jd)
     return Datetime.fromJD(jd, date.utcoffset)
 
@@ -0,0 +1,330 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+
+
+    This module implements a catalog of fixed stars which
+    is read once from the fixstars.cat file into NumPy
+    arrays.
+
+    The positions of all stars for a date are computed with
+    array operations: proper motion and precession from
+    J2000 (IAU 2006), followed by nutation and the annual
+    aberration. The parallax, radial velocity and light
+    deflection are ignored, which keeps the positions
+    within a second of arc of swisseph.fixstar2_ut.
+
+    The proper motions in right ascension of the catalog
+    are measured on the great circle, in time seconds per
+    century.
+
+"""
+
+import os
+
+import numpy as np
+import swisseph
+
+from flatlib import vectorized
+from flatlib.object import FixedStar
+from .session import SESSION
+
+
+# The name of the catalog in the ephemeris path
+CATALOG_FILE = 'fixstars.cat'
+
+# Constants
+_J2000 = 2451545.0
+_B1950 = 2433282.42345905
+_ARCSEC = np.pi / 648000
+_ABERRATION = 20.49552 * _ARCSEC
+
+
+# ------------------ #
+#    Precession      #
+# ------------------ #
+
+def _polynomial(coeffs, T):
+    """ Evaluates a polynomial of T in arc-seconds. """
+    return np.polyval(coeffs[::-1], T) * _ARCSEC
+
+
+def precession_matrix(T):
+    """
+    Returns the IAU 2006 precession matrix from the mean
+    equator and equinox of J2000 to the ones of date.
+
+    :param T: Julian centuries (TT) since J2000
+    :return: 3x3 rotation matrix
+    """
+    zeta = _polynomial([2.650545, 2306.083227, 0.2988499,
+                        0.01801828, -0.000005971, -0.0000003173], T)
+    z = _polynomial([-2.650545, 2306.077181, 1.0927348,
+                     0.01826837, -0.000028596, -0.0000002904], T)
+    theta = _polynomial([0, 2004.191903, -0.4294934,
+                         -0.04182264, -0.000007089, -0.0000001274], T)
+    cz, sz = np.cos(zeta), np.sin(zeta)
+    cZ, sZ = np.cos(z), np.sin(z)
+    ct, st = np.cos(theta), np.sin(theta)
+    return np.array([
+        [cz * ct * cZ - sz * sZ, -sz * ct * cZ - cz * sZ, -st * cZ],
+        [cz * ct * sZ + sz * cZ, -sz * ct * sZ + cz * cZ, -st * sZ],
+        [cz * st, -sz * st, ct]
+    ])
+
+
+# ------------------ #
+#    Star Catalog    #
+# ------------------ #
+
+class StarCatalog:
+    """ This class represents the fixed stars of a catalog.
+
+    Positions are kept at the epoch and equinox of J2000
+    as radians, and proper motions in radians per Julian
+    century. Stars are found by their traditional name or
+    by their nomenclature name with a leading comma, as in
+    swisseph (e.g. 'Aldebaran' or ',alTau').
+
+    """
+
+    def __init__(self, names, nomenclature, ra, dec, pmra, pmdec, mag):
+        self.names = list(names)
+        self.nomenclature = list(nomenclature)
+        self.ra = ra
+        self.dec = dec
+        self.pmra = pmra
+        self.pmdec = pmdec
+        self.mag = mag
+
+        # The first record of a name wins, like in swisseph
+        self.index = {}
+        for i, (name, nom) in enumerate(zip(self.names, self.nomenclature)):
+            if name:
+                self.index.setdefault(name.lower(), i)
+            if nom:
+                self.index.setdefault(',' + nom.lower(), i)
+
+    @classmethod
+    def fromFile(cls, path):
+        """ Reads a catalog in the format of fixstars.cat. """
+        records = []
+        with open(path, encoding='latin-1') as file:
+            for line in file:
+                fields = [field.strip() for field in line.split(',')]
+                if line.startswith('#') or len(fields) < 14:
+                    continue
+                records.append(fields)
+
+        names = [r[0] for r in records]
+        nomenclature = [r[1] for r in records]
+        values = np.array(
+            [[_float(v) for v in r[3:11] + r[13:14]] for r in records],
+            dtype=np.float64
+        ).reshape(len(records), 9)
+        h, m, s, d, dm, ds, pmra, pmdec, mag = values.T
+
+        # Negative zero degrees are only marked by the sign
+        sign = np.array([-1.0 if r[6].startswith('-') else 1.0
+                         for r in records])
+        ra = np.radians((h + m / 60 + s / 3600) * 15)
+        dec = np.radians(sign * (np.abs(d) + dm / 60 + ds / 3600))
+        pmra = pmra * 15 * _ARCSEC
+        pmdec = pmdec * _ARCSEC
+
+        # Stars of the equinox 1950 are precessed to J2000
+        fk4 = np.array([r[2] == '1950' for r in records])
+        if fk4.any():
+            T = (_B1950 - _J2000) / 36525
+            vec = _vectors(ra[fk4], dec[fk4]) @ precession_matrix(T)
+            ra[fk4], dec[fk4] = _spherical(vec)
+
+        return cls(names, nomenclature, ra, dec, pmra, pmdec, mag)
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, ID):
+        """ Returns the row of a star. """
+        try:
+            return self.index[ID.strip().lower()]
+        except KeyError:
+            raise KeyError('Unknown fixed star: %s' % ID) from None
+
+    def ids(self):
+        """ Returns an id for each star, which is its name or
+        its nomenclature name if it has none.
+
+        """
+        return [name or ',' + nom
+                for name, nom in zip(self.names, self.nomenclature)]
+
+    # === Positions === #
+
+    def positions(self, jd, IDs=None):
+        """
+        Returns the apparent ecliptic positions of stars
+        for a date, referred to the true equinox of date.
+
+        :param jd: the julian day (UT)
+        :param IDs: the stars (default: all)
+        :return: (lon, lat) arrays in degrees
+        """
+        if IDs is None:
+            return self._positions(jd, slice(None))
+        rows = [self.find(ID) for ID in IDs]
+        return self._positions(jd, rows)
+
+    def _positions(self, jd, rows):
+        """ Returns the positions of the stars in rows. """
+        with SESSION:
+            SESSION.ensure_path()
+            T = (jd + swisseph.deltat(jd) - _J2000) / 36525
+            meanEps, dpsi = swisseph.calc_ut(jd, swisseph.ECL_NUT)[0][1:3]
+            sun = swisseph.calc_ut(jd, swisseph.SUN)[0][0]
+
+        # Proper motion and precession to the mean equator of date
+        vec = _moved(self.ra[rows], self.dec[rows],
+                     self.pmra[rows] * T, self.pmdec[rows] * T)
+        x, y, z = (vec @ precession_matrix(T).T).T
+
+        # Mean ecliptic of date
+        meanEps = np.radians(meanEps)
+        ce, se = np.cos(meanEps), np.sin(meanEps)
+        lon = np.arctan2(y * ce + z * se, x)
+        lat = np.arcsin(np.clip(z * ce - y * se, -1, 1))
+
+        # Annual aberration
+        sunDist = np.radians(sun) - lon
+        lon = lon - _ABERRATION * np.cos(sunDist) / np.cos(lat)
+        lat = lat - _ABERRATION * np.sin(sunDist) * np.sin(lat)
+
+        # Nutation in longitude
+        lon = (np.degrees(lon) + dpsi) % 360
+        return lon, np.degrees(lat)
+
+    def get_stars(self, IDs, jd):
+        """ Returns the properties of a list of stars for a
+        date, as swe.sweFixedStar.
+
+        """
+        rows = [self.find(ID) for ID in IDs]
+        lon, lat = self._positions(jd, rows)
+        return [
+            {'id': ID, 'mag': mag, 'lon': lo, 'lat': la}
+            for ID, mag, lo, la in zip(
+                IDs, self.mag[rows].tolist(), lon.tolist(), lat.tolist()
+            )
+        ]
+
+    def get_star(self, ID, jd):
+        """ Returns the properties of a star for a date. """
+        return self.get_stars([ID], jd)[0]
+
+    # === Conjunctions === #
+
+    def orbs(self, rows=slice(None)):
+        """ Returns the orbs of stars by magnitude, as
+        FixedStar.orb.
+
+        """
+        mags, orbs = zip(*FixedStar._ORBS)
+        orbs = np.array(orbs + (0.5,))
+        return orbs[np.searchsorted(mags, self.mag[rows], side='right')]
+
+    def conjunctions(self, lons, jd, IDs=None, orb=None):
+        """
+        Returns the stars within orb of a set of longitudes,
+        such as the ones of the objects of a chart.
+
+        :param lons: the longitudes
+        :param jd: the julian day (UT)
+        :param IDs: the stars to consider (default: all)
+        :param orb: a fixed orb, or None to use the orbs
+                    by magnitude
+        :return: list of (star, index of lon, distance)
+                 tuples sorted by the absolute distance, where
+                 the star is a properties dict
+        """
+        if IDs is None:
+            IDs = self.ids()
+            rows = np.arange(len(self))
+        else:
+            rows = np.array([self.find(ID) for ID in IDs], dtype=np.intp)
+        lon, lat = self._positions(jd, rows)
+        lons = np.asarray(lons, dtype=np.float64)
+        dist = vectorized.closestdistance(
+            lon[:, np.newaxis], lons[np.newaxis, :]
+        )
+        if orb is None:
+            orb = self.orbs(rows)[:, np.newaxis]
+        stars, objs = np.nonzero(np.abs(dist) < orb)
+
+        res = []
+        for s, o in zip(stars.tolist(), objs.tolist()):
+            star = {
+                'id': IDs[s],
+                'mag': self.mag.item(rows[s]),
+                'lon': lon.item(s),
+                'lat': lat.item(s)
+            }
+            res.append((star, o, dist.item(s, o)))
+        res.sort(key=lambda item: abs(item[2]))
+        return res
+
+
+# === Helpers === #
+
+def _float(value):
+    """ Converts a catalog field, which may be empty. """
+    return float(value) if value else 0.0
+
+
+def _vectors(ra, dec):
+    """ Returns unit vectors as an (n, 3) array. """
+    cd = np.cos(dec)
+    return np.column_stack([cd * np.cos(ra), cd * np.sin(ra), np.sin(dec)])
+
+
+def _moved(ra, dec, dra, ddec):
+    """ Returns unit vectors moved along the tangents of
+    the sphere, where dra is measured on the great circle
+    and not along the equator.
+
+    """
+    ca, sa = np.cos(ra), np.sin(ra)
+    cd, sd = np.cos(dec), np.sin(dec)
+    vec = np.column_stack([
+        cd * ca - dra * sa - ddec * sd * ca,
+        cd * sa + dra * ca - ddec * sd * sa,
+        sd + ddec * cd
+    ])
+    return vec / np.linalg.norm(vec, axis=1)[:, np.newaxis]
+
+
+def _spherical(vec):
+    """ Returns (ra, dec) of an (n, 3) array of vectors. """
+    ra = np.arctan2(vec[:, 1], vec[:, 0]) % (2 * np.pi)
+    dec = np.arcsin(np.clip(vec[:, 2], -1, 1))
+    return ra, dec
+
+
+# === Catalog cache === #
+
+_catalogs = {}
+
+
+def get_catalog(path=None):
+    """
+    Returns the catalog of fixed stars, which is read only
+    once per file.
+
+    :param path: the catalog file (default: the one in the
+                 path for the swe files)
+    :return: StarCatalog
+    """
+    if path is None:
+        path = os.path.join(SESSION.path or '', CATALOG_FILE)
+    catalog = _catalogs.get(path)
+    if catalog is None:
+        catalog = _catalogs[path] = StarCatalog.fromFile(path)
+    return catalog
@@ -0,0 +1,221 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+
+
+    This module implements a search for events within
+    a range of julian dates, such as ingresses, stations
+    and exact aspects.
+
+    Events are the times when a function of the object
+    positions crosses zero. The function is sampled with
+    steps as long as a bound on its rate of change allows,
+    since it cannot reach zero sooner. Sign changes are
+    then refined with Brent's method.
+
+"""
+
+from flatlib import angle
+from flatlib import const
+from . import swe
+from . import tools
+
+
+# Upper bounds of the longitude speeds (degrees/day)
+MAX_SPEEDS = {
+    const.SUN: 1.1,
+    const.MOON: 16.0,
+    const.MERCURY: 2.5,
+    const.VENUS: 1.4,
+    const.MARS: 0.9,
+    const.JUPITER: 0.3,
+    const.SATURN: 0.16,
+    const.URANUS: 0.08,
+    const.NEPTUNE: 0.05,
+    const.PLUTO: 0.05,
+    const.CHIRON: 0.18,
+    const.NORTH_NODE: 0.06,
+    const.SOUTH_NODE: 0.06,
+}
+
+# Upper bounds of the longitude accelerations (degrees/day²),
+# away from conjunctions with the Sun where the light
+# deflection affects the speeds (and planets are not
+# stationary).
+MAX_ACCELERATIONS = {
+    const.SUN: 0.001,
+    const.MOON: 0.6,
+    const.MERCURY: 0.24,
+    const.VENUS: 0.05,
+    const.MARS: 0.018,
+    const.JUPITER: 0.0045,
+    const.SATURN: 0.0025,
+    const.URANUS: 0.0012,
+    const.NEPTUNE: 0.0008,
+    const.PLUTO: 0.0008,
+    const.CHIRON: 0.0025,
+    const.NORTH_NODE: 0.00003,
+    const.SOUTH_NODE: 0.00003,
+}
+
+# Divisions of the zodiac for ingresses (degrees)
+SIGN = 30.0
+NAKSHATRA = 360.0 / 27
+PADA = 360.0 / 108
+
+# Shortest sampling step (days). Two crossings closer
+# than this may be missed.
+MIN_STEP = 0.001
+
+
+# === Generic search === #
+
+def find_crossings(func, jd0, jd1, rate, wrap=None, tol=tools.MAX_ERROR_JD,
+                   min_step=MIN_STEP):
+    """
+    Returns the julian dates within [jd0, jd1] when a function
+    crosses zero, and the direction of each crossing.
+
+    :param func: the function of the julian date
+    :param jd0: the first julian date
+    :param jd1: the last julian date
+    :param rate: an upper bound of the rate of change of func per day
+    :param wrap: for functions which wrap around (such as angular
+                 distances in [-180, 180)), the absolute value where
+                 they wrap. Sign changes across the wrap are ignored.
+    :param tol: the tolerance of the crossing dates (days)
+    :param min_step: the shortest sampling step (days)
+    :return: list of (jd, direction) tuples, where direction is 1
+             when func increases and -1 otherwise
+    """
+    result = []
+    a, fa = jd0, func(jd0)
+    if fa == 0:
+        result.append((a, 0))
+
+    while a < jd1:
+        b = min(a + max(abs(fa) / rate, min_step), jd1)
+        fb = func(b)
+        if fa * fb < 0 or (fb == 0 and fa != 0):
+            if wrap is None or abs(fb - fa) < wrap:
+                jd = b if fb == 0 else tools.brent(func, a, b, fa, fb, tol)
+                result.append((jd, 1 if fb > fa else -1))
+        a, fa = b, fb
+
+    return result
+
+
+def _object(ID, jd, mode):
+    """ Returns the swiss ephemeris object. The South Node
+    is derived from the North Node.
+
+    """
+    if ID == const.SOUTH_NODE:
+        obj = swe.swe_object(const.NORTH_NODE, jd, mode=mode)
+        obj['lon'] = angle.norm(obj['lon'] + 180)
+        return obj
+    return swe.swe_object(ID, jd, mode=mode)
+
+
+# === Events === #
+
+def ingresses(ID, jd0, jd1, division=SIGN, mode=None):
+    """
+    Returns the times when an object enters a division of
+    the zodiac, such as signs, nakshatras or padas.
+    - If mode is set, uses sidereal positions for the given mode
+
+    :param ID: the object
+    :param jd0: the first julian date
+    :param jd1: the last julian date
+    :param division: the length of the divisions (degrees)
+    :param mode: the ayanamsa
+    :return: list of dicts with jd, index of the division
+             entered and direction (-1 when retrograde)
+    """
+    half = division / 2
+    count = int(round(360 / division))
+
+    def func(jd):
+        lon = _object(ID, jd, mode)['lon']
+        return (lon + half) % division - half
+
+    events = []
+    crossings = find_crossings(func, jd0, jd1, MAX_SPEEDS[ID], wrap=half)
+    for jd, direction in crossings:
+        lon = _object(ID, jd, mode)['lon']
+        boundary = int(round(lon / division))
+        index = boundary if direction >= 0 else boundary - 1
+        events.append({
+            'id': ID,
+            'jd': jd,
+            'lon': (boundary * division) % 360,
+            'index': index % count,
+            'direction': direction,
+        })
+    return events
+
+
+def stations(ID, jd0, jd1, mode=None):
+    """
+    Returns the stations of an object.
+    - If mode is set, uses sidereal positions for the given mode
+
+    :param ID: the object
+    :param jd0: the first julian date
+    :param jd1: the last julian date
+    :param mode: the ayanamsa
+    :return: list of dicts with jd, lon and the motion after
+             the station (const.DIRECT or const.RETROGRADE)
+    """
+    def func(jd):
+        return _object(ID, jd, mode)['lonspeed']
+
+    events = []
+    crossings = find_crossings(func, jd0, jd1, MAX_ACCELERATIONS[ID])
+    for jd, direction in crossings:
+        events.append({
+            'id': ID,
+            'jd': jd,
+            'lon': _object(ID, jd, mode)['lon'],
+            'motion': const.DIRECT if direction > 0 else const.RETROGRADE,
+        })
+    return events
+
+
+def aspects(ID1, ID2, aspect, jd0, jd1, mode=None):
+    """
+    Returns the times when two objects are at an exact aspect.
+    Both separations (ID2 ahead of or behind ID1) are searched.
+    - If mode is set, uses sidereal positions for the given mode
+
+    :param ID1: the first object
+    :param ID2: the second object
+    :param aspect: the aspect angle (degrees)
+    :param jd0: the first julian date
+    :param jd1: the last julian date
+    :param mode: the ayanamsa
+    :return: list of dicts with jd, aspect and separation
+             (the longitude of ID2 minus the longitude of ID1)
+    """
+    rate = MAX_SPEEDS[ID1] + MAX_SPEEDS[ID2]
+    separations = {angle.norm(aspect), angle.norm(-aspect)}
+
+    events = []
+    for separation in sorted(separations):
+
+        def func(jd):
+            lon1 = _object(ID1, jd, mode)['lon']
+            lon2 = _object(ID2, jd, mode)['lon']
+            return angle.closestdistance(lon1 + separation, lon2)
+
+        for jd, direction in find_crossings(func, jd0, jd1, rate, wrap=180):
+            events.append({
+                'id1': ID1,
+                'id2': ID2,
+                'jd': jd,
+                'aspect': aspect,
+                'separation': separation,
+            })
+
+    events.sort(key=lambda event: event['jd'])
+    return events
@@ -0,0 +1,165 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+
+
+    This module implements a session which guards the
+    global state of the Swiss Ephemeris.
+
+    The ephemeris path, the sidereal mode and the topocentric
+    position are settings of the C library. Pyswisseph keeps
+    them in thread-local storage, so a new thread would
+    compute with the Moshier ephemeris and the default
+    ayanamsa.
+
+    The session applies the settings in each thread before
+    it computes, skipping calls which would not change them.
+    Checking the applied settings needs no lock, since they
+    are per thread. The swe module holds the session lock
+    while applying settings and computing positions, which
+    keeps the library calls serialized.
+
+    For asyncio servers, get_executor returns a shared
+    thread or process pool to offload computations.
+
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import swisseph
+
+
+# Marks a thread which has not applied any setting
+_UNSET = object()
+
+
+class EphemerisSession:
+    """ This class serializes access to the state of the
+    Swiss Ephemeris and remembers the settings applied in
+    each thread. It is used as a context manager around a
+    sequence of calls which must not be interleaved with
+    other threads.
+
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.path = None
+        self._local = threading.local()
+
+    def __enter__(self):
+        self.lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.lock.release()
+
+    def _state(self):
+        """ Returns the settings applied in this thread. """
+        local = self._local
+        if getattr(local, 'path', _UNSET) != self.path:
+            if self.path is not None:
+                swisseph.set_ephe_path(self.path)
+            local.path = self.path
+            local.sid_mode = None
+            local.topo = None
+        return local
+
+    def ensure_path(self):
+        """ Applies the path for the swe files in this thread. """
+        self._state()
+
+    def set_sid_mode(self, sid_mode):
+        """ Applies a swiss ephemeris sidereal mode, unless it
+        is already applied in this thread.
+
+        """
+        local = self._state()
+        if sid_mode != local.sid_mode:
+            with self.lock:
+                swisseph.set_sid_mode(sid_mode, 0, 0)
+            local.sid_mode = sid_mode
+
+    def set_topo(self, lat, lon, alt):
+        """ Applies a topocentric position, unless it is
+        already applied in this thread.
+
+        """
+        topo = (lat, lon, alt)
+        local = self._state()
+        if topo != local.topo:
+            with self.lock:
+                swisseph.set_topo(lat, lon, alt)
+            local.topo = topo
+
+    def set_path(self, path):
+        """ Sets the path for the swe files. Other threads
+        apply it before their next computation.
+
+        """
+        with self.lock:
+            self.path = path
+            self._state()
+
+    def reset(self):
+        """ Forgets the settings applied in this thread, so
+        they are applied again on the next computation. Use
+        it after calling pyswisseph directly.
+
+        """
+        self._local.__dict__.clear()
+
+
+# The Swiss Ephemeris state is process-wide, and so is the session
+SESSION = EphemerisSession()
+
+
+# === Executors === #
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _init_process(path):
+    """ Initializes the ephemeris of a worker process. """
+    if path:
+        SESSION.set_path(path)
+
+
+def get_executor(kind='thread', max_workers=None):
+    """
+    Returns a shared executor for ephemeris computations,
+    such as for loop.run_in_executor in asyncio servers.
+    - 'thread' workers are serialized by the session lock
+      while computing positions
+    - 'process' workers have their own ephemeris state and
+      compute in parallel
+
+    :param kind: 'thread' or 'process'
+    :param max_workers: the number of workers (only used when
+                        the executor is first created)
+    :return: concurrent.futures.Executor
+    """
+    with _executors_lock:
+        if kind not in _executors:
+            if kind == 'thread':
+                executor = ThreadPoolExecutor(
+                    max_workers, thread_name_prefix='flatlib-ephem'
+                )
+            elif kind == 'process':
+                executor = ProcessPoolExecutor(
+                    max_workers, initializer=_init_process,
+                    initargs=(SESSION.path,)
+                )
+            else:
+                raise ValueError('Unknown executor kind: %s' % kind)
+            _executors[kind] = executor
+        return _executors[kind]
+
+
+def shutdown_executors(wait=True):
+    """ Shuts down the shared executors. """
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
@@ -11,9 +11,14 @@
   
 """
 
+from functools import lru_cache
+
+import numpy as np
 import swisseph
 from flatlib import angle
 from flatlib import const
+from .fixedstars import get_catalog
+from .session import SESSION
 
 
 # Map objects
@@ -82,7 +87,111 @@ SEFLG_SIDEREAL = 64 * 1024
 
 def setPath(path):
     """ Sets the path for the swe files. """
-    swisseph.set_ephe_path(path)
+    SESSION.set_path(path)
+    clear_cache()
+
+
+# === Ephemeris cache === #
+
+# Memoized calc_ut and houses functions, when the cache is enabled
+_cached_calc = None
+_cached_houses = None
+
+
+def _calc(jd, swe_obj, flags, mode=None, topo=None):
+    """ Computes an object with the swiss ephemeris. The mode
+    and topo arguments only key the cache, since the sidereal
+    and topocentric settings must already be applied.
+
+    """
+    SESSION.ensure_path()
+    return swisseph.calc_ut(jd, swe_obj, flags)[0]
+
+
+def _houses(jd, lat, lon, hsys, flags=None, mode=None):
+    """ Computes house cusps and angles with the swiss ephemeris.
+    If flags is None, the tropical swisseph.houses is used.
+
+    """
+    SESSION.ensure_path()
+    if flags is None:
+        return swisseph.houses(jd, lat, lon, hsys)
+    return swisseph.houses_ex(jd, lat, lon, hsys, flags)
+
+
+def enable_cache(maxsize=4096):
+    """
+    Enables memoization of object and house computations.
+    Results are keyed by object, julian date, flags, ayanamsa
+    and topocentric position. Each of the two caches keeps
+    up to maxsize entries, discarding the least recently used.
+
+    :param maxsize: the maximum number of entries per cache
+    """
+    global _cached_calc, _cached_houses
+    _cached_calc = lru_cache(maxsize=maxsize)(_calc)
+    _cached_houses = lru_cache(maxsize=maxsize)(_houses)
+
+
+def disable_cache():
+    """ Disables and discards the ephemeris cache. """
+    global _cached_calc, _cached_houses
+    _cached_calc = None
+    _cached_houses = None
+
+
+def clear_cache():
+    """ Discards the cached entries and resets the counters. """
+    if _cached_calc is not None:
+        _cached_calc.cache_clear()
+        _cached_houses.cache_clear()
+
+
+def cache_info():
+    """
+    Returns the cache counters, or None if the cache is disabled.
+
+    :return: dict with hits, misses, size and maxsize
+    """
+    if _cached_calc is None:
+        return None
+    calc = _cached_calc.cache_info()
+    houses = _cached_houses.cache_info()
+    return {
+        'hits': calc.hits + houses.hits,
+        'misses': calc.misses + houses.misses,
+        'size': calc.currsize + houses.currsize,
+        'maxsize': calc.maxsize,
+    }
+
+
+def calc_ut(jd, swe_obj, flags=SEFLG_SWIEPH + SEFLG_SPEED, mode=None,
+            topo=None):
+    """
+    Returns the swiss ephemeris values of an object, from the
+    cache when it is enabled. The sidereal and topocentric
+    settings must already be applied (see swe_flags).
+
+    :param jd: the julian date
+    :param swe_obj: the swiss ephemeris object number
+    :param flags: the swiss ephemeris flags
+    :param mode: the ayanamsa, if flags include SEFLG_SIDEREAL
+    :param topo: the (lat, lon, alt) tuple, if flags include SEFLG_TOPOCTR
+    :return: tuple of lon, lat, dist, lonspeed, latspeed, distspeed
+    """
+    if _cached_calc is None:
+        return _calc(jd, swe_obj, flags)
+    return _cached_calc(jd, swe_obj, flags, mode, topo)
+
+
+def calc_houses(jd, lat, lon, hsys, flags=None, mode=None):
+    """ Returns the swiss ephemeris house cusps and angles, from
+    the cache when it is enabled.
+
+    """
+    if _cached_houses is None:
+        return _houses(jd, lat, lon, hsys, flags)
+    return _cached_houses(jd, lat, lon, hsys, flags, mode)
 
 
 # === Object functions === #
@@ -90,7 +199,7 @@ def setPath(path):
 def sweObject(obj, jd):
     """ Returns an object from the Ephemeris. """
     sweObj = SWE_OBJECTS[obj]
-    sweList, flg = swisseph.calc_ut(jd, sweObj)
+    sweList = calc_ut(jd, sweObj)
     return {
         'id': obj,
         'lon': sweList[0],
@@ -103,7 +212,7 @@ def sweObject(obj, jd):
 def sweObjectLon(obj, jd):
     """ Returns the longitude of an object. """
     sweObj = SWE_OBJECTS[obj]
-    sweList, flg = swisseph.calc_ut(jd, sweObj)
+    sweList = calc_ut(jd, sweObj)
     return sweList[0]
 
 
@@ -114,6 +223,7 @@ def sweNextTransit(obj, jd, lat, lon, flag):
     """
     sweObj = SWE_OBJECTS[obj]
     flag = swisseph.CALC_RISE if flag == 'RISE' else swisseph.CALC_SET
+    SESSION.ensure_path()
     trans = swisseph.rise_trans(jd, sweObj, lon, lat, 0, 0, 0, flag)
     return trans[1][0]
 
@@ -123,7 +233,7 @@ def sweNextTransit(obj, jd, lat, lon, flag):
 def sweHouses(jd, lat, lon, hsys):
     """ Returns lists of houses and angles. """
     hsys = SWE_HOUSESYS[hsys]
-    hlist, ascmc = swisseph.houses(jd, lat, lon, hsys)
+    hlist, ascmc = calc_houses(jd, lat, lon, hsys)
     # Add first house to the end of 'hlist' so that we
     # can compute house sizes with an iterator 
     hlist += (hlist[0],)
@@ -146,7 +256,7 @@ def sweHouses(jd, lat, lon, hsys):
 def sweHousesLon(jd, lat, lon, hsys):
     """ Returns lists with house and angle longitudes. """
     hsys = SWE_HOUSESYS[hsys]
-    hlist, ascmc = swisseph.houses(jd, lat, lon, hsys)
+    hlist, ascmc = calc_houses(jd, lat, lon, hsys)
     angles = [
         ascmc[0],
         ascmc[1],
@@ -158,14 +268,16 @@ def sweHousesLon(jd, lat, lon, hsys):
 
 # === Fixed stars === #
 
-# Beware: the swisseph.fixstar_mag function is really 
-# slow because it parses the fixstars.cat file every 
-# time..
+# The swisseph.fixstar_mag function is really slow
+# because it parses the fixstars.cat file every time, so
+# magnitudes are taken from the fixedstars catalog.
 
 def sweFixedStar(star, jd):
     """ Returns a fixed star from the Ephemeris. """
+    SESSION.ensure_path()
     sweList, stnam, flg = swisseph.fixstar2_ut(star, jd)
-    mag = swisseph.fixstar2_mag(star)
+    catalog = get_catalog()
+    mag = catalog.mag.item(catalog.find(star))
     return {
         'id': star, 
         'mag': mag,
@@ -179,6 +291,7 @@ def sweFixedStar(star, jd):
 def solarEclipseGlobal(jd, backward):
     """ Returns the jd details of previous or next global solar eclipse. """
 
+    SESSION.ensure_path()
     sweList = swisseph.sol_eclipse_when_glob(jd, backward=backward)
     return {
         'maximum': sweList[1][0],
@@ -194,6 +307,7 @@ def solarEclipseGlobal(jd, backward):
 def lunarEclipseGlobal(jd, backward):
     """ Returns the jd details of previous or next global lunar eclipse. """
 
+    SESSION.ensure_path()
     sweList = swisseph.lun_eclipse_when(jd, backward=backward)
     return {
         'maximum': sweList[1][0],
@@ -213,43 +327,77 @@ def get_ayanamsa(jd, mode):
     Returns the distance of the tropical vernal point
     from the sidereal zero point of the zodiac.
     """
-    eph_mode = SWE_AYANAMSAS[mode]
-    swisseph.set_sid_mode(eph_mode, 0, 0)
-    return swisseph.get_ayanamsa_ut(jd)
+    with SESSION:
+        SESSION.set_sid_mode(SWE_AYANAMSAS[mode])
+        return swisseph.get_ayanamsa_ut(jd)
 
 
 # === Sidereal and topocentric functions == #
 
-def swe_object(obj, jd, lat=None, lon=None, alt=None, mode=None):
+def swe_flags(lat=None, lon=None, alt=None, mode=None):
     """
-    Returns an object from the swiss ephemeris.
-    - If lat/lon/alt values are set, it returns the topocentric position
-    - If mode is set, returns sidereal positions for the given mode
+    Applies the topocentric and sidereal settings to the
+    swiss ephemeris and returns the computation flags.
+    - If lat/lon/alt values are set, topocentric positions are used
+    - If mode is set, sidereal positions are used for the given mode
+
+    Computations with the flags must hold the session lock,
+    otherwise another thread may change the settings.
 
-    :param obj: the object
-    :param jd: the julian date
     :param lat: the latitude in degrees
     :param lon: the longitude in degrees
     :param alt: the altitude above msl in meters
     :param mode: the ayanamsa
-    :return: swiss ephem object dict
+    :return: swiss ephem flags
     """
-    swe_obj = SWE_OBJECTS[obj]
+    SESSION.ensure_path()
     flags = SEFLG_SWIEPH + SEFLG_SPEED
 
     # Use topocentric positions
     if lat and lon and alt:
-        swisseph.set_topo(lat, lon, alt)
+        SESSION.set_topo(lat, lon, alt)
         flags += SEFLG_TOPOCTR
 
     # Use sidereal zodiac
     if mode:
-        eph_mode = SWE_AYANAMSAS[mode]
-        swisseph.set_sid_mode(eph_mode, 0, 0)
+        SESSION.set_sid_mode(SWE_AYANAMSAS[mode])
         flags += SEFLG_SIDEREAL
 
+    return flags
+
+
+def _cache_state(flags, lat, lon, alt, mode):
+    """ Returns the ayanamsa and topocentric position which
+    apply to the flags, as cache keys.
+
+    """
+    return (
+        mode if flags & SEFLG_SIDEREAL else None,
+        (lat, lon, alt) if flags & SEFLG_TOPOCTR else None
+    )
+
+
+def swe_object(obj, jd, lat=None, lon=None, alt=None, mode=None):
+    """
+    Returns an object from the swiss ephemeris.
+    - If lat/lon/alt values are set, it returns the topocentric position
+    - If mode is set, returns sidereal positions for the given mode
+
+    :param obj: the object
+    :param jd: the julian date
+    :param lat: the latitude in degrees
+    :param lon: the longitude in degrees
+    :param alt: the altitude above msl in meters
+    :param mode: the ayanamsa
+    :return: swiss ephem object dict
+    """
+    swe_obj = SWE_OBJECTS[obj]
+
     # Compute and return positions
-    swelist, flg = swisseph.calc_ut(jd, swe_obj, flags)
+    with SESSION:
+        flags = swe_flags(lat, lon, alt, mode)
+        state = _cache_state(flags, lat, lon, alt, mode)
+        swelist = calc_ut(jd, swe_obj, flags, *state)
     return {
         'id': obj,
         'lon': swelist[0],
@@ -259,6 +407,76 @@ def swe_object(obj, jd, lat=None, lon=None, alt=None, mode=None):
     }
 
 
+def swe_objects(objs, jd, lat=None, lon=None, alt=None, mode=None):
+    """
+    Returns a list of objects from the swiss ephemeris.
+    The topocentric and sidereal settings are applied once
+    for all objects.
+
+    :param objs: the objects
+    :param jd: the julian date
+    :param lat: the latitude in degrees
+    :param lon: the longitude in degrees
+    :param alt: the altitude above msl in meters
+    :param mode: the ayanamsa
+    :return: list of swiss ephem object dicts
+    """
+    result = []
+    with SESSION:
+        flags = swe_flags(lat, lon, alt, mode)
+        state = _cache_state(flags, lat, lon, alt, mode)
+        for obj in objs:
+            swelist = calc_ut(jd, SWE_OBJECTS[obj], flags, *state)
+            result.append({
+                'id': obj,
+                'lon': swelist[0],
+                'lat': swelist[1],
+                'lonspeed': swelist[3],
+                'latspeed': swelist[4]
+            })
+    return result
+
+
+def positions(objs, jds, lat=None, lon=None, alt=None, mode=None):
+    """
+    Returns the positions of objects for many julian dates.
+    The topocentric and sidereal settings are applied once
+    and no object dicts are built. The South Node is derived
+    from the North Node.
+
+    :param objs: the objects
+    :param jds: the julian dates
+    :param lat: the latitude in degrees
+    :param lon: the longitude in degrees
+    :param alt: the altitude above msl in meters
+    :param mode: the ayanamsa
+    :return: array of shape (len(jds), len(objs), 4) with
+             lon, lat, lonspeed and latspeed
+    """
+    jds = np.asarray(jds, dtype=np.float64).ravel()
+    result = np.empty((len(jds), len(objs), 4), dtype=np.float64)
+
+    south = [i for i, obj in enumerate(objs) if obj == const.SOUTH_NODE]
+    swe_ids = [
+        SWE_OBJECTS[const.NORTH_NODE if obj == const.SOUTH_NODE else obj]
+        for obj in objs
+    ]
+
+    # Time sweeps rarely repeat dates, so they bypass the cache
+    swe_calc = swisseph.calc_ut
+    with SESSION:
+        flags = swe_flags(lat, lon, alt, mode)
+        for i, jd in enumerate(jds.tolist()):
+            row = result[i]
+            for j, swe_obj in enumerate(swe_ids):
+                swelist, flg = swe_calc(jd, swe_obj, flags)
+                row[j] = (swelist[0], swelist[1], swelist[3], swelist[4])
+
+    if south:
+        result[:, south, 0] = (result[:, south, 0] + 180) % 360
+    return result
+
+
 def swe_houses_lon(jd, lat, lon, hsys, mode=None):
     """
     Returns the longitudes of houses and angles cusps.
@@ -274,14 +492,14 @@ def swe_houses_lon(jd, lat, lon, hsys, mode=None):
     swe_hsys = SWE_HOUSESYS[hsys]
     flags = SEFLG_SWIEPH + SEFLG_SPEED
 
-    # Use sidereal zodiac
-    if mode:
-        eph_mode = SWE_AYANAMSAS[mode]
-        swisseph.set_sid_mode(eph_mode, 0, 0)
-        flags = SEFLG_SIDEREAL
+    with SESSION:
+        # Use sidereal zodiac
+        if mode:
+            SESSION.set_sid_mode(SWE_AYANAMSAS[mode])
+            flags = SEFLG_SIDEREAL
 
-    # Compute house cusps and angles
-    cusps, ascmc = swisseph.houses_ex(jd, lat, lon, swe_hsys, flags)
+        # Compute house cusps and angles
+        cusps, ascmc = calc_houses(jd, lat, lon, swe_hsys, flags, mode)
     angles = [
         ascmc[0],
         ascmc[1],
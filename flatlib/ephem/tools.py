@@ -17,6 +17,9 @@ from flatlib import utils
 # One arc-second error for iterative algorithms
 MAX_ERROR = 0.0003
 
+# About a second error (in days) for root finding on time
+MAX_ERROR_JD = 1e-5
+
 
 # === Object positions === #
 
@@ -51,9 +54,83 @@ def isDiurnal(jd, lat, lon):
     return utils.isAboveHorizon(ra, decl, mcRA, lat)
     
 
+# === Root finding === #
+
+def brent(func, a, b, fa=None, fb=None, tol=MAX_ERROR_JD, maxiter=100):
+    """ Finds a root of 'func' within the bracket [a, b] with
+    Brent's method, which combines inverse quadratic and
+    secant steps with bisection. The values of 'func' at
+    'a' and 'b' must have different signs.
+    
+    """
+    fa = func(a) if fa is None else fa
+    fb = func(b) if fb is None else fb
+    if fa * fb > 0:
+        raise ValueError('Root is not bracketed')
+    if fa == 0:
+        return a
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = tol / 2
+        m = (c - b) / 2
+        if abs(m) <= tol1 or fb == 0:
+            return b
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # Secant or inverse quadratic interpolation
+            s = fb / fa
+            if a == c:
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else (tol1 if m > 0 else -tol1)
+        fb = func(b)
+    return b
+
+
+def newtonLon(ID, jd, target, tol=MAX_ERROR, maxiter=50):
+    """ Refines the julian date near 'jd' when the object
+    is at longitude 'target' with Newton steps, using the
+    longitude speed returned by the ephemeris.
+    
+    """
+    for _ in range(maxiter):
+        obj = swe.sweObject(ID, jd)
+        dist = angle.closestdistance(obj['lon'], target)
+        if abs(dist) <= tol:
+            break
+        jd = jd + dist / obj['lonspeed']
+    return jd
+
+
 # === Iterative algorithms === #
 
-def syzygyJD(jd):
+def syzygyJD(jd, tol=MAX_ERROR):
     """ Finds the latest new or full moon and
     returns the julian date of that event. 
     
@@ -65,14 +142,19 @@ def syzygyJD(jd):
     # Offset represents the Syzygy type. 
     # Zero is conjunction and 180 is opposition.
     offset = 180 if (dist >= 180) else 0
-    while abs(dist) > MAX_ERROR:
-        jd = jd - dist / 13.1833  # Moon mean daily motion
-        sun = swe.sweObjectLon(const.SUN, jd)
-        moon = swe.sweObjectLon(const.MOON, jd)
-        dist = angle.closestdistance(sun - offset, moon)
+    jd = jd - (dist - offset) / 12.1907  # Mean elongation speed
+
+    # Newton steps on the elongation, using the actual speeds
+    for _ in range(50):
+        sun = swe.sweObject(const.SUN, jd)
+        moon = swe.sweObject(const.MOON, jd)
+        dist = angle.closestdistance(sun['lon'] + offset, moon['lon'])
+        if abs(dist) <= tol:
+            break
+        jd = jd - dist / (moon['lonspeed'] - sun['lonspeed'])
     return jd
 
-def solarReturnJD(jd, lon, forward=True):
+def solarReturnJD(jd, lon, forward=True, tol=MAX_ERROR):
     """ Finds the julian date before or after 
     'jd' when the sun is at longitude 'lon'. 
     It searches forward by default.
@@ -83,25 +165,38 @@ def solarReturnJD(jd, lon, forward=True):
         dist = angle.distance(sun, lon)
     else:
         dist = -angle.distance(lon, sun)
-        
-    while abs(dist) > MAX_ERROR:
-        jd = jd + dist / 0.9833  # Sun mean motion
-        sun = swe.sweObjectLon(const.SUN, jd)
-        dist = angle.closestdistance(sun, lon)
-    return jd
+    jd = jd + dist / 0.9856  # Sun mean motion
+    return newtonLon(const.SUN, jd, lon, tol)
 
 
 # === Other algorithms === #
 
-def nextStationJD(ID, jd):
-    """ Finds the aproximate julian date of the
-    next station of a planet.
+# Sampling steps (days) when bracketing stations. They are
+# shorter than the shortest retrograde or direct motion.
+STATION_STEPS = {
+    const.MERCURY: 4,
+    const.VENUS: 8,
+    const.MARS: 8,
+}
+STATION_STEP = 15
+
+def nextStationJD(ID, jd, tol=MAX_ERROR_JD, maxdays=1000):
+    """ Finds the julian date of the next station of a
+    planet, or None if there is no station within 
+    'maxdays'. The change in the sign of the longitude
+    speed is bracketed by sampling and refined with
+    Brent's method.
 
     """
-    speed = swe.sweObject(ID, jd)['lonspeed']
-    for i in range(2000):
-        nextjd = jd + i / 2
-        nextspeed = swe.sweObject(ID, nextjd)['lonspeed']
-        if speed * nextspeed <= 0:
-            return nextjd
+    def speed(t):
+        return swe.sweObject(ID, t)['lonspeed']
+
+    step = STATION_STEPS.get(ID, STATION_STEP)
+    start, startspeed = jd, speed(jd)
+    while start < jd + maxdays:
+        end = start + step
+        endspeed = speed(end)
+        if startspeed * endspeed <= 0:
+            return brent(speed, start, end, startspeed, endspeed, tol)
+        start, startspeed = end, endspeed
     return None
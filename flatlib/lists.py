@@ -7,11 +7,15 @@
     Astrology Objects, Houses and Fixed Stars.
     
     It is basically a wrapper around a native dict with 
-    useful augmentations.
+    useful augmentations. Lists of objects and houses are
+    backed by arrays (see flatlib.arrays) and hold views.
 
 """
 
+import numpy as np
+
 from . import aspects
+from .arrays import GenericArray, ObjectArray, HouseArray, HouseIndex
 
 
 
@@ -48,21 +52,106 @@ class GenericList:
         values = [obj.copy() for obj in self]
         return GenericList(values)
     
+    def move(self, offset):
+        """ Moves all objects of this list by an offset. """
+        for obj in self:
+            obj.relocate(obj.lon + offset)
+    
     def __iter__(self):
         """ Returns an iterator to this list. """
         return self.content.values().__iter__()
 
 
+# ---------------- #
+#    Array List    #
+# ---------------- #
+
+class ArrayList(GenericList):
+    """ This class represents a list backed by an array of
+    the item values. Its items are views of the array, so
+    copies are array copies and moves are array additions.
+    Views are only built when the items are accessed.
+    
+    A list built from objects holds those objects, as the
+    GenericList does, and has no array of its own.
+    
+    """
+    
+    ARRAY = GenericArray
+    
+    def __init__(self, values=[]):
+        """ Builds the list from a list of objects. """
+        super().__init__(values)
+        self._array = None
+    
+    @classmethod
+    def fromArray(cls, array):
+        """ Builds the list from an array, without copying. """
+        obj = cls.__new__(cls)
+        obj._array = array
+        obj._content = None
+        return obj
+    
+    @property
+    def array(self):
+        """ Returns the array of this list. For a list built
+        from objects, it is a snapshot of their values which
+        is built on each access.
+        
+        """
+        if self._array is None:
+            return self.ARRAY.fromObjects(self._content.values())
+        return self._array
+    
+    @property
+    def content(self):
+        """ Returns the dict of objects, by id. """
+        if self._content is None:
+            array = self._array
+            self._content = dict(zip(array.ids, array.views()))
+        return self._content
+    
+    @content.setter
+    def content(self, value):
+        self._content = value
+    
+    def add(self, obj):
+        """ Adds an object to this list. """
+        if self._array is None:
+            self._content[obj.id] = obj
+            return
+        i = self._array.add(obj)
+        if self._content is not None:
+            self._content[obj.id] = self._array.view(i)
+    
+    def copy(self):
+        """ Returns a deep copy of this list. """
+        if self._array is None:
+            return self.fromArray(self.ARRAY.fromObjects(self))
+        return self.fromArray(self._array.copy())
+    
+    def move(self, offset):
+        """ Moves all objects of this list by an offset. """
+        if self._array is None:
+            super().move(offset)
+        else:
+            self._array.move(offset)
+
+
 # ---------------- #
 #    Object List   #
 # ---------------- #
 
-class ObjectList(GenericList):
+class ObjectList(ArrayList):
     """ Implements a list of astrology objects. """
     
+    ARRAY = ObjectArray
+    
     def getObjectsInHouse(self, house):
         """ Returns a list with all objects in a house. """
-        res = [obj for obj in self if house.hasObject(obj)]
+        objs = list(self)
+        inHouse = house.inHouse(np.array([obj.lon for obj in objs]))
+        res = [obj for obj, inside in zip(objs, inHouse) if inside]
         return ObjectList(res)
     
     def getObjectsAspecting(self, point, aspList):
@@ -70,10 +159,12 @@ class ObjectList(GenericList):
         considering a list of possible aspects.
         
         """
-        res = []
-        for obj in self:
-            if obj.isPlanet() and aspects.isAspecting(obj, point, aspList):
-                res.append(obj)
+        objs = list(self)
+        matrix = aspects.aspect_matrix(objs + [point], aspList)
+        aspecting = (matrix.startIndex[:-1, -1] >= 0) & \
+            (matrix.startOrb[:-1, -1] < matrix.orbs[:-1])
+        res = [obj for obj, asp in zip(objs, aspecting)
+               if asp and obj.isPlanet() and obj is not point]
         return ObjectList(res)
 
 
@@ -81,19 +172,71 @@ class ObjectList(GenericList):
 #    House List    #
 # ---------------- #
 
-class HouseList(GenericList):
+class HouseList(ArrayList):
     """ Implements a list of houses. """
     
+    ARRAY = HouseArray
+    
+    # The index, the house ids of its rows and the key
+    # of the houses it was built from
+    _index = None
+    
+    def _houseIndex(self):
+        """ Returns the index and the ids of its rows. The
+        key is the array version or, for a list built from
+        houses, their values.
+        
+        """
+        array = self._array
+        if array is None:
+            houses = list(self.content.values())
+            key = [(house.id, house.lon, house.size) for house in houses]
+        else:
+            key = (array, array.version)
+        if self._index is None or self._index[2] != key:
+            if array is None:
+                index = HouseIndex([house.lon for house in houses],
+                                   [house.size for house in houses])
+                ids = [house.id for house in houses]
+            else:
+                index = HouseIndex.fromArrays([array])
+                ids = list(array.ids)
+            self._index = (index, ids, key)
+        return self._index[:2]
+    
+    def getHouseIndex(self):
+        """ Returns the index of the houses sorted by cusp,
+        which is rebuilt only when the houses change.
+        
+        """
+        return self._houseIndex()[0]
+    
+    def getHousesByLon(self, lons):
+        """ Returns the houses of a list of longitudes, with
+        None for a longitude outside all houses.
+        
+        """
+        index, ids = self._houseIndex()
+        rows = index.locate(np.asarray(lons, dtype=np.float64))
+        return [self.get(ids[row]) if row >= 0 else None
+                for row in rows.tolist()]
+    
     def getHouseByLon(self, lon):
         """ Returns a house given a longitude. """
-        for house in self:
-            if house.inHouse(lon):
-                return house
-        return None
+        index, ids = self._houseIndex()
+        row = index.find(lon)
+        return self.get(ids[row]) if row >= 0 else None
     
     def getObjectHouse(self, obj):
         """ Returns the house where an object is located. """
         return self.getHouseByLon(obj.lon)
+    
+    def getObjectHouses(self, objs):
+        """ Returns the houses where a list of objects are
+        located.
+        
+        """
+        return self.getHousesByLon([obj.lon for obj in objs])
 
 
 # ----------------- #
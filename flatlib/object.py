@@ -15,6 +15,9 @@ from . import utils
 from . import props
 
 
+# Attribute names of each class, collected from the slots
+_SLOTS = {}
+
 
 # ------------------ #
 #   Generic Object   #
@@ -25,8 +28,13 @@ class GenericObject:
     includes properties which are common to all 
     objects on a chart.
     
+    Attributes are kept in slots, so instances are small
+    and fast to build and copy.
+    
     """
     
+    __slots__ = ('id', 'type', 'lon', 'lat', 'sign', 'signlon')
+    
     def __init__(self):
         self.id = const.NO_PLANET
         self.type = const.OBJ_GENERIC
@@ -39,12 +47,29 @@ class GenericObject:
     def fromDict(cls, _dict):
         """ Builds instance from dictionary of properties. """
         obj = cls()
-        obj.__dict__.update(_dict)
+        for key, value in _dict.items():
+            setattr(obj, key, value)
         return obj
     
+    @classmethod
+    def slots(cls):
+        """ Returns the names of the attributes of this class. """
+        names = _SLOTS.get(cls)
+        if names is None:
+            names = _SLOTS[cls] = tuple(
+                name for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get('__slots__', ())
+                if not name.startswith('_')
+            )
+        return names
+    
+    def toDict(self):
+        """ Returns a dictionary with the properties of this object. """
+        return {name: getattr(self, name) for name in self.slots()}
+    
     def copy(self):
         """ Returns a deep copy of this object. """
-        return self.fromDict(self.__dict__)
+        return self.fromDict(self.toDict())
     
     def __str__(self):
         return '<%s %s %s>' % (
@@ -105,6 +130,8 @@ class Object(GenericObject):
     
     """
     
+    __slots__ = ('lonspeed', 'latspeed')
+    
     def __init__(self):
         super().__init__()
         self.type = const.OBJ_PLANET
@@ -181,6 +208,8 @@ class House(GenericObject):
     # The traditional house offset
     _OFFSET = -5.0
     
+    __slots__ = ('size',)
+    
     def __init__(self):
         super().__init__()
         self.type = const.OBJ_HOUSE
@@ -233,6 +262,8 @@ class House(GenericObject):
 class FixedStar(GenericObject):
     """ This class represents a generic fixed star. """
     
+    __slots__ = ('mag',)
+    
     def __init__(self):
         super().__init__()
         self.type = const.OBJ_FIXED_STAR
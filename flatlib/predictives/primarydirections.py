@@ -14,9 +14,12 @@
     
 """
 
+import numpy as np
+
 from flatlib import angle
 from flatlib import utils
 from flatlib import const
+from flatlib import vectorized
 from flatlib.dignities import tables
 
 
@@ -58,6 +61,31 @@ def arc(pRA, pDecl, sRA, sDecl, mcRA, lat):
     # needed to reach the significator
     return (pPropDist - sPropDist) * (pArc / 2.0)
 
+def arcs(pRA, pDecl, sRA, sDecl, mcRA, lat):
+    """ Returns the arcs of direction between promissors
+    and significators given as arrays, which are broadcast
+    together. It is the array counterpart of arc.
+    
+    """
+    pDArc, pNArc = vectorized.dnarcs(pDecl, lat)
+    sDArc, sNArc = vectorized.dnarcs(sDecl, lat)
+    
+    # Use the MC and diurnal arcs above the horizon, and
+    # the IC and nocturnal arcs below
+    above = vectorized.isAboveHorizon(sRA, sDecl, mcRA, lat)
+    mdRA = np.where(above, mcRA, angle.norm(mcRA + 180))
+    sArc = np.where(above, sDArc, sNArc)
+    pArc = np.where(above, pDArc, pNArc)
+    
+    # Promissor should be after significator (in degrees)
+    pDist = vectorized.closestdistance(mdRA, pRA)
+    sDist = vectorized.closestdistance(mdRA, sRA)
+    pDist = np.where(pDist < sDist, pDist + 360, pDist)
+    
+    sPropDist = sDist / (sArc / 2.0)
+    pPropDist = pDist / (pArc / 2.0)
+    return (pPropDist - sPropDist) * (pArc / 2.0)
+
 def getArc(prom, sig, mc, pos, zerolat):
     """ Returns the arc of direction between a promissor
     and a significator. Arguments are also the MC, the
@@ -172,27 +200,24 @@ class PrimaryDirections:
         
     def D(self, ID, asp):
         """ Returns the dexter aspect of an object. """
-        obj = self.chart.getObject(ID).copy()
-        obj.relocate(obj.lon - asp)
+        obj = self.chart.getObject(ID)
         ID = 'D_%s_%s' % (ID, asp)
-        return self.G(ID, obj.lat, obj.lon)
+        return self.G(ID, obj.lat, angle.norm(obj.lon - asp))
         
     def S(self, ID, asp):
         """ Returns the sinister aspect of an object. """
-        obj = self.chart.getObject(ID).copy()
-        obj.relocate(obj.lon + asp)
+        obj = self.chart.getObject(ID)
         ID = 'S_%s_%s' % (ID, asp)
-        return self.G(ID, obj.lat, obj.lon)
+        return self.G(ID, obj.lat, angle.norm(obj.lon + asp))
         
     def N(self, ID, asp=0):
         """ Returns the conjunction or opposition aspect 
         of an object. 
         
         """
-        obj = self.chart.get(ID).copy()
-        obj.relocate(obj.lon + asp)
+        obj = self.chart.get(ID)
         ID = 'N_%s_%s' % (ID, asp)
-        return self.G(ID, obj.lat, obj.lon)
+        return self.G(ID, obj.lat, angle.norm(obj.lon + asp))
 
 
     # === Arcs === #
@@ -213,6 +238,18 @@ class PrimaryDirections:
             'arcz': arcz
         }
     
+    def _arcs(self, promissors, significators, ra, decl):
+        """ Computes the arcs between all promissors and
+        significators, using the 'ra' and 'decl' keys.
+        
+        """
+        pRA = np.array([prom[ra] for prom in promissors])
+        pDecl = np.array([prom[decl] for prom in promissors])
+        sRA = np.array([sig[ra] for sig in significators])
+        sDecl = np.array([sig[decl] for sig in significators])
+        return arcs(pRA[:, None], pDecl[:, None], sRA[None, :],
+                    sDecl[None, :], self.mcRA, self.lat)
+    
     def getArc(self, prom, sig):
         """ Returns the arcs between a promissor and
         a significator. Should uses the object creation 
@@ -274,22 +311,23 @@ class PrimaryDirections:
         cantiscias = self._elements(self.SIG_OBJECTS, self.C, [0])
         promissors = objects + terms + antiscias + cantiscias
 
-        # Compute all
+        # Compute all pairs at once
+        arcm = self._arcs(promissors, significators, 'ra', 'decl')
+        arcz = self._arcs(promissors, significators, 'raZ', 'declZ')
+        promIDs = [prom['id'] for prom in promissors]
+        sigIDs = [sig['id'] for sig in significators]
+        same = np.array(promIDs)[:, None] == np.array(sigIDs)[None, :]
+        
         res = []
-        for prom in promissors:
-            for sig in significators:
-                if (prom['id'] == sig['id']):
-                    continue
-                arcs = self._arc(prom, sig)
-                for (x,y) in [('arcm', 'M'), ('arcz', 'Z')]:
-                    arc = arcs[x]
-                    if 0 < arc < self.MAX_ARC:
-                        res.append([
-                            arcs[x],
-                            prom['id'],
-                            sig['id'],
-                            y,
-                        ])
+        for (values, y) in [(arcm, 'M'), (arcz, 'Z')]:
+            valid = (0 < values) & (values < self.MAX_ARC) & ~same
+            for i, j in zip(*np.nonzero(valid)):
+                res.append([
+                    values.item(i, j),
+                    promIDs[i],
+                    sigIDs[j],
+                    y,
+                ])
 
         return sorted(res)
 
@@ -33,12 +33,9 @@ def compute(chart, date, fixedObjects=False):
     
     # Create a copy of the chart and rotate content
     pChart = chart.copy()
-    for obj in pChart.objects:
-        if not fixedObjects:
-            obj.relocate(obj.lon + rotation)
-    for house in pChart.houses:
-        house.relocate(house.lon + rotation)
-    for angle in pChart.angles:
-        angle.relocate(angle.lon + rotation)
+    if not fixedObjects:
+        pChart.objects.move(rotation)
+    pChart.houses.move(rotation)
+    pChart.angles.move(rotation)
         
     return pChart
\ No newline at end of file
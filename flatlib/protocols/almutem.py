@@ -83,9 +83,9 @@ def compute(chart):
         
     # House positions
     row = newRow()
-    for objID in OBJECT_LIST:
-        obj = chart.getObject(objID)
-        house = chart.houses.getObjectHouse(obj)
+    objs = [chart.getObject(objID) for objID in OBJECT_LIST]
+    houses = chart.houses.getObjectHouses(objs)
+    for objID, house in zip(OBJECT_LIST, houses):
         score = HOUSE_SCORES[house.id]
         row[objID]['string'] = '+%s' % score
         row[objID]['score'] = score
@@ -9,8 +9,8 @@
 """
 
 from flatlib import const
-from flatlib import aspects
 from flatlib.dignities import essential
+from flatlib.tools import patterns
 
 
 
@@ -39,9 +39,8 @@ class ChartDynamics:
         dignities of A.
 
         """
-        objA = self.chart.get(idA)
-        objB = self.chart.get(idB)
-        asp = aspects.isAspecting(objB, objA, const.MAJOR_ASPECTS)
+        matrix = self.chart.aspect_matrix(const.MAJOR_ASPECTS)
+        asp = matrix.isAspecting(idB, idA)
         return self.inDignities(idB, idA) if asp else []
     
     def disposits(self, idA, idB):
@@ -71,15 +70,14 @@ class ChartDynamics:
         list of possible aspects. 
         
         """
-        obj = self.chart.getObject(ID)
+        matrix = self.chart.aspect_matrix(aspList)
         res = []
         
         for otherID in const.LIST_SEVEN_PLANETS:
             if ID == otherID:
                 continue
             
-            otherObj = self.chart.getObject(otherID)
-            aspType = aspects.aspectType(obj, otherObj, aspList)
+            aspType = matrix.aspectType(ID, otherID)
             if aspType != const.NO_ASPECT:
                 res.append({
                     'id': otherID,
@@ -101,16 +99,15 @@ class ChartDynamics:
             const.NO_MOVEMENT: []
         }
         
-        objA = self.chart.getObject(ID)
+        matrix = self.chart.aspect_matrix(aspList)
         valid = self.validAspects(ID, aspList)
         for elem in valid:
-            objB = self.chart.getObject(elem['id'])
-            asp = aspects.getAspect(objA, objB, aspList)
-            role = asp.getRole(objA.id)
+            asp = matrix.getAspect(ID, elem['id'])
+            role = asp.getRole(ID)
             if role['inOrb']:
                 movement = role['movement']
                 res[movement].append({
-                    'id': objB.id,
+                    'id': elem['id'],
                     'asp': asp.type,
                     'orb': asp.orb
                 })
@@ -150,3 +147,16 @@ class ChartDynamics:
         applications = asps[const.APPLICATIVE]
         exacts = asps[const.EXACT]
         return len(applications) == 0 and len(exacts) == 0
+
+
+    # === Aspect patterns === #
+
+    def patterns(self, IDs=None):
+        """ Returns the aspect patterns between the chart
+        objects, such as grand trines and T-squares.
+
+        """
+        if IDs is None:
+            IDs = [obj.id for obj in self.chart.objects]
+        matrix = self.chart.aspect_matrix(patterns.PATTERN_ASPECTS)
+        return patterns.find_patterns(matrix, IDs)
@@ -0,0 +1,199 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+
+
+    This module implements the detection of aspect
+    patterns, such as grand trines, T-squares and
+    stelliums.
+
+    The aspects between all objects are taken from an
+    aspect matrix and turned into one adjacency matrix
+    per aspect type. Patterns are found by intersecting
+    the neighbours of the objects of each aspect, so
+    only the configurations which exist are visited.
+
+"""
+
+import numpy as np
+
+from flatlib import const
+
+
+# Pattern types
+GRAND_TRINE = 'Grand Trine'
+T_SQUARE = 'T-Square'
+GRAND_CROSS = 'Grand Cross'
+YOD = 'Yod'
+KITE = 'Kite'
+STELLIUM = 'Stellium'
+
+LIST_PATTERNS = [
+    GRAND_TRINE, T_SQUARE, GRAND_CROSS, YOD, KITE, STELLIUM
+]
+
+# Aspects which make the patterns
+PATTERN_ASPECTS = [
+    const.CONJUNCTION, const.SEXTILE, const.SQUARE,
+    const.TRINE, const.QUINCUNX, const.OPPOSITION
+]
+
+# Minimum number of conjunct objects in a stellium
+STELLIUM_SIZE = 3
+
+
+# ------------------ #
+#   Pattern Class    #
+# ------------------ #
+
+class Pattern:
+    """ This class represents an aspect pattern.
+
+    The members are the ids of the objects, and the
+    aspects are (id1, id2, aspect, orb) tuples. The
+    tightness is the mean orb of the aspects, so lower
+    values are tighter patterns.
+
+    """
+
+    def __init__(self, type, members, aspects):
+        self.type = type
+        self.members = members
+        self.aspects = aspects
+        self.tightness = float(np.mean([asp[3] for asp in aspects]))
+
+    def __str__(self):
+        return '<%s %s %.2f>' % (
+            self.type,
+            ' '.join(self.members),
+            self.tightness
+        )
+
+
+# ------------------ #
+#  Pattern Finding   #
+# ------------------ #
+
+class _Graph:
+    """ Adjacency matrices of the aspects between objects,
+    taken from an aspect matrix.
+
+    """
+
+    def __init__(self, matrix, IDs):
+        idx = np.array([matrix.index[ID] for ID in IDs], dtype=np.intp)
+        types = np.array(matrix.aspList + [const.NO_ASPECT])
+        sub = np.ix_(idx, idx)
+        aspect = types[matrix.pairIndex[sub]]
+        orb = matrix.orb[sub]
+
+        self.IDs = list(IDs)
+        self.adj = {}
+        self.orb = np.where(aspect >= 0, orb, np.inf)
+        self.orb = np.minimum(self.orb, self.orb.T)
+        for asp in PATTERN_ASPECTS:
+            adj = aspect == asp
+            self.adj[asp] = adj | adj.T
+
+    def edges(self, asp):
+        """ Returns the pairs (i, j) with i < j in aspect. """
+        i, j = np.nonzero(np.triu(self.adj[asp], 1))
+        return zip(i.tolist(), j.tolist())
+
+    def common(self, asp, *nodes):
+        """ Returns the objects in aspect to all nodes. """
+        mask = np.logical_and.reduce([self.adj[asp][n] for n in nodes])
+        return np.nonzero(mask)[0].tolist()
+
+    def pattern(self, type, nodes, edges):
+        """ Builds a pattern from nodes and (i, j, asp) edges. """
+        aspects = [
+            (self.IDs[i], self.IDs[j], asp, float(self.orb[i, j]))
+            for i, j, asp in edges
+        ]
+        return Pattern(type, tuple(self.IDs[n] for n in nodes), aspects)
+
+
+def _grandTrines(graph):
+    res = []
+    for a, b in graph.edges(const.TRINE):
+        for c in graph.common(const.TRINE, a, b):
+            if c > b:
+                res.append((a, b, c))
+    return res
+
+
+def find_patterns(matrix, IDs=None, stellium=STELLIUM_SIZE):
+    """
+    Returns the aspect patterns between objects of an
+    aspect matrix. The matrix must be computed with the
+    PATTERN_ASPECTS.
+
+    :param matrix: the aspects.AspectMatrix
+    :param IDs: the objects to consider (default: all)
+    :param stellium: the minimum size of a stellium
+    :return: list of Pattern objects, sorted by type
+             and tightness
+    """
+    if IDs is None:
+        IDs = [obj.id for obj in matrix.objects]
+    graph = _Graph(matrix, IDs)
+    res = []
+
+    # Grand trines and kites
+    trines = _grandTrines(graph)
+    for a, b, c in trines:
+        edges = [(a, b, 120), (a, c, 120), (b, c, 120)]
+        res.append(graph.pattern(GRAND_TRINE, (a, b, c), edges))
+        for x, y, z in [(a, b, c), (b, a, c), (c, a, b)]:
+            for d in graph.common(const.OPPOSITION, x):
+                if d in graph.common(const.SEXTILE, y, z):
+                    kite = edges + [(x, d, 180), (y, d, 60), (z, d, 60)]
+                    res.append(graph.pattern(KITE, (a, b, c, d), kite))
+
+    # T-squares and grand crosses
+    crosses = set()
+    for a, b in graph.edges(const.OPPOSITION):
+        apexes = graph.common(const.SQUARE, a, b)
+        for c in apexes:
+            edges = [(a, b, 180), (a, c, 90), (b, c, 90)]
+            res.append(graph.pattern(T_SQUARE, (a, b, c), edges))
+            for d in graph.common(const.OPPOSITION, c):
+                if d in apexes:
+                    crosses.add(frozenset([a, b, c, d]))
+    for cross in crosses:
+        nodes = sorted(cross)
+        edges = [
+            (i, j, asp) for n, i in enumerate(nodes) for j in nodes[n+1:]
+            for asp in [90, 180] if graph.adj[asp][i, j]
+        ]
+        res.append(graph.pattern(GRAND_CROSS, tuple(nodes), edges))
+
+    # Yods
+    for a, b in graph.edges(const.SEXTILE):
+        for c in graph.common(const.QUINCUNX, a, b):
+            edges = [(a, b, 60), (a, c, 150), (b, c, 150)]
+            res.append(graph.pattern(YOD, (a, b, c), edges))
+
+    # Stelliums are the groups of objects linked by conjunctions
+    adj = graph.adj[const.CONJUNCTION]
+    seen = set()
+    for start in range(len(graph.IDs)):
+        if start in seen:
+            continue
+        group, stack = set(), [start]
+        while stack:
+            n = stack.pop()
+            if n not in group:
+                group.add(n)
+                stack.extend(np.nonzero(adj[n])[0].tolist())
+        seen |= group
+        if len(group) >= stellium:
+            nodes = sorted(group)
+            edges = [
+                (i, j, 0) for n, i in enumerate(nodes) for j in nodes[n+1:]
+                if adj[i, j]
+            ]
+            res.append(graph.pattern(STELLIUM, tuple(nodes), edges))
+
+    res.sort(key=lambda p: (LIST_PATTERNS.index(p.type), p.tightness))
+    return res
@@ -0,0 +1,106 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+
+
+    This module provides NumPy counterparts of the angle
+    and utils functions. They accept numbers or arrays,
+    which are broadcast together, and return arrays.
+
+    The semantics are the ones of the scalar functions:
+    norm returns angles in [0, 360) and znorm returns them
+    in (-180, 180], so closestdistance is +180 for opposite
+    points. Where a scalar function would raise a math
+    domain error, such as the ascensional difference of a
+    circumpolar point, the result is NaN.
+
+"""
+
+import numpy as np
+
+
+# === Angular utilities === #
+
+def norm(angle):
+    """ Normalizes angles between 0 and 360. """
+    return np.mod(angle, 360)
+
+
+def znorm(angle):
+    """ Normalizes angles between -180 and 180. """
+    angle = np.mod(angle, 360)
+    return np.where(angle <= 180, angle, angle - 360)
+
+
+def distance(angle1, angle2):
+    """ Angular distances from angle1 to angle2 (ccw). """
+    return norm(np.subtract(angle2, angle1))
+
+
+def closestdistance(angle1, angle2):
+    """ Closest distances from angle1 to angle2 (ccw is
+    positive).
+
+    """
+    return znorm(np.subtract(angle2, angle1))
+
+
+# === Diurnal and nocturnal arcs === #
+
+def ascdiff(decl, lat):
+    """ Returns the Ascensional Difference of points. """
+    delta = np.radians(decl)
+    phi = np.radians(lat)
+    with np.errstate(invalid='ignore'):
+        ad = np.arcsin(np.tan(delta) * np.tan(phi))
+    return np.degrees(ad)
+
+
+def dnarcs(decl, lat):
+    """ Returns the diurnal and nocturnal arcs of points. """
+    dArc = 180 + 2 * ascdiff(decl, lat)
+    nArc = 360 - dArc
+    return (dArc, nArc)
+
+
+# === Above horizon === #
+
+def isAboveHorizon(ra, decl, mcRA, lat):
+    """ Returns if points given by 'ra' and 'decl' are
+    above the horizon at a specific latitude, given the
+    MC's right ascension.
+
+    """
+    dArc, _ = dnarcs(decl, lat)
+    dist = np.abs(closestdistance(mcRA, ra))
+    return dist <= dArc / 2.0 + 0.0003  # 1 arc-second
+
+
+# === Coordinate systems === #
+
+def eqCoords(lon, lat):
+    """ Converts from ecliptical to equatorial coordinates,
+    as utils.eqCoords.
+
+    """
+    lon = np.asarray(lon, dtype=np.float64)
+    _lambda = np.radians(lon)
+    _beta = np.radians(lat)
+    _epson = np.radians(23.44)  # The earth's inclination
+
+    # Declination and Equatorial Distance in radians
+    decl = np.arcsin(np.sin(_epson) * np.sin(_lambda) * np.cos(_beta) +
+                     np.cos(_epson) * np.sin(_beta))
+    ED = np.arccos(np.clip(
+        np.cos(_lambda) * np.cos(_beta) / np.cos(decl), -1, 1
+    ))
+    ra = np.where(lon < 180, ED, 2 * np.pi - ED)
+
+    # Correctness of RA if longitude is close to 0º or 180º
+    near = (np.abs(closestdistance(lon, 0)) < 5) | \
+        (np.abs(closestdistance(lon, 180)) < 5)
+    a = np.sin(ra) * np.cos(decl)
+    b = np.cos(_epson) * np.sin(_lambda) * np.cos(_beta) - \
+        np.sin(_epson) * np.sin(_beta)
+    ra = np.where(near & (np.abs(a - b) > 0.0003), 2 * np.pi - ra, ra)
+
+    return (np.degrees(ra), np.degrees(decl))
@@ -0,0 +1,233 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from flatlib import const
+from flatlib.arrays import HouseIndex, HouseView, ObjectArray, ObjectView
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.ephem import eph
+from flatlib.geopos import GeoPos
+from flatlib.lists import HouseList, ObjectList
+from flatlib.predictives import profections
+from flatlib.object import House, Object
+
+date = Datetime("2015/03/13", "17:00", "+00:00")
+pos = GeoPos("38n32", "8w54")
+chart = Chart(date, pos, IDs=const.LIST_OBJECTS)
+
+
+def test_slots():
+    """Test that objects keep their attributes in slots."""
+    obj = Object.fromDict({"id": const.SUN, "lon": 10.0, "lonspeed": 1.0})
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.house = 1
+    assert obj.copy().toDict() == obj.toDict()
+    assert obj.toDict()["type"] == const.OBJ_PLANET
+    assert "size" in House.slots()
+
+
+def test_views_match_ephemeris():
+    """Test that the views read the ephemeris values."""
+    values = eph.get_objects_batch(const.LIST_OBJECTS, date.jd, pos.lat, pos.lon)
+    for expected in values:
+        obj = chart.getObject(expected["id"])
+        assert isinstance(obj, ObjectView)
+        assert {key: getattr(obj, key) for key in expected} == expected
+    assert isinstance(chart.getHouse(const.HOUSE1), HouseView)
+    assert np.array_equal(chart.objects.array.lon, [obj.lon for obj in chart.objects])
+
+
+def test_views_write_arrays():
+    """Test that relocating a view updates the array, and copies are independent."""
+    copy = chart.copy()
+    sun = copy.getObject(const.SUN)
+    sun.relocate(sun.lon + 40)
+    row = copy.objects.array.index[const.SUN]
+    assert copy.objects.array.lon[row] == sun.lon
+    assert sun.signlon == pytest.approx(sun.lon % 30)
+    assert sun.sign == const.LIST_SIGNS[int(sun.lon // 30)]
+    assert chart.getObject(const.SUN).lon != sun.lon
+
+    detached = sun.copy()
+    assert type(detached) is Object
+    detached.relocate(0)
+    assert sun.lon != 0
+
+
+def test_array_relocate():
+    """Test vectorized relocation of a whole array."""
+    array = chart.objects.array.copy()
+    array.relocate(array.lon + 350)
+    assert np.allclose(array.column("signlon"), array.lon % 30)
+    assert np.all((array.lon >= 0) & (array.lon < 360))
+
+
+def test_list_add_and_filter():
+    """Test adding objects to and filtering an array-backed list."""
+    objects = ObjectList([chart.getObject(const.SUN).copy()])
+    objects.add(chart.getObject(const.MOON))
+    objects.add(Object.fromDict({"id": const.SUN, "lon": 5.0}))
+    assert [obj.id for obj in objects] == [const.SUN, const.MOON]
+    assert objects.get(const.SUN).lon == 5.0
+    assert len(objects.array) == 2
+
+    house = chart.getHouse(const.HOUSE1)
+    inside = chart.objects.getObjectsInHouse(house)
+    assert isinstance(inside.array, ObjectArray)
+    assert all(house.hasObject(obj) for obj in inside)
+
+
+def test_object_list_keeps_objects():
+    """Test that a list built from objects keeps them after reading its array."""
+    objs = [chart.getObject(ID).copy() for ID in (const.SUN, const.MOON)]
+    objects = ObjectList(objs)
+    assert objects.array.lon.tolist() == [obj.lon for obj in objs]
+    objects.move(10)
+    objs[0].relocate(123.0)
+    assert objects.array.lon.tolist() == [obj.lon for obj in objs]
+
+    assert all(obj in objects for obj in objs)
+    assert objects.get(const.SUN) is objs[0] and objs[0].lon == 123.0
+    copy = objects.copy()
+    objs[1].relocate(0.0)
+    assert copy.get(const.MOON).lon != 0.0
+
+
+def test_pickle():
+    """Test that charts backed by arrays can be pickled."""
+    copy = pickle.loads(pickle.dumps(chart))
+    for obj in chart.objects:
+        assert copy.getObject(obj.id).toDict() == obj.toDict()
+    assert copy.getHouse(const.HOUSE1).size == chart.getHouse(const.HOUSE1).size
+
+
+def test_move_matches_relocate():
+    """Test that moving a chart matches relocating each item."""
+    moved = chart.copy()
+    moved.move(-23.5)
+    for original, lst in [
+        (chart.objects, moved.objects),
+        (chart.houses, moved.houses),
+        (chart.angles, moved.angles),
+    ]:
+        for obj in original:
+            expected = obj.copy()
+            expected.relocate(obj.lon - 23.5)
+            assert lst.get(obj.id).toDict() == pytest.approx(expected.toDict())
+
+
+def test_sidereal_zodiac():
+    """Test that the sidereal conversion shifts every item by the ayanamsa."""
+    sidereal = chart.to_sidereal_zodiac(const.AY_LAHIRI)
+    offset = (chart.objects.array.lon - sidereal.objects.array.lon) % 360
+    assert np.allclose(offset, offset[0])
+    assert (
+        sidereal.getAngle(const.ASC).sign
+        == const.LIST_SIGNS[int(sidereal.getAngle(const.ASC).lon // 30)]
+    )
+    assert chart.getObject(const.SUN).sign == const.PISCES
+
+
+@pytest.mark.parametrize("fixed", [False, True])
+def test_profections(fixed):
+    """Test that profected charts rotate by 30 degrees per year."""
+    natal = Chart(date, pos)
+    pchart = profections.compute(
+        natal, Datetime("2025/03/13", "17:00", "+00:00"), fixed
+    )
+    rotation = (pchart.getAngle(const.ASC).lon - natal.getAngle(const.ASC).lon) % 360
+    assert rotation == pytest.approx(300, abs=1)
+    shift = (pchart.objects.array.lon - natal.objects.array.lon) % 360
+    assert np.allclose(shift, 0 if fixed else rotation)
+
+
+def _loop_house(houses, lon):
+    """Returns the first house containing a longitude, as the original lookup."""
+    return next((house for house in houses if house.inHouse(lon)), None)
+
+
+@pytest.mark.parametrize(
+    "hsys", [const.HOUSES_PLACIDUS, const.HOUSES_EQUAL, const.HOUSES_WHOLE_SIGN]
+)
+def test_house_index_matches_loop(hsys):
+    """Test that the house index finds the same houses as House.inHouse."""
+    houses = Chart(date, pos, hsys=hsys).houses
+    lons = np.random.default_rng(0).uniform(-30, 390, 500)
+    # Longitudes at the starts of the houses
+    starts = houses.array.lon + House._OFFSET
+    lons = np.concatenate([lons, starts, starts + 1e-12, starts - 1e-12])
+
+    expected = [_loop_house(houses, lon) for lon in lons.tolist()]
+    assert houses.getHousesByLon(lons.tolist()) == expected
+    assert [houses.getHouseByLon(lon) for lon in lons.tolist()] == expected
+
+    rows = houses.getHouseIndex().locate(lons)
+    assert [houses.array.ids[row] for row in rows] == [h.id for h in expected]
+
+
+def test_house_index_across_charts():
+    """Test that one index of many charts matches the charts' own lookups."""
+    charts = [
+        Chart(Datetime.fromJD(date.jd + i * 0.3, "+00:00"), pos) for i in range(20)
+    ]
+    index = HouseIndex.fromArrays([c.houses.array for c in charts])
+    lons = np.stack([c.objects.array.lon for c in charts])
+
+    rows = index.locate(lons)
+    assert rows.shape == lons.shape
+    for k, (c, crows) in enumerate(zip(charts, rows)):
+        houses = c.houses.getObjectHouses(c.objects)
+        assert [c.houses.array.ids[row] for row in crows] == [h.id for h in houses]
+        assert [index.find(obj.lon, k) for obj in c.objects] == crows.tolist()
+
+
+def test_house_index_follows_houses():
+    """Test that the index is rebuilt when the houses move."""
+    pchart = chart.copy()
+    sun = pchart.getObject(const.SUN)
+    house = pchart.houses.getObjectHouse(sun)
+    index = pchart.houses.getHouseIndex()
+    assert pchart.houses.getHouseIndex() is index
+
+    pchart.houses.move(30)
+    assert pchart.houses.getHouseIndex() is not index
+    assert pchart.houses.getObjectHouse(sun) == _loop_house(pchart.houses, sun.lon)
+    assert pchart.houses.getObjectHouse(sun) is not house
+
+
+def test_house_index_of_house_objects():
+    """Test that a list built from houses returns them and follows their edits."""
+    houses = [house.copy() for house in chart.houses]
+    hlist = HouseList(houses)
+    lon = houses[0].lon + 1.0
+    assert hlist.getHouseByLon(lon) is houses[0]
+    assert hlist.getHousesByLon([lon]) == [houses[0]]
+    assert houses[0] in hlist
+    assert hlist.getHouseIndex() is hlist.getHouseIndex()
+
+    houses[0].size = 0.5
+    assert _loop_house(hlist, lon) is None
+    assert hlist.getHouseByLon(lon) is None
+    assert hlist.getHousesByLon([lon]) == [None]
+    assert all(house in hlist for house in houses)
+
+
+def test_house_index_follows_views():
+    """Test that writes through house views rebuild the index."""
+    pchart = chart.copy()
+    houses = pchart.houses
+    index = houses.getHouseIndex()
+    houses.get(const.HOUSE1).size = 0.5
+    assert houses.getHouseIndex() is not index
+    lon = houses.get(const.HOUSE1).lon + 1.0
+    assert houses.getHouseByLon(lon) is None
+
+
+def test_objects_in_house():
+    """Test that the objects in a house match House.hasObject."""
+    for house in chart.houses:
+        objs = chart.objects.getObjectsInHouse(house)
+        assert list(objs) == [obj for obj in chart.objects if house.hasObject(obj)]
@@ -0,0 +1,70 @@
+import itertools
+
+import pytest
+
+from flatlib import aspects, const
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.geopos import GeoPos
+
+pos = GeoPos("38n32", "8w54")
+charts = [
+    Chart(Datetime(date, "17:00", "+00:00"), pos, IDs=const.LIST_OBJECTS)
+    for date in ["2015/03/13", "1990/01/01", "1975/11/02"]
+]
+
+
+def _properties(aspect):
+    """Returns the properties of an Aspect as a dict."""
+    props = dict(vars(aspect))
+    props["active"] = vars(aspect.active)
+    props["passive"] = vars(aspect.passive)
+    return props
+
+
+@pytest.mark.parametrize("aspList", [const.MAJOR_ASPECTS, const.ALL_ASPECTS, [0], []])
+def test_matrix_matches_pairs(aspList):
+    """Test that the matrix gives the per-pair results for every pair."""
+    for chart in charts:
+        objs = list(chart.objects) + list(chart.angles)
+        matrix = aspects.aspect_matrix(objs, aspList)
+        for obj1, obj2 in itertools.product(objs, objs):
+            assert matrix.isAspecting(obj1.id, obj2.id) == aspects.isAspecting(
+                obj1, obj2, aspList
+            )
+            if not (obj1.isPlanet() or obj2.isPlanet()):
+                continue  # getAspect needs a moving active object
+            assert matrix.aspectType(obj1.id, obj2.id) == aspects.aspectType(
+                obj1, obj2, aspList
+            )
+            assert _properties(matrix.getAspect(obj1.id, obj2.id)) == _properties(
+                aspects.getAspect(obj1, obj2, aspList)
+            )
+
+
+def test_chart_matrix_cache():
+    """Test that the chart matrix is cached until positions change."""
+    chart = charts[0].copy()
+    matrix = chart.aspect_matrix(const.MAJOR_ASPECTS)
+    assert chart.aspect_matrix(const.MAJOR_ASPECTS) is matrix
+    assert chart.aspect_matrix(const.ALL_ASPECTS) is not matrix
+
+    moon = chart.getObject(const.MOON)
+    moon.relocate(chart.getObject(const.SUN).lon + 90.5)
+    updated = chart.aspect_matrix(const.MAJOR_ASPECTS)
+    assert updated is not matrix
+    assert updated.aspectType(const.SUN, const.MOON) == 90
+
+
+def test_objects_aspecting_excludes_point():
+    """Test that an object of the list does not aspect itself."""
+    chart = charts[0]
+    moon = chart.getObject(const.MOON)
+    conjunct = chart.objects.getObjectsAspecting(moon, [0])
+    assert moon not in conjunct
+    expected = [
+        obj
+        for obj in chart.objects
+        if obj is not moon and obj.isPlanet() and aspects.isAspecting(obj, moon, [0])
+    ]
+    assert list(conjunct) == expected
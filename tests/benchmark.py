@@ -0,0 +1,251 @@
+"""
+Dasha benchmark suite.
+
+Measures the dasha path over a fixed corpus of birth data and compares the results
+with a saved JSON baseline. Run from the repository root:
+
+    python -m tests.benchmark --save            # record a baseline
+    python -m tests.benchmark                   # compare, exit 1 on regressions
+    python -m tests.benchmark --threshold 0.10  # allow 10% instead of 25%
+
+Baselines are machine specific: record one before a change and compare after it
+on the same machine.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from vedicastro.VedicAstro import VedicHoroscopeData
+
+from ascendant.dasha import Dasha
+from ascendant.utils import getHouseSystem
+from tests.helpers import format_and_print_table
+
+BASELINE = Path(__file__).parent / "benchmarks" / "dasha.json"
+
+# Allowed slowdown relative to the baseline before a benchmark counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# (year, month, day, hour, minute, latitude, longitude, utc)
+CORPUS: List[Tuple[int, int, int, int, int, float, float, str]] = [
+    (1990, 1, 1, 12, 0, 28.6139, 77.2090, "+5:30"),
+    (1947, 8, 15, 0, 0, 28.6139, 77.2090, "+5:30"),
+    (1969, 7, 20, 20, 17, 40.7128, -74.0060, "-4:00"),
+    (1985, 3, 9, 6, 45, 51.5074, -0.1278, "+0:00"),
+    (2001, 11, 23, 18, 30, -33.8688, 151.2093, "+11:00"),
+    (2012, 6, 30, 4, 10, 35.6762, 139.6503, "+9:00"),
+]
+
+# Number of dates resolved per native by the N-date lookup benchmark
+LOOKUP_DATES = 1000
+
+Benchmark = Callable[[], object]
+
+
+def corpus_horoscopes() -> List[VedicHoroscopeData]:
+    """Builds the horoscopes of the benchmark corpus."""
+    return [
+        VedicHoroscopeData(
+            year=year,
+            month=month,
+            day=day,
+            hour=hour,
+            minute=minute,
+            second=0,
+            utc=utc,
+            latitude=lat,
+            longitude=lng,
+            ayanamsa="Lahiri",
+            house_system=getHouseSystem("whole_sign"),
+        )
+        for year, month, day, hour, minute, lat, lng, utc in CORPUS
+    ]
+
+
+def build_benchmarks() -> Dict[str, Benchmark]:
+    """Returns the benchmarks by name. Setup work is done here, outside the timings."""
+    horoscopes = corpus_horoscopes()
+    dashas = [Dasha(horoscope) for horoscope in horoscopes]
+    lookup_date = datetime(2025, 8, 15)
+    dates = [
+        [
+            datetime(h.year, h.month, h.day) + timedelta(days=40 * i)
+            for i in range(LOOKUP_DATES)
+        ]
+        for h in horoscopes
+    ]
+
+    def timeline_construction():
+        for horoscope in horoscopes:
+            Dasha(horoscope)
+
+    def current_period_lookup():
+        for dasha in dashas:
+            dasha.get_mahadasha_by_index(0, lookup_date)
+            dasha.get_antardasha_by_index(0, lookup_date)
+
+    def n_date_lookup():
+        for dasha, native_dates in zip(dashas, dates):
+            dasha.at(native_dates, depth=3)
+
+    def deep_subperiods():
+        for dasha in dashas:
+            # Drop the cached boundary index so the levels are generated again
+            dasha._boundaries.clear()
+            dasha._boundary_index(5)
+
+    def system_timeline():
+        for dasha in dashas:
+            timeline = dasha.get_system_timeline("vimshottari")
+            for _ in timeline.iter_periods(3):
+                pass
+
+    return {
+        "timeline_construction": timeline_construction,
+        "current_period_lookup": current_period_lookup,
+        "n_date_lookup": n_date_lookup,
+        "deep_subperiods": deep_subperiods,
+        "system_timeline": system_timeline,
+    }
+
+
+def measure(func: Benchmark, rounds: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Times `func` over several rounds. The minimum is the figure compared to baselines."""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "rounds": rounds,
+    }
+
+
+def run(rounds: int = 5, only: List[str] | None = None) -> Dict[str, Dict[str, float]]:
+    """Runs the benchmarks (all, or those named in `only`) and returns their timings."""
+    benchmarks = build_benchmarks()
+    return {
+        name: measure(func, rounds)
+        for name, func in benchmarks.items()
+        if not only or name in only
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Returns the regressions as (name, baseline, current, ratio) tuples.
+
+    A benchmark regresses when its minimum time exceeds the baseline minimum by more
+    than `threshold` (0.25 allows a 25% slowdown). Benchmarks missing from either
+    side are ignored.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]["min"]
+        ratio = result["min"] / base if base > 0 else float("inf")
+        if ratio > 1 + threshold:
+            regressions.append((name, base, result["min"], ratio))
+    return regressions
+
+
+def save_baseline(results: Dict[str, Dict[str, float]], path: Path = BASELINE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "corpus": len(CORPUS),
+        "benchmarks": results,
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def load_baseline(path: Path = BASELINE) -> Dict[str, Dict[str, float]]:
+    return json.loads(path.read_text())["benchmarks"]
+
+
+def test_compare_flags_regressions():
+    """Test that only slowdowns beyond the threshold are reported."""
+    baseline = {"fast": {"min": 1.0}, "slow": {"min": 1.0}, "gone": {"min": 1.0}}
+    results = {"fast": {"min": 1.2}, "slow": {"min": 1.5}, "new": {"min": 9.0}}
+
+    regressions = compare(results, baseline, threshold=0.25)
+    assert [name for name, *_ in regressions] == ["slow"]
+    assert regressions[0][3] == 1.5
+    assert compare(results, baseline, threshold=0.1)[0][0] == "fast"
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the dasha benchmarks")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="save as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="names of benchmarks to run")
+    args = parser.parse_args(argv)
+
+    results = run(args.rounds, args.only)
+    baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name, {}).get("min")
+        change = f"{(result['min'] / base - 1) * 100:+.1f}%" if base else "-"
+        rows.append(
+            [
+                name,
+                f"{result['min'] * 1000:.3f}",
+                f"{result['median'] * 1000:.3f}",
+                f"{base * 1000:.3f}" if base else "-",
+                change,
+            ]
+        )
+    format_and_print_table(
+        ["Benchmark", "Min (ms)", "Median (ms)", "Baseline (ms)", "Change"],
+        rows,
+        f"DASHA BENCHMARKS ({len(CORPUS)} natives)",
+    )
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}, run with --save to record one")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, base, current, ratio in regressions:
+        print(
+            f"[FAIL] {name}: {current * 1000:.3f} ms vs {base * 1000:.3f} ms baseline "
+            f"({(ratio - 1) * 100:+.1f}%, threshold {args.threshold * 100:.0f}%)"
+        )
+    if regressions:
+        return 1
+    print(f"[OK] No regressions beyond {args.threshold * 100:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,20 @@
 import functools
+import json
 import time
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Union
 
-from ascendant.dasha import Dasha
+import numpy as np
+
+from ascendant.const import VIMSHOTTARI_LORDS
+from ascendant.dasha import (
+    DASHA_SYSTEMS,
+    Dasha,
+    DashaArray,
+    DashaSystem,
+    vimshottari_lords,
+)
+from ascendant.utils import JulianDay, dateToJD, parseDate, toJD
 from tests.helpers import format_and_print_table, print_timing_summary
 from tests.horoscope import my_horoscope
 
@@ -304,6 +315,294 @@ def test_get_antardasha_by_index_out_of_range():
     assert result is None or isinstance(result, dict)
 
 
+def test_at_matches_index_lookups():
+    """Test that batched lookups agree with per-date index lookups."""
+    start = datetime.strptime(dasha.dasha[0]["start"], "%d-%m-%Y")
+    dates = [start + timedelta(days=37 * i) for i in range(300)]
+
+    results = dasha.at(dates)
+
+    assert len(results) == len(dates)
+    for date, lords in zip(dates, results):
+        maha = dasha.get_mahadasha_by_index(0, date)
+        antar = dasha.get_antardasha_by_index(0, date)
+        if lords is None:
+            assert antar is None
+            continue
+        assert maha is not None and antar is not None
+        assert lords == (maha["mahadasha"], antar["antardasha"])
+
+
+def test_at_preserves_input_order():
+    """Test that results are aligned with unsorted input dates."""
+    dates = ["01-01-2030", "01-01-1995", "01-01-2010"]
+    results = dasha.at(dates)
+    reversed_results = dasha.at(list(reversed(dates)))
+
+    assert results == list(reversed(reversed_results))
+
+
+def test_at_depth():
+    """Test Mahadasha-only and Pratyantardasha depths."""
+    date = "15-08-2025"
+    maha = dasha.at([date], depth=1)[0]
+    antar = dasha.at([date], depth=2)[0]
+    pratyantar = dasha.at([date], depth=3)[0]
+
+    assert maha is not None and antar is not None and pratyantar is not None
+    assert len(maha) == 1 and len(pratyantar) == 3
+    assert pratyantar[:2] == antar and antar[:1] == maha
+
+
+def test_at_out_of_range():
+    """Test that dates outside the timeline resolve to None."""
+    assert dasha.at(["01-01-1800", "01-01-2300"]) == [None, None]
+
+
+def test_vimshottari_lords_matches_timeline():
+    """Test that the columnar computation agrees with the timeline mid-period."""
+    chart = dasha.__chart__
+    moon = chart.getObject("Moon").lon
+    birth = datetime(
+        my_horoscope.year,
+        my_horoscope.month,
+        my_horoscope.day,
+        my_horoscope.hour,
+        my_horoscope.minute,
+    )
+
+    expected = []
+    targets = []
+    for entry in dasha.dasha:
+        for antardasha in entry["antardashas"]:
+            start = datetime.strptime(antardasha["start"], "%d-%m-%Y")
+            end = datetime.strptime(antardasha["end"], "%d-%m-%Y")
+            middle = start + (end - start) / 2
+            targets.append(chart.date.jd + (middle - birth).total_seconds() / 86400)
+            expected.append((antardasha["mahadasha"], antardasha["antardasha"]))
+
+    count = len(targets)
+    maha, antar = vimshottari_lords(
+        np.full(count, moon), np.full(count, chart.date.jd), target_jd=targets
+    )
+
+    assert maha.dtype == np.uint8 and maha.shape == (count,)
+    actual = [(VIMSHOTTARI_LORDS[m], VIMSHOTTARI_LORDS[a]) for m, a in zip(maha, antar)]
+    assert actual == expected
+
+
+def test_vimshottari_lords_by_age():
+    """Test age-based lookups for a population of natives."""
+    # Moon at 0° Aries starts Ketu's full 7-year Mahadasha at birth
+    maha, antar = vimshottari_lords([0.0, 0.0, 0.0], 2451545.0, age=[0.1, 7.5, 27.1])
+
+    assert [VIMSHOTTARI_LORDS[i] for i in maha] == ["Ketu", "Venus", "Sun"]
+    assert [VIMSHOTTARI_LORDS[i] for i in antar] == ["Ketu", "Venus", "Sun"]
+
+
+def test_vimshottari_lords_before_birth():
+    """Test that dates before the Mahadasha running at birth are rejected."""
+    # Moon at 6°40' Aries is halfway through Ketu's 7-year Mahadasha at birth
+    birth, moon = 2451545.0, 20 / 3
+    maha, _ = vimshottari_lords(moon, birth, age=-3.0)
+    assert VIMSHOTTARI_LORDS[maha] == "Ketu"
+
+    for kwargs in ({"target_jd": birth - 4 * 365.25}, {"age": -4.0}):
+        try:
+            vimshottari_lords(moon, birth, **kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f"Wrapped a date before the first Mahadasha: {kwargs}")
+
+
+def test_dasha_systems_registered():
+    """Test that the built-in dasha systems are registered."""
+    for name in ("vimshottari", "yogini", "ashtottari", "chara"):
+        assert name in DASHA_SYSTEMS
+
+
+def test_dasha_system_requires_start():
+    """Test that a system without a starting rule cannot be built."""
+
+    class Incomplete(DashaSystem):
+        lords = ("A", "B")
+        period_years = (1.0, 2.0)
+
+    try:
+        Incomplete(dasha.__chart__)
+    except TypeError:
+        return
+    raise AssertionError("Built a dasha system without start()")
+
+
+def test_dasha_system_timelines_contiguous():
+    """Test that every system covers the horizon without gaps at each level."""
+    for name in DASHA_SYSTEMS:
+        timeline = dasha.get_system_timeline(name)
+        assert timeline.periods[0].start <= timeline.birth_jd
+        assert timeline.periods[-1].end >= timeline.birth_jd + 120 * 365.25
+
+        for depth in (1, 2):
+            periods = list(timeline.iter_periods(depth))
+            for prev, curr in zip(periods, periods[1:]):
+                assert abs(prev.end - curr.start) < 1e-6, f"Gap in {name}"
+
+
+def test_dasha_system_cycle_lengths():
+    """Test the cycle lengths of the nakshatra-based systems."""
+    assert dasha.get_system_timeline("vimshottari").system.total_years == 120
+    assert dasha.get_system_timeline("yogini").system.total_years == 36
+    assert dasha.get_system_timeline("ashtottari").system.total_years == 108
+
+
+def test_vimshottari_system_matches_timeline():
+    """Test that the engine reproduces the vedicastro Mahadasha sequence."""
+    timeline = dasha.get_system_timeline("vimshottari")
+    expected = [entry["mahadasha"] for entry in dasha.dasha]
+
+    assert [period.lord for period in timeline.periods[: len(expected)]] == expected
+
+
+def test_dasha_system_lookup():
+    """Test that bisect lookups return the enclosing period at each level."""
+    timeline = dasha.get_system_timeline("yogini")
+    jd = timeline.birth_jd + 40 * 365.25
+
+    pratyantar = timeline.at(jd, depth=3)
+    antar = timeline.at(jd, depth=2)
+
+    assert pratyantar is not None and antar is not None
+    assert pratyantar.lords[:2] == antar.lords
+    assert antar.start <= pratyantar.start <= jd < pratyantar.end <= antar.end
+    assert timeline.at(timeline.periods[0].start - 1) is None
+
+
+def test_dasha_system_serialization():
+    """Test the serialized shape of a system timeline."""
+    result = dasha.get_system_timeline("chara").to_list(depth=2)
+
+    assert len(result[0]["subperiods"]) == 12
+    for entry in result:
+        datetime.strptime(entry["start"], "%d-%m-%Y")
+        assert entry["start_jd"] < entry["end_jd"]
+        assert entry["subperiods"][0]["subperiods"] == []
+
+
+def test_dasha_array_roundtrip():
+    """Test that the numeric format rebuilds the timeline exactly."""
+    array = dasha.to_array()
+
+    assert array.lords.dtype == np.uint8 and array.start.dtype == np.float64
+    assert array.to_dashas() == dasha.dasha
+
+
+def test_dasha_array_bytes_zero_copy():
+    """Test that loading from bytes returns views over the buffer."""
+    data = dasha.to_array().tobytes()
+    loaded = DashaArray.frombytes(data)
+
+    assert len(data) < len(json.dumps(dasha.dasha)) / 4
+    assert not loaded.start.flags.owndata and not loaded.lords.flags.owndata
+    assert loaded.to_dashas() == dasha.dasha
+
+
+def test_dasha_array_npy(tmp_path):
+    """Test saving to and memory-mapping from a .npy file."""
+    timeline = dasha.get_system_timeline("yogini")
+    array = DashaArray.from_timeline(timeline, depth=3)
+    path = tmp_path / "timeline.npy"
+    array.save(path)
+
+    loaded = DashaArray.load(path)
+
+    assert loaded.system == "yogini" and loaded.depth == 3
+    assert np.array_equal(loaded.lords, array.lords)
+    assert np.array_equal(loaded.start, array.start)
+    assert np.array_equal(loaded.end, array.end)
+
+
+def test_transitions_between_dates():
+    """Test that transition events are ordered and match the batched lookup."""
+    events = list(dasha.transitions("01-01-2000", "01-01-2030", depth=3))
+
+    assert events
+    assert [e["date"] for e in events] == sorted(e["date"] for e in events)
+    for event in events:
+        assert len(event["lords"]) == event["level"]
+        # Lookups treat period ends as inclusive, so probe just after the change
+        lords = dasha.at([event["date"] + timedelta(seconds=1)], depth=event["level"])
+        assert lords[0] == event["lords"]
+        if event["level"] == 1:
+            assert event["previous"] is not None
+            assert event["previous"] != event["lords"]
+
+
+def test_transitions_levels():
+    """Test that a Mahadasha change also reports the inner levels."""
+    events = list(dasha.transitions("01-01-1900", "01-01-2200", depth=2))
+    maha_dates = {e["date"] for e in events if e["level"] == 1}
+    antar_dates = {e["date"] for e in events if e["level"] == 2}
+
+    # The start of the timeline is reported with no previous period
+    assert len(maha_dates) == len(dasha.dasha)
+    assert maha_dates <= antar_dates
+    assert events[0]["previous"] is None
+
+
+def test_next_transition():
+    """Test next-change lookups at each level."""
+    after = datetime(2025, 8, 15)
+    antar = dasha.next_transition(after=after, level=2)
+    maha = dasha.next_transition(after=after, level=1)
+
+    assert antar is not None and maha is not None
+    assert after < antar["date"].replace(tzinfo=None)
+    assert antar["date"] <= maha["date"]
+    current = dasha.get_antardasha_by_index(1, after)
+    assert current is not None
+    assert antar["lords"] == (current["mahadasha"], current["antardasha"])
+    assert dasha.next_transition(after="01-01-2300") is None
+
+
+def test_date_inputs_agree():
+    """Test that every accepted date form resolves to the same periods."""
+    moment = datetime(2025, 8, 15, 12, 0, tzinfo=timezone.utc)
+    ist = timezone(timedelta(hours=5, minutes=30))
+    inputs = [
+        moment,
+        moment.replace(tzinfo=None),
+        moment.astimezone(ist),
+        "2025-08-15T12:00:00Z",
+        "2025-08-15T17:30:00+05:30",
+        moment.timestamp(),
+        JulianDay(dateToJD(moment)),
+    ]
+
+    expected = dasha.at([moment], depth=3)[0]
+    assert expected is not None
+    assert dasha.at(inputs, depth=3) == [expected] * len(inputs)
+    for date in inputs:
+        current = dasha.get_antardasha_by_index(0, date)
+        assert current is not None
+        assert (current["mahadasha"], current["antardasha"]) == expected[:2]
+
+
+def test_date_string_parsing():
+    """Test that date strings parse to the same UTC moment in every format."""
+    expected = datetime(2031, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+    for text in (
+        "2031-02-03T04:05:06+00:00",
+        "2031-02-03T04:05:06Z",
+        "2031-02-03T09:35:06+05:30",
+        "2031-02-03T04:05:06",
+    ):
+        for _ in range(3):
+            assert parseDate(text) == expected
+            assert toJD(text) == dateToJD(expected)
+    assert parseDate("03-02-2031") == expected.replace(hour=0, minute=0, second=0)
+    assert toJD("03-02-2031") == toJD("2031-02-03")
+
+
 def show_dasha():
     """Display all dasha information for the horoscope"""
     print("\n" + "=" * 70)
@@ -423,6 +722,27 @@ def main():
         ("Get Next Antardasha", test_get_antardasha_by_index_next),
         ("Get Previous Antardasha", test_get_antardasha_by_index_previous),
         ("Get Antardasha Out of Range", test_get_antardasha_by_index_out_of_range),
+        ("Batched Lookup Matches Index", test_at_matches_index_lookups),
+        ("Batched Lookup Order", test_at_preserves_input_order),
+        ("Batched Lookup Depth", test_at_depth),
+        ("Batched Lookup Out of Range", test_at_out_of_range),
+        ("Columnar Lords Match Timeline", test_vimshottari_lords_matches_timeline),
+        ("Columnar Lords by Age", test_vimshottari_lords_by_age),
+        ("Columnar Lords Before Birth", test_vimshottari_lords_before_birth),
+        ("Dasha Systems Registered", test_dasha_systems_registered),
+        ("Dasha System Requires Start", test_dasha_system_requires_start),
+        ("Dasha Systems Contiguous", test_dasha_system_timelines_contiguous),
+        ("Dasha System Cycle Lengths", test_dasha_system_cycle_lengths),
+        ("Vimshottari System Matches", test_vimshottari_system_matches_timeline),
+        ("Dasha System Lookup", test_dasha_system_lookup),
+        ("Dasha System Serialization", test_dasha_system_serialization),
+        ("Dasha Array Roundtrip", test_dasha_array_roundtrip),
+        ("Dasha Array Zero Copy", test_dasha_array_bytes_zero_copy),
+        ("Transitions Between Dates", test_transitions_between_dates),
+        ("Transitions Levels", test_transitions_levels),
+        ("Next Transition", test_next_transition),
+        ("Date Inputs Agree", test_date_inputs_agree),
+        ("Date String Parsing", test_date_string_parsing),
     ]
 
     passed = 0
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from flatlib.datetime import (
+    JULIAN,
+    Datetime,
+    Time,
+    components_from_jd,
+    jd_from_components,
+)
+
+
+@pytest.mark.parametrize(
+    "date, time, offset, calendar",
+    [
+        ((2015, 3, 13), (17, 0, 0), 0, Datetime.GREGORIAN),
+        ((1990, 12, 31), (23, 59, 30), -3, Datetime.GREGORIAN),
+        ((-500, 2, 28), (6, 30, 0), 5.5, Datetime.GREGORIAN),
+        ((1582, 10, 4), (12, 0, 0), 1, JULIAN),
+    ],
+)
+def test_jd_from_components_matches_datetime(date, time, offset, calendar):
+    """Test that the components give the julian day of the Datetime class."""
+    hours = time[0] + time[1] / 60 + time[2] / 3600
+    expected = Datetime(list(date), hours, offset, calendar)
+    jd = jd_from_components(*date, *time, offset, calendar)
+    assert isinstance(jd, float)
+    assert jd == pytest.approx(expected.jd, abs=1e-9)
+
+
+def test_components_round_trip_arrays():
+    """Test that array conversions round trip and match Datetime.fromJD."""
+    jds = 2451545.0 + np.random.default_rng(0).uniform(-1e6, 1e6, 1000)
+    components = components_from_jd(jds, 5.5)
+    assert all(len(c) == len(jds) for c in components)
+    assert np.allclose(jd_from_components(*components, utcoffset=5.5), jds, atol=1e-9)
+
+    for i in range(0, len(jds), 97):
+        expected = Datetime.fromJD(jds[i], "+05:30")
+        year, month, day, hour, minute, second = (c[i] for c in components)
+        assert [year, month, day] == expected.date.date()
+        hours = hour + minute / 60 + second / 3600
+        assert hours == pytest.approx(expected.time.value, abs=1e-6)
+
+
+def test_components_scalar():
+    """Test that a float julian day gives plain numbers."""
+    year, month, day, hour, minute, second = components_from_jd(2457094.5)
+    assert (year, month, day, hour, minute) == (2015, 3, 13, 0, 0)
+    assert isinstance(year, int) and isinstance(second, float)
+
+
+def test_from_jd_at_midnight():
+    """Test that a julian day at midnight starts the next date."""
+    date = Datetime.fromJD(2457094.5, "+00:00")
+    assert date.date.date() == [2015, 3, 13]
+    assert date.time.value == 0
+    assert date.getUTC().date.date() == [2015, 3, 13]
+
+
+@pytest.mark.parametrize("hours", [0, 5.5, -3])
+def test_from_datetime(hours):
+    """Test that python datetimes and timestamps match string Datetimes."""
+    tz = timezone(timedelta(hours=hours))
+    value = datetime(2015, 3, 13, 17, 0, 30, tzinfo=tz)
+    offset = Time(hours)
+    expected = Datetime("2015/03/13", "17:00:30", offset)
+
+    date = Datetime.fromDatetime(value)
+    assert date.jd == pytest.approx(expected.jd, abs=1e-9)
+    assert str(date) == str(expected)
+
+    date = Datetime.fromTimestamp(value.timestamp(), offset)
+    assert date.jd == pytest.approx(expected.jd, abs=1e-9)
+    assert str(date) == str(expected)
+
+
+def test_from_naive_datetime():
+    """Test that naive datetimes are taken as UTC."""
+    date = Datetime.fromDatetime(datetime(2015, 3, 13, 17))
+    assert date.jd == Datetime("2015/03/13", "17:00", "+00:00").jd
+    assert date.utcoffset.value == 0
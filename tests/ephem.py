@@ -0,0 +1,392 @@
+import math
+
+import numpy as np
+import pytest
+
+from flatlib import angle, const, vectorized
+from flatlib.datetime import Datetime
+from flatlib.ephem import chebyshev, eph, ephem, search, session, swe, tools
+from flatlib.ephem.chebyshev import ChebyshevEphemeris
+from flatlib.geopos import GeoPos
+
+date = Datetime("2015/03/13", "17:00", "+00:00")
+pos = GeoPos("38n32", "8w54")
+
+SIDEREAL_MODES = [None, const.AY_LAHIRI, const.AY_KRISHNAMURTI]
+
+
+@pytest.mark.parametrize("mode", SIDEREAL_MODES)
+def test_objects_batch_matches_single(mode):
+    """Test that the batched path returns the same objects as per-object calls."""
+    batch = eph.get_objects_batch(
+        const.LIST_OBJECTS, date.jd, pos.lat, pos.lon, None, mode
+    )
+    assert [obj["id"] for obj in batch] == const.LIST_OBJECTS
+
+    for obj in batch:
+        single = eph.get_object(obj["id"], date.jd, pos.lat, pos.lon, None, mode)
+        assert obj.keys() == single.keys()
+        for key, value in single.items():
+            if isinstance(value, float):
+                assert obj[key] == pytest.approx(value, abs=1e-9), (obj["id"], key)
+            else:
+                assert obj[key] == value
+
+
+def test_objects_batch_topocentric():
+    """Test that the topocentric settings are applied to the whole batch."""
+    ids = [const.MOON, const.SUN, const.SOUTH_NODE]
+    batch = eph.get_objects_batch(ids, date.jd, pos.lat, pos.lon, 100, const.AY_LAHIRI)
+    geocentric = eph.get_objects_batch(ids, date.jd, None, None, None, const.AY_LAHIRI)
+
+    for obj in batch:
+        single = eph.get_object(
+            obj["id"], date.jd, pos.lat, pos.lon, 100, const.AY_LAHIRI
+        )
+        assert obj["lon"] == pytest.approx(single["lon"], abs=1e-9)
+    # The Moon's parallax is close to a degree
+    assert abs(batch[0]["lon"] - geocentric[0]["lon"]) > 0.1
+
+
+def test_south_node_from_north_node():
+    """Test that the South Node is opposite the North Node, even when requested alone."""
+    north, south = eph.get_objects_batch(
+        [const.NORTH_NODE, const.SOUTH_NODE], date.jd, mode=const.AY_LAHIRI
+    )
+    (alone,) = eph.get_objects_batch([const.SOUTH_NODE], date.jd, mode=const.AY_LAHIRI)
+
+    assert south["lon"] == pytest.approx((north["lon"] + 180) % 360)
+    assert south["lonspeed"] == north["lonspeed"]
+    assert alone == south
+    assert south["sign"] == const.LIST_SIGNS[int(south["lon"] / 30)]
+
+
+def test_get_objects_uses_batch():
+    """Test that ephem.get_objects builds the object list from the batch."""
+    objects = ephem.get_objects(
+        const.LIST_OBJECTS_TRADITIONAL, date, pos, mode=const.AY_LAHIRI
+    )
+    for ID in const.LIST_OBJECTS_TRADITIONAL:
+        single = ephem.get_object(ID, date, pos, mode=const.AY_LAHIRI)
+        assert objects.get(ID).lon == pytest.approx(single.lon, abs=1e-9)
+        assert objects.get(ID).sign == single.sign
+
+
+@pytest.mark.parametrize("mode", SIDEREAL_MODES)
+def test_positions_time_series(mode):
+    """Test that the positions array matches per-date objects."""
+    ids = [const.SUN, const.MOON, const.MARS, const.NORTH_NODE, const.SOUTH_NODE]
+    jds = date.jd + np.arange(0, 365, 36.5)
+    result = swe.positions(ids, jds, mode=mode)
+
+    assert result.shape == (len(jds), len(ids), 4)
+    for i, jd in enumerate(jds):
+        for j, obj in enumerate(eph.get_objects_batch(ids, jd, mode=mode)):
+            expected = [obj["lon"], obj["lat"], obj["lonspeed"], obj["latspeed"]]
+            assert result[i, j] == pytest.approx(expected, abs=1e-9)
+
+
+def test_positions_empty():
+    """Test the shapes of empty inputs."""
+    assert swe.positions([const.SUN], []).shape == (0, 1, 4)
+    assert swe.positions([], [date.jd]).shape == (1, 0, 4)
+
+
+def test_chebyshev_positions_within_bound(tmp_path):
+    """Test the Chebyshev backend against the swiss ephemeris, and its file roundtrip."""
+    ids = [
+        const.SUN,
+        const.MOON,
+        const.MERCURY,
+        const.VENUS,
+        const.MARS,
+        const.SATURN,
+        const.SOUTH_NODE,
+    ]
+    jd0 = date.jd
+    # Up to the superior conjunction of Venus in June 2016
+    cheb = ChebyshevEphemeris.build(ids, jd0, jd0 + 460, mode=const.AY_LAHIRI)
+    assert set(cheb.objects) == {
+        const.SUN,
+        const.MOON,
+        const.MERCURY,
+        const.VENUS,
+        const.MARS,
+        const.SATURN,
+        const.NORTH_NODE,
+    }
+
+    jds = jd0 + np.linspace(0, 460, 9201)
+    expected = swe.positions(ids, jds, mode=const.AY_LAHIRI)
+    result = cheb.positions(ids, jds)
+    diff = np.abs(result - expected) * 3600
+    diff[..., 0] = np.abs(vectorized.znorm(result[..., 0] - expected[..., 0])) * 3600
+    assert max(cheb.accuracy.values()) < chebyshev.CONJUNCTION_ACCURACY_BOUND
+
+    # All planets come within the conjunction orb of the Sun here
+    elongation = np.abs(
+        vectorized.closestdistance(expected[:, :1, 0], expected[..., 0])
+    )
+    planet = np.isin(ids, [const.MERCURY, const.VENUS, const.MARS, const.SATURN])
+    near = planet & (elongation < chebyshev.CONJUNCTION_ORB)
+    close = planet & (elongation < chebyshev.CLOSE_CONJUNCTION_ORB)
+    assert np.all(near[:, planet].any(axis=0))
+    lengths = np.diff(cheb.segments[const.VENUS]["bounds"])
+    assert lengths.min() == chebyshev.CONJUNCTION_INTERVAL
+    assert diff[..., 2:][near & ~close].max() < chebyshev.SPEED_ACCURACY_BOUND
+
+    bounds = [
+        (~close, chebyshev.ACCURACY_BOUND, chebyshev.SPEED_ACCURACY_BOUND),
+        (
+            close,
+            chebyshev.CONJUNCTION_ACCURACY_BOUND,
+            chebyshev.CONJUNCTION_SPEED_ACCURACY_BOUND,
+        ),
+    ]
+    for mask, bound, speed_bound in bounds:
+        assert diff[..., :2][mask].max(initial=0) < bound
+        assert diff[..., 2:][mask].max(initial=0) < speed_bound
+
+    single = cheb.swe_object(const.MOON, jds[10])
+    assert single["lon"] == pytest.approx(result[10, 1, 0])
+
+    path = tmp_path / "ephemeris.npy"
+    cheb.save(path)
+    loaded = ChebyshevEphemeris.load(path)
+    assert loaded.mode == const.AY_LAHIRI
+    assert np.array_equal(loaded.positions(ids, jds), result)
+
+    with pytest.raises(ValueError):
+        cheb.positions([const.SUN], [jd0 - 1])
+
+
+@pytest.fixture
+def ephemeris_cache():
+    swe.enable_cache(maxsize=256)
+    yield
+    swe.disable_cache()
+
+
+def test_cache_hits_within_chart(ephemeris_cache):
+    """Test that repeated Sun/Moon/house computations are served from the cache."""
+    swe.disable_cache()
+    uncached = eph.get_objects_batch(const.LIST_OBJECTS, date.jd, pos.lat, pos.lon)
+    swe.enable_cache(maxsize=256)
+
+    cached = eph.get_objects_batch(const.LIST_OBJECTS, date.jd, pos.lat, pos.lon)
+    info = swe.cache_info()
+    assert info["hits"] > 0
+    assert cached == uncached
+
+    eph.get_objects_batch(const.LIST_OBJECTS, date.jd, pos.lat, pos.lon)
+    again = swe.cache_info()
+    assert again["misses"] == info["misses"]
+    assert again["size"] <= again["maxsize"] * 2
+
+
+def test_cache_keys_mode_and_topo(ephemeris_cache):
+    """Test that the ayanamsa and topocentric position key separate entries."""
+    tropical = swe.swe_object(const.MOON, date.jd)
+    lahiri = swe.swe_object(const.MOON, date.jd, mode=const.AY_LAHIRI)
+    kp = swe.swe_object(const.MOON, date.jd, mode=const.AY_KRISHNAMURTI)
+    topo = swe.swe_object(const.MOON, date.jd, pos.lat, pos.lon, 100, const.AY_LAHIRI)
+
+    assert swe.cache_info()["misses"] == 4
+    assert len({tropical["lon"], lahiri["lon"], kp["lon"], topo["lon"]}) == 4
+    assert swe.swe_object(const.MOON, date.jd, mode=const.AY_LAHIRI) == lahiri
+    assert swe.sweObject(const.MOON, date.jd) == tropical
+    assert swe.cache_info()["hits"] == 2
+
+    swe.clear_cache()
+    assert swe.cache_info()["size"] == 0
+
+
+@pytest.fixture
+def calc_calls(monkeypatch):
+    """Counts the ephemeris computations."""
+    calls = []
+    calc_ut = swe.calc_ut
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return calc_ut(*args, **kwargs)
+
+    monkeypatch.setattr(swe, "calc_ut", counting)
+    return calls
+
+
+@pytest.mark.parametrize("forward", [True, False])
+def test_solar_return(calc_calls, forward):
+    """Test that solar returns converge in a few ephemeris calls."""
+    jd = tools.solarReturnJD(date.jd, 123.4, forward)
+    sun = swe.sweObjectLon(const.SUN, jd)
+
+    assert abs(angle.closestdistance(sun, 123.4)) <= tools.MAX_ERROR
+    assert (jd > date.jd) if forward else (jd < date.jd)
+    assert abs(jd - date.jd) < 366
+    assert len(calc_calls) < 10
+
+
+def test_syzygy(calc_calls):
+    """Test that the latest new or full moon is found, with a configurable tolerance."""
+    jd = tools.syzygyJD(date.jd, tol=1e-6)
+    sun = swe.sweObjectLon(const.SUN, jd)
+    moon = swe.sweObjectLon(const.MOON, jd)
+    elongation = angle.distance(sun, moon)
+
+    assert 0 < date.jd - jd < 15.5
+    assert min(elongation, abs(elongation - 180), 360 - elongation) <= 1e-6
+    assert len(calc_calls) < 20
+
+
+@pytest.mark.parametrize("ID", [const.MERCURY, const.VENUS, const.JUPITER])
+def test_next_station(calc_calls, ID):
+    """Test that stations are bracketed and refined in tens of calls."""
+    jd = tools.nextStationJD(ID, date.jd)
+    before = swe.sweObject(ID, jd - 0.01)["lonspeed"]
+    after = swe.sweObject(ID, jd + 0.01)["lonspeed"]
+
+    assert jd > date.jd
+    assert before * after < 0
+    assert len(calc_calls) < 70
+
+
+def test_no_station():
+    """Test that bodies without stations return None."""
+    assert tools.nextStationJD(const.MOON, date.jd, maxdays=100) is None
+
+
+def test_find_crossings_generic():
+    """Test the generic search on a known function."""
+    crossings = search.find_crossings(math.sin, 0.5, 10, rate=1)
+    assert [jd for jd, _ in crossings] == pytest.approx(
+        [math.pi, 2 * math.pi, 3 * math.pi], abs=1e-5
+    )
+    assert [direction for _, direction in crossings] == [-1, 1, -1]
+
+
+@pytest.mark.parametrize(
+    "ID, division",
+    [
+        (const.MOON, search.NAKSHATRA),
+        (const.MOON, search.PADA),
+        (const.MERCURY, search.SIGN),
+    ],
+)
+def test_ingresses_match_sampling(ID, division):
+    """Test that ingresses match a fine day-by-day sampling."""
+    jd0, jd1 = date.jd, date.jd + 60
+    events = search.ingresses(ID, jd0, jd1, division, mode=const.AY_LAHIRI)
+
+    jds = np.arange(jd0, jd1, 0.01)
+    lons = swe.positions([ID], jds, mode=const.AY_LAHIRI)[:, 0, 0]
+    index = np.floor(lons / division).astype(int)
+    changed = np.flatnonzero(np.diff(index))
+    assert len(events) == len(changed)
+
+    for event, i in zip(events, changed):
+        assert jds[i] <= event["jd"] <= jds[i + 1]
+        assert event["index"] == index[i + 1]
+        lon = swe.swe_object(ID, event["jd"], mode=const.AY_LAHIRI)["lon"]
+        assert abs(angle.closestdistance(lon, event["lon"])) < 1e-4
+
+
+def test_stations_search():
+    """Test that the station search agrees with nextStationJD."""
+    events = search.stations(const.MERCURY, date.jd, date.jd + 365)
+    assert len(events) == 6
+    assert events[0]["jd"] == pytest.approx(
+        tools.nextStationJD(const.MERCURY, date.jd), abs=1e-4
+    )
+    motions = [event["motion"] for event in events]
+    assert (
+        motions == [const.RETROGRADE, const.DIRECT] * 3
+        or motions == [const.DIRECT, const.RETROGRADE] * 3
+    )
+
+
+def test_aspects_search():
+    """Test exact Sun-Moon squares over a lunar month."""
+    events = search.aspects(const.SUN, const.MOON, 90, date.jd, date.jd + 29.5)
+    separations = [event["separation"] for event in events]
+    assert len(events) in (2, 3)
+    assert all(a != b for a, b in zip(separations, separations[1:]))
+    assert set(separations) == {90, 270}
+    for event in events:
+        sun = swe.sweObjectLon(const.SUN, event["jd"])
+        moon = swe.sweObjectLon(const.MOON, event["jd"])
+        assert angle.distance(sun, moon) == pytest.approx(event["separation"], abs=1e-3)
+
+
+def test_session_threads_agree():
+    """Test that threads with different ayanamsas get the sequential results."""
+    modes = [const.AY_LAHIRI, const.AY_KRISHNAMURTI, const.AY_RAMAN, None] * 8
+    jds = date.jd + np.arange(len(modes))
+    expected = [
+        swe.swe_objects(const.LIST_SEVEN_PLANETS, jd, mode=m)
+        for jd, m in zip(jds, modes)
+    ]
+
+    executor = session.get_executor("thread", max_workers=8)
+    assert session.get_executor("thread") is executor
+    results = list(
+        executor.map(
+            lambda args: swe.swe_objects(
+                const.LIST_SEVEN_PLANETS, args[0], mode=args[1]
+            ),
+            zip(jds, modes),
+        )
+    )
+    assert results == expected
+
+
+def test_session_skips_redundant_settings(monkeypatch):
+    """Test that an applied ayanamsa is not set again."""
+    calls = []
+    monkeypatch.setattr(
+        session.swisseph, "set_sid_mode", lambda *args: calls.append(args)
+    )
+    session.SESSION.reset()
+
+    for _ in range(3):
+        swe.swe_flags(mode=const.AY_LAHIRI)
+    swe.swe_flags(mode=const.AY_RAMAN)
+    assert len(calls) == 2
+    session.SESSION.reset()
+
+
+def test_chart_sets_mode_and_topo_once(monkeypatch):
+    """Test that objects and houses of a sidereal topocentric chart apply each setting once."""
+    calls = []
+    for name in ("set_sid_mode", "set_topo"):
+        setting = getattr(session.swisseph, name)
+
+        def counting(*args, name=name, setting=setting):
+            calls.append(name)
+            return setting(*args)
+
+        monkeypatch.setattr(session.swisseph, name, counting)
+    session.SESSION.reset()
+
+    for ID in const.LIST_SEVEN_PLANETS:
+        swe.swe_object(ID, date.jd, pos.lat, pos.lon, 100, const.AY_LAHIRI)
+    swe.swe_houses(date.jd, pos.lat, pos.lon, const.HOUSES_WHOLE_SIGN, const.AY_LAHIRI)
+    swe.positions(
+        const.LIST_SEVEN_PLANETS, date.jd + np.arange(100), mode=const.AY_LAHIRI
+    )
+    assert sorted(calls) == ["set_sid_mode", "set_topo"]
+    session.SESSION.reset()
+
+
+def test_session_process_executor():
+    """Test ephemeris computations in a worker process."""
+    executor = session.get_executor("process", max_workers=1)
+    try:
+        result = executor.submit(
+            swe.swe_object, const.MARS, date.jd, mode=const.AY_LAHIRI
+        )
+        assert result.result() == swe.swe_object(
+            const.MARS, date.jd, mode=const.AY_LAHIRI
+        )
+    finally:
+        session.shutdown_executors()
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ascendant import Ascendant, executor
+
+NATIVE = dict(
+    year=1990,
+    month=1,
+    day=1,
+    hour=12,
+    minute=0,
+    second=0,
+    latitude=28.6139,
+    longitude=77.2090,
+    utc="+5:30",
+)
+
+
+@pytest.fixture(autouse=True)
+def default_executor():
+    yield
+    executor.configure()
+
+
+class Tracker:
+    """Records the largest number of calls running at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, delay: float) -> float:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(delay)
+        with self.lock:
+            self.running -= 1
+        return delay
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_async_matches_sync(kind):
+    """Test that the async API returns the synchronous results."""
+    executor.configure(kind, max_workers=2)
+    astro = Ascendant(**NATIVE)
+
+    async def main():
+        created = await Ascendant.acreate(**NATIVE)
+        return created, await created.aget_yogas(), await astro.aget_dasha_timeline()
+
+    created, yogas, timeline = asyncio.run(main())
+    assert isinstance(created, Ascendant)
+    assert yogas == astro.get_yogas()
+    assert timeline == astro.get_dasha_timeline()
+
+
+def test_concurrency_cap():
+    """Test that no more than max_concurrency computations run at once."""
+    executor.configure("thread", max_workers=8, max_concurrency=2)
+    tracker = Tracker()
+
+    async def main():
+        return await asyncio.gather(*(executor.run(tracker, 0.02) for _ in range(6)))
+
+    assert asyncio.run(main()) == [0.02] * 6
+    assert tracker.peak == 2
+
+
+def test_cancellation_releases_slot():
+    """Test that a cancelled call never runs and frees its slot."""
+    executor.configure("thread", max_workers=1)
+    tracker = Tracker()
+
+    async def main():
+        first = asyncio.create_task(executor.run(tracker, 0.05))
+        waiting = asyncio.create_task(executor.run(tracker, 0.05))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        await first
+        return await asyncio.wait_for(executor.run(tracker, 0), timeout=1)
+
+    assert asyncio.run(main()) == 0
+    assert tracker.peak == 1
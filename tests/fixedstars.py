@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+import pytest
+import swisseph
+
+from flatlib import angle, const
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.ephem import fixedstars, session
+from flatlib.geopos import GeoPos
+from flatlib.object import FixedStar
+
+date = Datetime("2015/03/13", "17:00", "+00:00")
+pos = GeoPos("38n32", "8w54")
+
+# Julian days from the year 1000 to 2500
+JDS = [2086307.5, 2415020.0, 2451545.0, 2457095.2, 2634166.5]
+
+
+def _write_sefstars(path):
+    """Writes the catalog in the sefstars.txt format read by swisseph 2.10,
+    with proper motions in mas/yr and no parallax or radial velocity."""
+    lines = []
+    catalog_path = os.path.join(session.SESSION.path, fixedstars.CATALOG_FILE)
+    with open(catalog_path, encoding="latin-1") as catalog:
+        for line in catalog:
+            fields = [field.strip() for field in line.split(",")]
+            if line.startswith("#") or len(fields) < 14:
+                continue
+            fields[9] = "%.6f" % (float(fields[9] or 0) * 150)
+            fields[10] = "%.6f" % (float(fields[10] or 0) * 10)
+            fields[11] = fields[12] = "0"
+            lines.append(",".join(fields))
+    (path / "sefstars.txt").write_text("\n".join(lines) + "\n")
+
+
+def test_catalog_matches_swisseph(tmp_path):
+    """Test that the catalog positions are within a second of arc of swisseph."""
+    catalog = fixedstars.get_catalog()
+    IDs = [ID for ID in catalog.ids() if not ID.startswith(",")][:200]
+    _write_sefstars(tmp_path)
+
+    swisseph.set_ephe_path(str(tmp_path))
+    try:
+        for jd in JDS:
+            lon, lat = catalog.positions(jd, IDs)
+            for ID, lo, la in zip(IDs, lon, lat):
+                (slon, slat, *_), name, _ = swisseph.fixstar2_ut(ID, jd)
+                if name.split(",")[1] != catalog.nomenclature[catalog.find(ID)]:
+                    continue
+                dist = angle.closestdistance(slon, lo) * np.cos(np.radians(la))
+                assert abs(dist) * 3600 < 1.0, (ID, jd)
+                assert abs(la - slat) * 3600 < 1.0, (ID, jd)
+    finally:
+        swisseph.set_ephe_path(session.SESSION.path)
+        session.SESSION.reset()
+
+
+def test_catalog_loaded_once():
+    """Test that the catalog is read once and finds stars by name or nomenclature."""
+    catalog = fixedstars.get_catalog()
+    assert fixedstars.get_catalog() is catalog
+    assert catalog.find("aldebaran ") == catalog.find(",alTau") == 0
+    with pytest.raises(KeyError):
+        catalog.find("Nibiru")
+
+
+def test_chart_fixed_stars():
+    """Test that the listed stars of a chart match single stars."""
+    chart = Chart(date, pos)
+    stars = list(chart.getFixedStars())
+    # The Pleiades are listed as Alcyone
+    assert [star.id for star in stars] == list(dict.fromkeys(const.LIST_FIXED_STARS))
+
+    for star in stars:
+        single = chart.getFixedStar(star.id)
+        assert single.lon == pytest.approx(star.lon, abs=1e-9)
+        assert single.mag == star.mag
+        assert star.sign == const.LIST_SIGNS[int(star.lon / 30)]
+    aldebaran = chart.getFixedStar(const.STAR_ALDEBARAN)
+    assert aldebaran.mag == 0.85
+    assert aldebaran.lon == pytest.approx(70.0, abs=0.01)
+
+
+@pytest.mark.parametrize("orb", [None, 2.0])
+def test_conjunctions_match_pairs(orb):
+    """Test that the conjunctions query matches the stars aspecting each object."""
+    chart = Chart(date, pos)
+    objects = list(chart.objects) + list(chart.angles)
+    stars = list(chart.getFixedStars())
+    expected = {
+        (star.id, obj.id)
+        for star in stars
+        for obj in objects
+        if (
+            star.aspects(obj)
+            if orb is None
+            else abs(angle.closestdistance(star.lon, obj.lon)) < orb
+        )
+    }
+
+    res = chart.getFixedStarConjunctions(const.LIST_FIXED_STARS, orb)
+    assert {(star.id, obj.id) for star, obj, _ in res} == expected
+    dists = [abs(dist) for _, _, dist in res]
+    assert dists == sorted(dists)
+    for star, obj, dist in res:
+        assert dist == pytest.approx(angle.closestdistance(star.lon, obj.lon))
+
+
+def test_orbs_by_magnitude():
+    """Test that the catalog orbs match FixedStar.orb."""
+    catalog = fixedstars.get_catalog()
+    for mag, orb in zip(catalog.mag, catalog.orbs()):
+        star = FixedStar.fromDict({"id": "", "mag": mag})
+        assert star.orb() == orb
@@ -0,0 +1,42 @@
+import numpy as np
+from flatlib import const
+from flatlib.ephem import eph
+
+from ascendant.const import NAKSHATRA_SPAN, NAKSHATRAS, PLANETS_LIST
+from ascendant.ingress import GRAHA_IDS, INGRESS_DTYPE, nakshatra_ingresses
+
+table = nakshatra_ingresses("2025-01-01", "2025-01-15")
+
+
+def test_ingress_table_sorted():
+    """Test that the table is sorted and holds every graha's changes."""
+    assert len(table) > 0
+    assert np.all(np.diff(table.jd) >= 0)
+    assert set(table.planet.tolist()) <= set(range(len(PLANETS_LIST)))
+    # The Moon changes pada about every 6 hours
+    moon = np.count_nonzero(table.planet == PLANETS_LIST.index("Moon"))
+    assert 50 <= moon <= 60
+
+
+def test_ingresses_match_positions():
+    """Test the nakshatra and pada entered against the position just after each ingress."""
+    for ingress in table.to_list():
+        jd = ingress["jd"] + 1 / 1440
+        obj = eph.get_object(GRAHA_IDS[ingress["planet"]], jd, mode=const.AY_LAHIRI)
+        lon = obj["lon"]
+        index = int(lon // (NAKSHATRA_SPAN / 4))
+        assert NAKSHATRAS[index // 4] == ingress["nakshatra"]
+        assert index % 4 + 1 == ingress["pada"]
+
+
+def test_ingress_exports():
+    """Test the structured array and column exports."""
+    records = table.to_numpy()
+    assert records.dtype == INGRESS_DTYPE
+    assert np.array_equal(records["pada"], table.pada)
+
+    columns = table.to_columns()
+    assert list(columns) == ["jd", "planet", "nakshatra", "pada"]
+    assert columns["planet"][0] == table.to_list()[0]["planet"]
+    assert columns["nakshatra"].dtype.kind == "U"
+    assert table.to_columns(names=False)["nakshatra"].dtype == np.uint8
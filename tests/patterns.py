@@ -0,0 +1,107 @@
+import itertools
+
+import pytest
+
+from flatlib import aspects, const
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.geopos import GeoPos
+from flatlib.object import Object
+from flatlib.tools import patterns
+from flatlib.tools.chartdynamics import ChartDynamics
+
+
+def _objects(lons):
+    """Builds objects at the given longitudes."""
+    return [
+        Object.fromDict({"id": ID, "lon": lon, "lonspeed": 1.0})
+        for ID, lon in lons.items()
+    ]
+
+
+def _find(lons):
+    matrix = aspects.aspect_matrix(_objects(lons), patterns.PATTERN_ASPECTS)
+    return [(p.type, set(p.members)) for p in patterns.find_patterns(matrix)]
+
+
+@pytest.mark.parametrize(
+    "lons, expected",
+    [
+        (
+            {const.SUN: 0, const.MOON: 121, const.MARS: 242},
+            [(patterns.GRAND_TRINE, {const.SUN, const.MOON, const.MARS})],
+        ),
+        (
+            {const.SUN: 0, const.MOON: 182, const.MARS: 91},
+            [(patterns.T_SQUARE, {const.SUN, const.MOON, const.MARS})],
+        ),
+        (
+            {const.SUN: 0, const.MOON: 61, const.MARS: 210},
+            [(patterns.YOD, {const.SUN, const.MOON, const.MARS})],
+        ),
+        (
+            {const.SUN: 10, const.MERCURY: 15, const.VENUS: 22, const.SATURN: 100},
+            [(patterns.STELLIUM, {const.SUN, const.MERCURY, const.VENUS})],
+        ),
+    ],
+)
+def test_single_patterns(lons, expected):
+    """Test each pattern on objects placed by hand."""
+    assert _find(lons) == expected
+
+
+def test_kite_and_grand_cross():
+    """Test the patterns which contain other patterns."""
+    kite = {const.SUN: 0, const.MOON: 120, const.MARS: 240, const.JUPITER: 180}
+    found = _find(kite)
+    assert (patterns.KITE, set(kite)) in found
+    assert (patterns.GRAND_TRINE, {const.SUN, const.MOON, const.MARS}) in found
+
+    cross = {const.SUN: 0, const.MOON: 90, const.MARS: 180, const.JUPITER: 270}
+    found = _find(cross)
+    assert found.count((patterns.GRAND_CROSS, set(cross))) == 1
+    assert sum(kind == patterns.T_SQUARE for kind, _ in found) == 4
+
+
+def test_tightness():
+    """Test that patterns carry their aspects and mean orb."""
+    matrix = aspects.aspect_matrix(
+        _objects({const.SUN: 0, const.MOON: 121, const.MARS: 242}),
+        patterns.PATTERN_ASPECTS,
+    )
+    (trine,) = patterns.find_patterns(matrix)
+    assert sorted(orb for *_, orb in trine.aspects) == pytest.approx([1, 1, 2])
+    assert trine.tightness == pytest.approx(4 / 3)
+
+
+@pytest.mark.parametrize("date", ["2015/03/13", "1990/01/01", "1962/02/04"])
+def test_matches_pairwise_search(date):
+    """Test grand trines and T-squares against a search over all triples."""
+    chart = Chart(
+        Datetime(date, "12:00", "+00:00"),
+        GeoPos("38n32", "8w54"),
+        IDs=const.LIST_OBJECTS,
+    )
+    found = ChartDynamics(chart).patterns()
+    objs = list(chart.objects)
+
+    def aspect(a, b):
+        return aspects.aspectType(a, b, patterns.PATTERN_ASPECTS)
+
+    trines, tsquares = set(), set()
+    for a, b, c in itertools.combinations(objs, 3):
+        if aspect(a, b) == aspect(a, c) == aspect(b, c) == 120:
+            trines.add(frozenset([a.id, b.id, c.id]))
+        for x, y, z in [(a, b, c), (a, c, b), (b, c, a)]:
+            if aspect(x, y) == 180 and aspect(x, z) == aspect(y, z) == 90:
+                tsquares.add(frozenset([a.id, b.id, c.id]))
+
+    assert {
+        frozenset(p.members) for p in found if p.type == patterns.GRAND_TRINE
+    } == trines
+    assert {
+        frozenset(p.members) for p in found if p.type == patterns.T_SQUARE
+    } == tsquares
+    assert [p.tightness for p in found if p.type == patterns.T_SQUARE] == sorted(
+        p.tightness for p in found if p.type == patterns.T_SQUARE
+    )
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from flatlib import angle, const, utils, vectorized
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.geopos import GeoPos
+from flatlib.predictives import primarydirections
+
+date = Datetime("2015/03/13", "17:00", "+00:00")
+pos = GeoPos("38n32", "8w54")
+
+rng = np.random.default_rng(0)
+ANGLES = np.concatenate([rng.uniform(-720, 720, 500), [0, 180, -180, 360, 540]])
+DECLS = rng.uniform(-23.44, 23.44, 200)
+LATS = rng.uniform(-60, 60, 200)
+
+
+@pytest.mark.parametrize("name", ["norm", "znorm"])
+def test_norm_matches_angle(name):
+    """Test that the array normalizations match the scalar ones."""
+    res = getattr(vectorized, name)(ANGLES)
+    expected = [getattr(angle, name)(a) for a in ANGLES.tolist()]
+    assert res.tolist() == expected
+
+
+@pytest.mark.parametrize("name", ["distance", "closestdistance"])
+def test_distances_match_angle(name):
+    """Test that the array distances match the scalar ones when broadcast."""
+    a, b = ANGLES[:, None], ANGLES[None, ::7]
+    res = getattr(vectorized, name)(a, b)
+    expected = [
+        [getattr(angle, name)(x, y) for y in b[0].tolist()] for x in a[:, 0].tolist()
+    ]
+    assert np.allclose(res, expected, rtol=0, atol=1e-9)
+    assert vectorized.closestdistance(0, 180) == angle.closestdistance(0, 180) == 180
+
+
+def test_arcs_match_utils():
+    """Test that ascensional differences, arcs and horizons match utils."""
+    ras = rng.uniform(0, 360, len(DECLS))
+    mcRA = 123.4
+    assert np.allclose(
+        vectorized.ascdiff(DECLS, LATS),
+        [utils.ascdiff(d, la) for d, la in zip(DECLS, LATS)],
+    )
+    dArc, nArc = vectorized.dnarcs(DECLS, LATS)
+    expected = [utils.dnarcs(d, la) for d, la in zip(DECLS, LATS)]
+    assert np.allclose(np.column_stack([dArc, nArc]), expected)
+    above = vectorized.isAboveHorizon(ras, DECLS, mcRA, LATS)
+    assert above.tolist() == [
+        utils.isAboveHorizon(r, d, mcRA, la) for r, d, la in zip(ras, DECLS, LATS)
+    ]
+
+
+def test_ascdiff_circumpolar():
+    """Test that circumpolar points give NaN instead of raising."""
+    with pytest.raises(ValueError):
+        utils.ascdiff(30, 70)
+    res = vectorized.ascdiff([30, 10], 70)
+    assert np.isnan(res[0]) and not np.isnan(res[1])
+
+
+def test_eq_coords_match_utils():
+    """Test that equatorial coordinates match utils.eqCoords."""
+    lons = np.concatenate([rng.uniform(0, 360, 300), [0, 2, 178, 180, 182, 358]])
+    lats = np.concatenate([rng.uniform(-8, 8, 300), [0, 1, -1, 0, 5, -5]])
+    ra, decl = vectorized.eqCoords(lons, lats)
+    expected = np.array([utils.eqCoords(lo, la) for lo, la in zip(lons, lats)])
+    assert np.allclose(vectorized.closestdistance(ra, expected[:, 0]), 0, atol=1e-9)
+    assert np.allclose(decl, expected[:, 1], atol=1e-9)
+
+
+def test_primary_direction_arcs():
+    """Test that the array arcs match the scalar arc."""
+    pd = primarydirections.PrimaryDirections(Chart(date, pos))
+    pRA, sRA = rng.uniform(0, 360, (2, 50))
+    pDecl, sDecl = rng.uniform(-23, 23, (2, 50))
+    res = primarydirections.arcs(
+        pRA[:, None], pDecl[:, None], sRA, sDecl, pd.mcRA, pd.lat
+    )
+    expected = [
+        [
+            primarydirections.arc(p, pD, s, sD, pd.mcRA, pd.lat)
+            for s, sD in zip(sRA, sDecl)
+        ]
+        for p, pD in zip(pRA, pDecl)
+    ]
+    assert np.allclose(res, expected, atol=1e-9)
+
+
+def test_primary_directions_table():
+    """Test that the table matches the arcs of each pair."""
+    pd = primarydirections.PrimaryDirections(Chart(date, pos))
+    significators = pd._elements(pd.SIG_OBJECTS + pd.SIG_ANGLES, pd.N, [0])
+    promissors = (
+        pd._elements(pd.SIG_OBJECTS, pd.N, const.MAJOR_ASPECTS)
+        + pd._terms()
+        + pd._elements(pd.SIG_OBJECTS, pd.A, [0])
+        + pd._elements(pd.SIG_OBJECTS, pd.C, [0])
+    )
+    expected = []
+    for prom in promissors:
+        for sig in significators:
+            if prom["id"] == sig["id"]:
+                continue
+            arcs = pd._arc(prom, sig)
+            for key, kind in [("arcm", "M"), ("arcz", "Z")]:
+                if 0 < arcs[key] < pd.MAX_ARC:
+                    expected.append([arcs[key], prom["id"], sig["id"], kind])
+
+    table = pd.getList(const.MAJOR_ASPECTS)
+    assert [row[1:] for row in table] == [row[1:] for row in sorted(expected)]
+    assert np.allclose([row[0] for row in table], [row[0] for row in sorted(expected)])